@@ -1,8 +1,63 @@
 # stock_trading_bot/src/backtester.py
 
+import json
+import os
+
+import numpy as np
 import pandas as pd
 
-from .config import INITIAL_CASH, LEVERAGE_RATIO
+from .config import BACKTEST_BACKEND, INITIAL_CASH, LEVERAGE_RATIO
+from .ledger import SIDE_BUY, SIDE_SELL, TradeLedger
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def read_state(path: str):
+    """
+    Backtester.save_state で保存した状態ファイルを読み込みます。
+
+    Args:
+        path (str): 状態を保存したJSONファイルのパス。
+
+    Returns:
+        dict | None: 保存された状態。ファイルがない場合はNone。
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def count_trade_log_rows(path: str) -> int:
+    """
+    取引ログ (CSV) のデータ行数を数えます (ヘッダ行は含みません)。
+
+    Args:
+        path (str): 取引ログのパス。
+
+    Returns:
+        int: データ行数。ファイルがない場合は0。
+    """
+    if not os.path.exists(path):
+        return 0
+    with open(path, "rb") as f:
+        return max(sum(1 for _ in f) - 1, 0)
+
+
+def truncate_trade_log(path: str, num_rows: int):
+    """
+    取引ログ (CSV) を、ヘッダ行と先頭の num_rows 行だけに切り詰めます。
+
+    Args:
+        path (str): 取引ログのパス。
+        num_rows (int): 残すデータ行数。
+    """
+    with open(path, "rb+") as f:
+        for _ in range(num_rows + 1):
+            if not f.readline():
+                return
+        f.truncate(f.tell())
 
 
 class Backtester:
@@ -12,6 +67,7 @@ class Backtester:
         strategy_name: str,  # 新しく追加
         initial_cash: float = INITIAL_CASH,
         leverage_ratio: float = LEVERAGE_RATIO,
+        backend: str = BACKTEST_BACKEND,
     ):
         self.processed_dfs = (
             processed_dfs  # 各銘柄の処理済みデータフレーム (シグナル付き)
@@ -21,11 +77,25 @@ class Backtester:
         self.current_cash = initial_cash
         self.leverage_ratio = leverage_ratio
 
+        # シミュレーションの実装 ("python": 辞書ベース, "numpy": 配列ベース)
+        if backend not in ("python", "numpy"):
+            logger.warning(
+                "警告: 未知のバックエンド '%s' が指定されました。'python' を使用します。",
+                backend,
+            )
+            backend = "python"
+        self.backend = backend
+
         # 銘柄ごとの保有株数と買値
         self.shares_held = {ticker: 0 for ticker in processed_dfs.keys()}
         self.bought_price = {ticker: 0 for ticker in processed_dfs.keys()}
 
-        self.trade_history = []  # 取引履歴を記録
+        # 取引履歴を記録 (列ごとの型付き配列。参照・反復では取引ごとの辞書を返す)
+        self.trade_history = TradeLedger(list(processed_dfs.keys()))
+        # 処理済みの最終日 (load_state で復元した場合、それ以前の日付は処理しない)
+        self.last_processed_date = None
+        # 状態を保存した時点の取引ログの行数 (run_daily_update で使用)
+        self.trade_log_rows = None
 
         # 全銘柄のデータを統合した日付リスト (最も短い期間に合わせる)
         # 処理済みデータフレームが存在しない銘柄は除外
@@ -34,14 +104,16 @@ class Backtester:
         ]
 
         if not valid_dfs:
-            print("エラー: バックテストのための有効なデータフレームが見つかりません。")
+            logger.error(
+                "エラー: バックテストのための有効なデータフレームが見つかりません。"
+            )
             self.dates = []
             return
 
         # 各データフレームの 'Date' 列がインデックスであることを確認し、DatetimeIndexに変換
         for df in valid_dfs:
             if "Date" not in df.columns:
-                print(
+                logger.warning(
                     "警告: バックテスター初期化: データフレームに 'Date' 列が見つかりません。"
                 )
                 self.dates = []
@@ -57,28 +129,53 @@ class Backtester:
             df.sort_index(inplace=True)  # インデックスでソートされていることを確認
 
         # 全ての有効なDFに存在する日付の共通集合を取得
-        if valid_dfs:
-            # インデックスの日付を正規化してセットにし、共通部分を抽出
-            common_dates_set = set(
-                valid_dfs[0].index.normalize().tolist()
-            )  # .index を使用
-            for df in valid_dfs[1:]:
-                common_dates_set = common_dates_set.intersection(
-                    set(df.index.normalize().tolist())
-                )  # .index を使用
-            self.dates = sorted(list(common_dates_set))
-        else:
-            self.dates = []
+        # インデックスの日付を正規化し、インデックス同士の積集合で共通部分を抽出
+        common_index = valid_dfs[0].index.normalize()
+        for df in valid_dfs[1:]:
+            common_index = common_index.intersection(df.index.normalize())
+        common_index = common_index.unique().sort_values()
+        self.dates = list(common_index)
 
         if not self.dates:
-            print("エラー: バックテスト可能な共通の日付範囲が見つかりません。")
+            logger.error("エラー: バックテスト可能な共通の日付範囲が見つかりません。")
             return
 
+        # 日付 × 銘柄 に整列した終値・シグナルの配列を一度だけ構築する
+        self._build_aligned_panel(common_index)
+
         # ポートフォリオ履歴DataFrameを初期化
         self.portfolio_history_df = pd.DataFrame(
             columns=["Date", "Portfolio_Value", "Strategy"]
         )  # 'Strategy' 列を追加
 
+    def _build_aligned_panel(self, common_index: pd.DatetimeIndex):
+        """共通の日付に整列した終値とシグナルの配列 (日付 × 銘柄) を構築します。
+
+        同じ日付の行が複数ある場合は、日付順で最初の行を採用します。
+
+        Args:
+            common_index (pd.DatetimeIndex): 全銘柄に共通する正規化済みの日付。
+        """
+        self.panel_tickers = []
+        close_columns = []
+        signal_columns = []
+        for ticker, df in self.processed_dfs.items():
+            if df is None or df.empty:
+                continue
+
+            normalized_index = df.index.normalize()
+            first_rows = ~normalized_index.duplicated(keep="first")
+            daily_df = df.loc[first_rows, ["Close", "Trade_Signal"]]
+            daily_df.index = normalized_index[first_rows]
+            daily_df = daily_df.reindex(common_index)
+
+            self.panel_tickers.append(ticker)
+            close_columns.append(daily_df["Close"].to_numpy())
+            signal_columns.append(daily_df["Trade_Signal"].to_numpy())
+
+        self.close_panel = np.column_stack(close_columns)
+        self.signal_panel = np.column_stack(signal_columns)
+
     def _get_current_portfolio_value(self, current_prices: dict) -> float:
         """現在のポートフォリオの総価値を計算します。
 
@@ -101,41 +198,56 @@ class Backtester:
             tuple[pd.DataFrame, pd.DataFrame]: ポートフォリオ履歴DataFrameと取引履歴DataFrame。
         """
         if not self.dates:
-            print("エラー: シミュレーション実行のためのデータがありません。")
+            logger.error("エラー: シミュレーション実行のためのデータがありません。")
             return None, None  # Noneを返すことで、main.pyでエラーを検知させる
 
-        print(
-            f"バックテスト期間: {self.dates[0].strftime('%Y-%m-%d')} から {self.dates[-1].strftime('%Y-%m-%d')}"
+        logger.info(
+            "バックテスト期間: %s から %s",
+            self.dates[0].strftime("%Y-%m-%d"),
+            self.dates[-1].strftime("%Y-%m-%d"),
         )
 
-        portfolio_records = []  # ポートフォリオ履歴を一時的に保持するリスト
+        if self.backend == "numpy":
+            self.portfolio_history_df = self._simulate_with_arrays()
+        else:
+            self.portfolio_history_df = self._simulate_with_python()
 
-        for i, current_date in enumerate(self.dates):
-            current_prices = {}
-            current_signals = {}
-            has_data_for_today = True
+        # 最終日のポートフォリオ価値を更新
+        if not self.portfolio_history_df.empty:
+            final_portfolio_value = self.portfolio_history_df["Portfolio_Value"].iloc[
+                -1
+            ]
+        else:
+            final_portfolio_value = self.initial_cash
 
-            for ticker, df in self.processed_dfs.items():
-                # その日のデータをインデックス（日付）で取得
-                # current_date.normalize() は日付部分のみを比較するために使用
-                # .loc[] を使ってインデックスベースでアクセス
-                daily_data = df.loc[
-                    df.index.normalize() == current_date.normalize()
-                ]  # .index を使用
+        # 取引履歴をDataFrameに変換 (取引がない場合もVisualizerが期待する列を持つ)
+        df_trade_history = self.trade_history.to_frame()
+        if df_trade_history.empty:
+            logger.warning(
+                "警告: 取引履歴が空です。'Trade_Type'カラムを含む取引が生成されませんでした。"
+            )
 
-                if daily_data.empty:
-                    has_data_for_today = False
-                    break
+        # df_portfolio_historyは、ウォークフォワード用に各期間の履歴を保持
+        # 最終的にmain.pyで連結されることを想定
 
-                current_prices[ticker] = daily_data["Close"].iloc[0]
-                current_signals[ticker] = daily_data["Trade_Signal"].iloc[0]
+        return self.portfolio_history_df, df_trade_history
+
+    def _simulate_with_python(self) -> pd.DataFrame:
+        """銘柄ごとの辞書で状態を管理しながら、日付順にシミュレーションします。
 
-            if not has_data_for_today:
-                # print(f"警告: {current_date.strftime('%Y-%m-%d')} のデータが一部銘柄で欠損しています。この日をスキップします。")
-                continue  # この日のデータが一部の銘柄で欠損している場合はスキップ
+        Returns:
+            pd.DataFrame: ポートフォリオ履歴DataFrame。
+        """
+        # 各日のポートフォリオ価値 (日数分を事前に確保)
+        portfolio_values = np.empty(len(self.dates))
+
+        for i, current_date in enumerate(self.dates):
+            # 整列済みの配列から、その日の価格とシグナルを位置で取得
+            current_prices = dict(zip(self.panel_tickers, self.close_panel[i]))
+            current_signals = dict(zip(self.panel_tickers, self.signal_panel[i]))
 
             # 各銘柄に対してトレード戦略を適用
-            for ticker in self.processed_dfs.keys():
+            for ticker in self.panel_tickers:
                 signal = current_signals.get(ticker, 0)
                 current_price = current_prices.get(ticker, 0)
 
@@ -173,17 +285,13 @@ class Backtester:
                                 self.shares_held[ticker] += shares_to_buy
                                 self.bought_price[ticker] = current_price  # 買値を記録
                                 self.trade_history.append(
-                                    {
-                                        "Date": current_date,
-                                        "Ticker": ticker,
-                                        "Trade_Type": "BUY",
-                                        "Price": current_price,
-                                        "Shares": shares_to_buy,
-                                        "Cash_Left": self.current_cash,
-                                        "Portfolio_Value": self._get_current_portfolio_value(
-                                            current_prices
-                                        ),
-                                    }
+                                    current_date,
+                                    ticker,
+                                    SIDE_BUY,
+                                    current_price,
+                                    shares_to_buy,
+                                    self.current_cash,
+                                    self._get_current_portfolio_value(current_prices),
                                 )
 
                 elif signal == -1:  # 売りシグナル
@@ -203,66 +311,311 @@ class Backtester:
                         self.shares_held[ticker] = 0
                         self.bought_price[ticker] = 0  # 買値をリセット
                         self.trade_history.append(
-                            {
-                                "Date": current_date,
-                                "Ticker": ticker,
-                                "Trade_Type": "SELL",
-                                "Price": current_price,
-                                "Shares": self.shares_held[ticker],  # 売却後の保有数
-                                "Cash_Left": self.current_cash,
-                                "Portfolio_Value": self._get_current_portfolio_value(
-                                    current_prices
-                                ),
-                            }
+                            current_date,
+                            ticker,
+                            SIDE_SELL,
+                            current_price,
+                            self.shares_held[ticker],  # 売却後の保有数
+                            self.current_cash,
+                            self._get_current_portfolio_value(current_prices),
                         )
 
             # 各日のポートフォリオ価値を記録
-            current_portfolio_value = self._get_current_portfolio_value(current_prices)
-            # 一時的なリストにレコードを追加
-            portfolio_records.append(
-                {
-                    "Date": current_date,
-                    "Portfolio_Value": current_portfolio_value,
-                    "Strategy": self.strategy_name,  # 戦略名を追加
-                }
-            )
+            portfolio_values[i] = self._get_current_portfolio_value(current_prices)
+
         # ループ終了後、一度にDataFrameに変換
-        self.portfolio_history_df = pd.DataFrame(portfolio_records)
+        return self._portfolio_frame(portfolio_values)
 
-        # 最終日のポートフォリオ価値を更新
-        if not self.portfolio_history_df.empty:
-            final_portfolio_value = self.portfolio_history_df["Portfolio_Value"].iloc[
-                -1
-            ]
-        else:
-            final_portfolio_value = self.initial_cash
+    def _simulate_with_arrays(self) -> pd.DataFrame:
+        """現金・保有株数・買値をNumPy配列で管理しながらシミュレーションします。
 
-        # 取引履歴とポートフォリオ履歴をDataFrameに変換
-        df_trade_history = pd.DataFrame(self.trade_history)
+        `_simulate_with_python` と同じ売買ルール・同じ演算順序で処理するため、
+        ポートフォリオ履歴と取引履歴は同一になります。シグナルのない日が
+        続く区間は状態が変わらないため、その区間のポートフォリオ価値を
+        事前確保したベクトルへまとめて書き込みます。
 
-        # ★ここから追加★ df_trade_historyが空の場合の処理
-        if df_trade_history.empty:
-            print(
-                "警告: 取引履歴が空です。'Trade_Type'カラムを含む取引が生成されませんでした。"
+        Returns:
+            pd.DataFrame: ポートフォリオ履歴DataFrame。
+        """
+        close = self.close_panel
+        signals = self.signal_panel
+        num_tickers = len(self.processed_dfs)
+
+        cash = self.current_cash
+        shares = np.array(
+            [self.shares_held[ticker] for ticker in self.panel_tickers], dtype=np.int64
+        )
+        bought_price = np.array(
+            [self.bought_price[ticker] for ticker in self.panel_tickers], dtype=float
+        )
+        portfolio_values = np.empty(len(self.dates))
+
+        def fill_portfolio_values(start: int, stop: int):
+            # 銘柄順の逐次和 (cumsum) で、辞書版の sum() と同じ丸め結果にする
+            holding_values = np.cumsum(shares * close[start:stop], axis=1)[:, -1]
+            portfolio_values[start:stop] = cash + holding_values
+
+        def current_portfolio_value(i: int) -> float:
+            return cash + np.cumsum(shares * close[i])[-1]
+
+        segment_start = 0
+        for i in np.flatnonzero((signals != 0).any(axis=1)):
+            fill_portfolio_values(segment_start, i)
+            segment_start = i
+            current_date = self.dates[i]
+
+            for j in np.flatnonzero(signals[i] != 0):
+                ticker = self.panel_tickers[j]
+                signal = signals[i, j]
+                current_price = close[i, j]
+
+                if current_price == 0:  # 価格データがない場合はスキップ
+                    continue
+
+                if signal == 1:  # 買いシグナル
+                    if num_tickers == 0:
+                        continue
+
+                    available_buying_power = (cash * self.leverage_ratio) / num_tickers
+                    if available_buying_power <= 0:
+                        continue
+
+                    shares_to_buy = int(available_buying_power // current_price)
+                    if shares_to_buy <= 0:
+                        continue
+
+                    cost = shares_to_buy * current_price
+                    if cash >= cost:  # 現金が不足していれば買わない
+                        cash -= cost
+                        shares[j] += shares_to_buy
+                        bought_price[j] = current_price
+                        self.trade_history.append(
+                            current_date,
+                            ticker,
+                            SIDE_BUY,
+                            current_price,
+                            shares_to_buy,
+                            cash,
+                            current_portfolio_value(i),
+                        )
+
+                elif signal == -1:  # 売りシグナル
+                    if shares[j] > 0:
+                        # 全て売却
+                        cash += int(shares[j]) * current_price
+                        shares[j] = 0
+                        bought_price[j] = 0
+                        self.trade_history.append(
+                            current_date,
+                            ticker,
+                            SIDE_SELL,
+                            current_price,
+                            0,  # 売却後の保有数
+                            cash,
+                            current_portfolio_value(i),
+                        )
+
+        fill_portfolio_values(segment_start, len(self.dates))
+
+        # 配列で管理していた状態をインスタンスへ書き戻す
+        self.current_cash = cash
+        for j, ticker in enumerate(self.panel_tickers):
+            self.shares_held[ticker] = int(shares[j])
+            self.bought_price[ticker] = max(0, bought_price[j])
+
+        return self._portfolio_frame(portfolio_values)
+
+    def _portfolio_frame(self, portfolio_values: np.ndarray) -> pd.DataFrame:
+        """日ごとのポートフォリオ価値の配列からポートフォリオ履歴DataFrameを作成します。
+
+        Args:
+            portfolio_values (np.ndarray): self.dates と同じ長さのポートフォリオ価値。
+
+        Returns:
+            pd.DataFrame: 'Date', 'Portfolio_Value', 'Strategy' 列を持つ履歴。
+        """
+        return pd.DataFrame(
+            {
+                "Date": pd.DatetimeIndex(self.dates),
+                "Portfolio_Value": portfolio_values,
+                "Strategy": self.strategy_name,
+            },
+            copy=False,
+        )
+
+    def save_state(self, path: str, extra_state: dict | None = None):
+        """現金・保有株数・買値・処理済みの最終日をJSONファイルに保存します。
+
+        書き込み途中で中断しても既存のファイルが壊れないよう、一時ファイルに
+        書き出してから置き換えます。
+
+        Args:
+            path (str): 保存先のJSONファイルのパス。
+            extra_state (dict, optional): 同じファイルに一緒に保存する追加の状態
+                (例: ペーパートレードの指標の状態)。キーは保存する状態の項目と
+                重複しないものを使います。
+        """
+        if self.dates:
+            self.last_processed_date = self.dates[-1]
+        state = {
+            "strategy_name": self.strategy_name,
+            "initial_cash": float(self.initial_cash),
+            "leverage_ratio": float(self.leverage_ratio),
+            "current_cash": float(self.current_cash),
+            "shares_held": {
+                ticker: int(shares) for ticker, shares in self.shares_held.items()
+            },
+            "bought_price": {
+                ticker: float(price) for ticker, price in self.bought_price.items()
+            },
+            "last_processed_date": (
+                self.last_processed_date.strftime("%Y-%m-%d")
+                if self.last_processed_date is not None
+                else None
+            ),
+            "trade_log_rows": self.trade_log_rows,
+        }
+        if extra_state:
+            state.update(extra_state)
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, path)
+
+    def load_state(self, path: str) -> bool:
+        """save_state で保存した状態を読み込み、処理済みの日付を対象から外します。
+
+        読み込み後の run_simulation は、処理済みの最終日より後の日付だけを
+        シミュレーションします。
+
+        Args:
+            path (str): 状態を保存したJSONファイルのパス。
+
+        Returns:
+            bool: 状態を読み込んだ場合はTrue、ファイルがない場合はFalse。
+        """
+        state = read_state(path)
+        if state is None:
+            return False
+
+        if state.get("strategy_name") != self.strategy_name:
+            logger.warning(
+                "警告: 保存された状態の戦略 (%s) が現在の戦略 (%s) と異なります。",
+                state.get("strategy_name"),
+                self.strategy_name,
+            )
+
+        self.initial_cash = state["initial_cash"]
+        self.current_cash = state["current_cash"]
+        # 保存後に追加された銘柄は未保有のまま、削除された銘柄は保有を引き継ぐ
+        self.shares_held.update(state["shares_held"])
+        self.bought_price.update(
+            {ticker: max(0, price) for ticker, price in state["bought_price"].items()}
+        )
+        self.trade_log_rows = state.get("trade_log_rows")
+        if state["last_processed_date"] is not None:
+            self.last_processed_date = pd.Timestamp(state["last_processed_date"])
+            self._skip_processed_dates()
+        return True
+
+    def _skip_processed_dates(self):
+        """処理済みの最終日以前の日付を、日付リストと整列済みの配列から除外します。"""
+        if not self.dates:
+            return
+        new_rows = np.flatnonzero(
+            pd.DatetimeIndex(self.dates) > self.last_processed_date
+        )
+        self.dates = [self.dates[i] for i in new_rows]
+        self.close_panel = self.close_panel[new_rows]
+        self.signal_panel = self.signal_panel[new_rows]
+
+    def _reconcile_trade_log(self, trade_log_file: str):
+        """取引ログを、状態を保存した時点の行数に合わせます。
+
+        取引ログへの追記の後、状態の保存の前に中断した場合、取引ログには
+        状態に反映されていない取引が残ります。再開時にそれらの行を削除し、
+        同じ日付を処理し直したときに取引が重複しないようにします。
+
+        Args:
+            trade_log_file (str): 取引ログ (CSV) のパス。
+        """
+        current_rows = count_trade_log_rows(trade_log_file)
+        if self.trade_log_rows is None:
+            # 行数を記録していない状態ファイルの場合は、現在の行数から続ける
+            self.trade_log_rows = current_rows
+            return
+
+        if current_rows > self.trade_log_rows:
+            logger.warning(
+                "警告: 取引ログに状態へ反映されていない %s 件の取引があるため削除します: %s",
+                current_rows - self.trade_log_rows,
+                trade_log_file,
             )
-            # Visualizerが期待するカラムを持つ空のDataFrameを作成
-            df_trade_history = pd.DataFrame(
-                columns=[
-                    "Date",
-                    "Ticker",
-                    "Trade_Type",
-                    "Price",
-                    "Shares",
-                    "Cash_Left",
-                    "Portfolio_Value",
-                ]
+            truncate_trade_log(trade_log_file, self.trade_log_rows)
+        elif current_rows < self.trade_log_rows:
+            logger.warning(
+                "警告: 取引ログの行数 (%s) が状態に記録された行数 (%s) より少なくなっています: %s",
+                current_rows,
+                self.trade_log_rows,
+                trade_log_file,
             )
-        # ★ここまで追加★
+            self.trade_log_rows = current_rows
 
-        # df_portfolio_historyは、ウォークフォワード用に各期間の履歴を保持
-        # 最終的にmain.pyで連結されることを想定
+    def run_daily_update(
+        self, state_file: str, trade_log_file: str, extra_state: dict | None = None
+    ):
+        """保存された状態から再開し、前回より後の日付だけをシミュレーションします。
 
-        return self.portfolio_history_df, df_trade_history
+        新しい取引は取引ログ (CSV) に追記し、更新後の状態を保存します。
+        状態には取引ログの行数も記録し、追記の後に状態を保存できずに
+        中断した場合は、次回の再開時に未反映の取引を取引ログから削除します。
+        状態ファイルがない場合は、初期資金から全期間をシミュレーションします。
+
+        Args:
+            state_file (str): 状態を保存するJSONファイルのパス。
+            trade_log_file (str): 取引を追記するCSVファイルのパス。
+            extra_state (dict, optional): 状態と一緒に保存する追加の状態。
+
+        Returns:
+            tuple[pd.DataFrame, pd.DataFrame]: 新しい日付のポートフォリオ履歴と取引履歴。
+                新しい日付がない場合は (None, None)。
+        """
+        if self.load_state(state_file):
+            logger.info(
+                "状態を読み込みました: %s (処理済みの最終日: %s)",
+                state_file,
+                self.last_processed_date.strftime("%Y-%m-%d")
+                if self.last_processed_date is not None
+                else "なし",
+            )
+        else:
+            self.trade_log_rows = 0
+
+        if not self.dates:
+            logger.info("新しく処理する日付はありません。")
+            return None, None
+
+        self._reconcile_trade_log(trade_log_file)
+        df_portfolio_history, df_trade_history = self.run_simulation()
+
+        if not df_trade_history.empty:
+            os.makedirs(os.path.dirname(trade_log_file) or ".", exist_ok=True)
+            df_trade_history.to_csv(
+                trade_log_file,
+                mode="a",
+                header=not os.path.exists(trade_log_file)
+                or os.path.getsize(trade_log_file) == 0,
+                index=False,
+            )
+            self.trade_log_rows += len(df_trade_history)
+            logger.info(
+                "%s 件の取引を追記しました: %s", len(df_trade_history), trade_log_file
+            )
+
+        self.save_state(state_file, extra_state)
+        return df_portfolio_history, df_trade_history
 
     def get_summary_results(self) -> dict:
         """シミュレーションの最終結果を要約して返します。
@@ -0,0 +1,426 @@
+# stock_trading_bot/src/benchmark.py
+
+import argparse
+import itertools
+import json
+import logging
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from .backtester import Backtester
+from .config import (
+    BENCHMARK_BASELINE_FILE,
+    BENCHMARK_GRID_SIZES,
+    BENCHMARK_GRIDS,
+    BENCHMARK_MIN_DELTA_SECONDS,
+    BENCHMARK_OUTPUT_DIR,
+    BENCHMARK_REPEAT,
+    BENCHMARK_TICKER_COUNTS,
+    BENCHMARK_TOLERANCE,
+    BENCHMARK_YEARS,
+    INITIAL_CASH,
+    LEVERAGE_RATIO,
+    STRATEGIES,
+)
+from .data_manager import DataManager
+from .indicator_cache import IndicatorCache
+from .logger import ROOT_LOGGER_NAME, get_logger, setup_logging
+from .strategy_manager import StrategyManager
+from .synthetic_data import TRADING_DAYS_PER_YEAR, SyntheticDataProvider
+from .walk_forward import generate_walk_forward_windows, run_walk_forward
+
+logger = get_logger(__name__)
+
+
+def measure(func, repeat: int = BENCHMARK_REPEAT, trace_memory: bool = True):
+    """
+    関数の実行時間とピークメモリ使用量を計測します。
+
+    実行時間は tracemalloc を無効にした状態で repeat 回実行した中央値です。
+    ピークメモリは別途 tracemalloc を有効にして1回実行し、実行中に確保された
+    Pythonオブジェクト・NumPy配列の最大量を計測します。
+    繰り返し実行で同じメッセージが並ばないよう、計測中はエラー以外のログを抑制します。
+
+    Args:
+        func (Callable[[], object]): 計測する関数 (引数なし)。
+        repeat (int): 実行時間を計測する回数。
+        trace_memory (bool): ピークメモリを計測するかどうか。
+
+    Returns:
+        tuple: (関数の戻り値, 実行時間 [秒], ピークメモリ [バイト] またはNone)。
+    """
+    result = None
+    durations = []
+    root_logger = logging.getLogger(ROOT_LOGGER_NAME)
+    previous_level = root_logger.level
+    root_logger.setLevel(max(previous_level, logging.ERROR))
+    try:
+        for _ in range(max(repeat, 1)):
+            start = time.perf_counter()
+            result = func()
+            durations.append(time.perf_counter() - start)
+
+        peak_bytes = None
+        if trace_memory:
+            tracemalloc.start()
+            try:
+                func()
+                _, peak_bytes = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+    finally:
+        root_logger.setLevel(previous_level)
+    return result, float(np.median(durations)), peak_bytes
+
+
+def run_case(
+    num_tickers: int,
+    years: int,
+    grid: str,
+    repeat: int = BENCHMARK_REPEAT,
+    trace_memory: bool = True,
+) -> dict:
+    """
+    1つの組み合わせ (銘柄数 × 期間 × グリッドサイズ) について各段階を計測します。
+
+    入力データは疑似データプロバイダで生成するため、ネットワークを使わず、
+    同じ組み合わせなら常に同じデータで計測されます。
+
+    Args:
+        num_tickers (int): 銘柄数。
+        years (int): データ期間 (年)。
+        grid (str): BENCHMARK_GRIDS のキー。
+        repeat (int): 各段階の実行回数。
+        trace_memory (bool): ピークメモリを計測するかどうか。
+
+    Returns:
+        dict: 組み合わせのパラメータと、段階ごとの 'seconds' / 'peak_memory_mb'。
+    """
+    short_range, long_range = BENCHMARK_GRIDS[grid]
+    raw_dfs = SyntheticDataProvider().generate_panel(
+        num_tickers, years * TRADING_DAYS_PER_YEAR
+    )
+    data_manager = DataManager()
+    strategy_manager = StrategyManager(short_range, long_range)
+    sma_params = STRATEGIES["SMA_Strategy"]
+    stages = {}
+
+    def record(stage: str, func):
+        result, seconds, peak_bytes = measure(func, repeat, trace_memory)
+        stages[stage] = {
+            "seconds": round(seconds, 6),
+            "peak_memory_mb": (
+                round(peak_bytes / 2**20, 3) if peak_bytes is not None else None
+            ),
+        }
+        return result
+
+    # 1. 指標計算 (全銘柄の移動平均とRSI)
+    def calculate_indicators():
+        processed = {}
+        for ticker, df in raw_dfs.items():
+            df_ma = data_manager.calculate_moving_averages(df)
+            df_rsi = data_manager.calculate_rsi(df_ma) if df_ma is not None else None
+            if df_rsi is not None:
+                processed[ticker] = df_rsi.reset_index()
+        return processed
+
+    processed_dfs = record("indicators", calculate_indicators)
+
+    # 2. シグナル生成 (全銘柄)
+    signal_dfs = record(
+        "signals",
+        lambda: {
+            ticker: strategy_manager.generate_trading_signals(
+                df, "SMA_Strategy", sma_params
+            )
+            for ticker, df in processed_dfs.items()
+        },
+    )
+
+    # 3. パラメータ最適化 (全銘柄の全期間でグリッドサーチ)
+    record(
+        "optimize",
+        lambda: [
+            strategy_manager.optimize_strategy_parameters(df, "SMA_Strategy")
+            for df in processed_dfs.values()
+        ],
+    )
+
+    # 4. バックテスト (全銘柄のポートフォリオ)
+    # Backtester は渡されたデータの 'Date' 列をインデックスに変更するため、毎回コピーを渡す
+    record(
+        "backtest",
+        lambda: Backtester(
+            {ticker: df.copy() for ticker, df in signal_dfs.items()},
+            strategy_name="SMA_Strategy",
+            initial_cash=INITIAL_CASH,
+            leverage_ratio=LEVERAGE_RATIO,
+        ).run_simulation(),
+    )
+
+    # 5. ウォークフォワード全体 (指標キャッシュの構築から期間順の統合まで)
+    def walk_forward():
+        indicator_cache = IndicatorCache(data_manager)
+        full_processed_dfs = {}
+        for ticker, df in raw_dfs.items():
+            indicator_cache.register(ticker, df)
+            frame = indicator_cache.get_indicator_frame(
+                ticker,
+                sma_params["short_ma"],
+                sma_params["long_ma"],
+                STRATEGIES["RSI_Strategy"]["rsi_period"],
+            )
+            if frame is not None:
+                full_processed_dfs[ticker] = frame
+        min_date = min(df.index.min() for df in raw_dfs.values())
+        max_date = max(df.index.max() for df in raw_dfs.values())
+        windows = generate_walk_forward_windows(min_date, max_date)
+        return run_walk_forward(
+            windows,
+            full_processed_dfs,
+            indicator_cache,
+            max_workers=1,
+            strategy_manager=strategy_manager,
+        )
+
+    record("walk_forward", walk_forward)
+
+    return {
+        "tickers": num_tickers,
+        "years": years,
+        "grid": grid,
+        "grid_pairs": sum(1 for s in short_range for lg in long_range if s < lg),
+        "stages": stages,
+    }
+
+
+def run_benchmarks(
+    ticker_counts=BENCHMARK_TICKER_COUNTS,
+    years_list=BENCHMARK_YEARS,
+    grids=BENCHMARK_GRID_SIZES,
+    repeat: int = BENCHMARK_REPEAT,
+    trace_memory: bool = True,
+) -> dict:
+    """
+    全ての組み合わせ (銘柄数 × 期間 × グリッドサイズ) のベンチマークを実行します。
+
+    Args:
+        ticker_counts (Iterable[int]): 銘柄数のリスト。
+        years_list (Iterable[int]): データ期間 (年) のリスト。
+        grids (Iterable[str]): グリッドサイズ (BENCHMARK_GRIDS のキー) のリスト。
+        repeat (int): 各段階の実行回数。
+        trace_memory (bool): ピークメモリを計測するかどうか。
+
+    Returns:
+        dict: 実行環境の情報 ('environment') と各組み合わせの結果 ('cases')。
+    """
+    cases = []
+    for num_tickers, years, grid in itertools.product(ticker_counts, years_list, grids):
+        logger.info(
+            "計測中: %s 銘柄 × %s 年 × グリッド '%s' ...", num_tickers, years, grid
+        )
+        case = run_case(num_tickers, years, grid, repeat, trace_memory)
+        for stage, values in case["stages"].items():
+            memory = (
+                f", ピークメモリ {values['peak_memory_mb']:.1f} MB"
+                if values["peak_memory_mb"] is not None
+                else ""
+            )
+            logger.info("  %-13s %9.3f 秒%s", stage, values["seconds"], memory)
+        cases.append(case)
+
+    return {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "platform": platform.platform(),
+        },
+        "cases": cases,
+    }
+
+
+def compare_with_baseline(
+    results: dict,
+    baseline: dict,
+    tolerance: float = BENCHMARK_TOLERANCE,
+    min_delta_seconds: float = BENCHMARK_MIN_DELTA_SECONDS,
+) -> list:
+    """
+    計測結果をベースラインと比較し、許容範囲を超えて悪化した項目を返します。
+
+    銘柄数・期間・グリッドサイズ・段階が一致する項目同士を比較し、
+    実行時間またはピークメモリが ベースライン × (1 + tolerance) を超えたものを
+    退行とみなします。ただし実行時間の増加が min_delta_seconds 未満の場合は、
+    短い段階の計測の揺らぎとみなして退行に含めません。
+    ベースラインにない組み合わせは比較しません。
+
+    Args:
+        results (dict): run_benchmarks の戻り値。
+        baseline (dict): 以前に保存した run_benchmarks の戻り値。
+        tolerance (float): 許容する増加率。
+        min_delta_seconds (float): 退行とみなす実行時間の増加の下限 [秒]。
+
+    Returns:
+        list[dict]: 退行した項目 ('case', 'stage', 'metric', 'baseline',
+            'current', 'ratio') のリスト。
+    """
+    baseline_cases = {
+        (case["tickers"], case["years"], case["grid"]): case
+        for case in baseline.get("cases", [])
+    }
+    regressions = []
+    for case in results["cases"]:
+        key = (case["tickers"], case["years"], case["grid"])
+        baseline_case = baseline_cases.get(key)
+        if baseline_case is None:
+            continue
+
+        for stage, values in case["stages"].items():
+            baseline_values = baseline_case["stages"].get(stage)
+            if baseline_values is None:
+                continue
+            for metric in ("seconds", "peak_memory_mb"):
+                current = values.get(metric)
+                previous = baseline_values.get(metric)
+                if current is None or not previous:
+                    continue
+                if metric == "seconds" and current - previous < min_delta_seconds:
+                    continue
+                ratio = current / previous
+                if ratio > 1 + tolerance:
+                    regressions.append(
+                        {
+                            "case": key,
+                            "stage": stage,
+                            "metric": metric,
+                            "baseline": previous,
+                            "current": current,
+                            "ratio": ratio,
+                        }
+                    )
+    return regressions
+
+
+def save_results(results: dict, file_path: str):
+    """
+    計測結果をJSONファイルに保存します。
+
+    Args:
+        results (dict): run_benchmarks の戻り値。
+        file_path (str): 保存先のファイルパス。
+    """
+    os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    logger.info("ベンチマーク結果を保存しました: %s", file_path)
+
+
+def main(argv: list | None = None) -> int:
+    """
+    ベンチマークのコマンドラインエントリポイントです。
+
+    Args:
+        argv (list, optional): コマンドライン引数。省略時は sys.argv。
+
+    Returns:
+        int: 終了コード (退行があれば 1)。
+    """
+    parser = argparse.ArgumentParser(
+        description="指標計算・シグナル生成・最適化・バックテスト・ウォークフォワードの各段階を計測します。"
+    )
+    parser.add_argument(
+        "--tickers", type=int, nargs="+", default=BENCHMARK_TICKER_COUNTS
+    )
+    parser.add_argument("--years", type=int, nargs="+", default=BENCHMARK_YEARS)
+    parser.add_argument(
+        "--grid", nargs="+", choices=list(BENCHMARK_GRIDS), default=BENCHMARK_GRID_SIZES
+    )
+    parser.add_argument("--repeat", type=int, default=BENCHMARK_REPEAT)
+    parser.add_argument(
+        "--no-memory", action="store_true", help="ピークメモリを計測しない"
+    )
+    parser.add_argument(
+        "--output", help="結果JSONの保存先 (省略時は日時入りのファイル名)"
+    )
+    parser.add_argument("--baseline", default=BENCHMARK_BASELINE_FILE)
+    parser.add_argument("--tolerance", type=float, default=BENCHMARK_TOLERANCE)
+    parser.add_argument(
+        "--min-delta",
+        type=float,
+        default=BENCHMARK_MIN_DELTA_SECONDS,
+        help="退行とみなす実行時間の増加の下限 [秒]",
+    )
+    parser.add_argument(
+        "--log-level", default="INFO", help="ログレベル (DEBUG, INFO, WARNING など)"
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="今回の結果をベースラインとして保存する",
+    )
+    args = parser.parse_args(argv)
+    setup_logging(args.log_level.upper(), None)
+
+    results = run_benchmarks(
+        args.tickers, args.years, args.grid, args.repeat, not args.no_memory
+    )
+    output_path = args.output or os.path.join(
+        BENCHMARK_OUTPUT_DIR,
+        f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+    )
+    save_results(results, output_path)
+
+    if args.save_baseline:
+        save_results(results, args.baseline)
+        return 0
+
+    if not os.path.exists(args.baseline):
+        logger.info(
+            "ベースラインが見つからないため比較をスキップします: %s", args.baseline
+        )
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare_with_baseline(
+        results, baseline, args.tolerance, args.min_delta
+    )
+    if not regressions:
+        logger.info(
+            "ベースラインからの退行はありません (許容範囲 %.0f%%, %.3f 秒未満の増加は無視)。",
+            args.tolerance * 100,
+            args.min_delta,
+        )
+        return 0
+
+    logger.warning(
+        "警告: ベースラインから %s 件の退行を検出しました。", len(regressions)
+    )
+    for regression in regressions:
+        tickers, years, grid = regression["case"]
+        logger.warning(
+            "  %s 銘柄 × %s 年 × '%s' / %s / %s: %s -> %s (%.2f 倍)",
+            tickers,
+            years,
+            grid,
+            regression["stage"],
+            regression["metric"],
+            regression["baseline"],
+            regression["current"],
+            regression["ratio"],
+        )
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
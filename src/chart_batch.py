@@ -0,0 +1,216 @@
+# stock_trading_bot/src/chart_batch.py
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import pandas as pd
+
+from .config import (
+    CHART_BATCH_MODE,
+    CHART_DPI,
+    CHART_MAX_WORKERS,
+    CHART_OUTPUT_DIR,
+    PLOT_FORMAT,
+    PLOT_MAX_POINTS,
+)
+from .logger import ROOT_LOGGER_NAME, get_logger, setup_logging
+from .visualizer import Visualizer
+
+logger = get_logger(__name__)
+
+# 指定できる出力の単位
+CHART_MODES = ("ticker", "window", "both")
+
+
+def _file_label(name: str) -> str:
+    """
+    ティッカーシンボルなどをファイル名に使える文字列に変換します。
+
+    Args:
+        name (str): 変換する文字列。
+
+    Returns:
+        str: パスの区切り文字などを '_' に置き換えた文字列。
+    """
+    return "".join(c if c.isalnum() or c in "-_." else "_" for c in str(name))
+
+
+def _trades_by_ticker(df_trades: pd.DataFrame) -> dict:
+    """
+    取引履歴を銘柄ごとに分割します (チャートに必要な列のみ)。
+
+    Args:
+        df_trades (pd.DataFrame): 'Date', 'Ticker', 'Trade_Type', 'Price' 列を持つ取引履歴。
+
+    Returns:
+        dict: 銘柄 -> その銘柄の取引履歴。
+    """
+    if df_trades is None or df_trades.empty:
+        return {}
+    columns = ["Date", "Trade_Type", "Price"]
+    return {
+        ticker: group[columns]
+        for ticker, group in df_trades.groupby("Ticker", sort=False)
+    }
+
+
+def build_chart_tasks(
+    window_signals: list, df_trades: pd.DataFrame, mode: str, output_dir: str
+) -> list:
+    """
+    描画するチャートの一覧を作成します。
+
+    Args:
+        window_signals (list[dict]): run_walk_forward(keep_signals=True) が返す
+            'window_signals'。
+        df_trades (pd.DataFrame): 全期間の統合された取引履歴 (銘柄ごとのチャート用)。
+        mode (str): "ticker", "window", "both" のいずれか。
+        output_dir (str): チャートの保存先ディレクトリ。
+
+    Returns:
+        list[tuple]: (シグナル, 取引履歴, ファイルパス, タイトル) のリスト。
+    """
+    empty_trades = pd.DataFrame(columns=["Date", "Trade_Type", "Price"])
+    tasks = []
+
+    if mode in ("window", "both"):
+        for entry in window_signals:
+            window_dir = os.path.join(output_dir, entry["label"])
+            trades = _trades_by_ticker(entry["trades_df"])
+            for ticker, df_signals in entry["signal_dfs"].items():
+                params = entry["params_by_ticker"][ticker]
+                tasks.append(
+                    (
+                        df_signals,
+                        trades.get(ticker, empty_trades),
+                        os.path.join(window_dir, _file_label(ticker)),
+                        f"{ticker} ({entry['label']}, SMA {params['short_ma']}/{params['long_ma']})",
+                    )
+                )
+
+    if mode in ("ticker", "both"):
+        frames_by_ticker = {}
+        for entry in window_signals:
+            for ticker, df_signals in entry["signal_dfs"].items():
+                frames_by_ticker.setdefault(ticker, []).append(df_signals)
+        trades = _trades_by_ticker(df_trades)
+        for ticker, frames in frames_by_ticker.items():
+            # テスト期間が重なる場合は、統合ポートフォリオと同じく後の期間の値を使う
+            df_signals = (
+                pd.concat(frames, ignore_index=True)
+                .drop_duplicates(subset="Date", keep="last")
+                .sort_values(by="Date")
+            )
+            tasks.append(
+                (
+                    df_signals,
+                    trades.get(ticker, empty_trades),
+                    os.path.join(output_dir, _file_label(ticker)),
+                    f"{ticker} (Walk-Forward Test Periods)",
+                )
+            )
+    return tasks
+
+
+def _init_chart_worker(log_level: int):
+    """
+    ワーカープロセスの初期化時に、親プロセスと同じログレベルを設定します。
+
+    Args:
+        log_level (int): 親プロセスのログレベル。0 (未設定) の場合は出力しません。
+    """
+    if log_level:
+        setup_logging(log_level)
+
+
+def _render_chart(task: tuple, dpi: int, image_format: str, max_points: int) -> str:
+    """
+    チャートを1枚描画して保存します。
+
+    Args:
+        task (tuple): build_chart_tasks が返す (シグナル, 取引履歴, ファイルパス, タイトル)。
+        dpi (int): 保存する画像の解像度。
+        image_format (str): 保存する画像の形式。
+        max_points (int): 1本の線に描画する最大の点数。
+
+    Returns:
+        str: 保存したファイルパス。失敗した場合はNone。
+    """
+    df_signals, df_trades, path, title = task
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        Visualizer(
+            None,
+            headless=True,
+            dpi=dpi,
+            image_format=image_format,
+            max_points=max_points,
+        ).plot_signal_chart(df_signals, df_trades, path, title)
+    except Exception as e:
+        logger.error("エラー: チャート '%s' の描画に失敗しました: %s", title, e)
+        return None
+    return f"{path}.{image_format}"
+
+
+def generate_charts(
+    window_signals: list,
+    df_trades: pd.DataFrame,
+    mode: str = CHART_BATCH_MODE,
+    output_dir: str = CHART_OUTPUT_DIR,
+    max_workers: int = CHART_MAX_WORKERS,
+    dpi: int = CHART_DPI,
+    image_format: str = PLOT_FORMAT,
+) -> list:
+    """
+    ウォークフォワードで計算済みのシグナルから、銘柄・期間ごとのチャートを一括で出力します。
+
+    指標やシグナルは再計算せず、run_walk_forward(keep_signals=True) の結果を
+    そのまま使います。チャートは pyplot を使わずに描画するため、
+    プロセスプールで並列に描画できます。
+
+    Args:
+        window_signals (list[dict]): run_walk_forward が返す 'window_signals'。
+        df_trades (pd.DataFrame): 全期間の統合された取引履歴。
+        mode (str): "ticker" (銘柄ごと)、"window" (テスト期間×銘柄ごと)、"both"。
+        output_dir (str): チャートの保存先ディレクトリ。
+        max_workers (int): ワーカープロセス数。1 以下なら逐次実行、None なら
+            CPUコア数。
+        dpi (int): 保存する画像の解像度。
+        image_format (str): 保存する画像の形式。
+
+    Returns:
+        list[str]: 保存したチャートのファイルパス。
+    """
+    if mode not in CHART_MODES:
+        logger.warning(
+            "警告: 未知のチャート出力単位 '%s' が指定されました。'ticker' を使用します。",
+            mode,
+        )
+        mode = "ticker"
+
+    tasks = build_chart_tasks(window_signals, df_trades, mode, output_dir)
+    if not tasks:
+        logger.warning("警告: 描画できるシグナルデータがありません。")
+        return []
+
+    render = partial(
+        _render_chart, dpi=dpi, image_format=image_format, max_points=PLOT_MAX_POINTS
+    )
+    if max_workers is not None and max_workers <= 1:
+        paths = [render(task) for task in tasks]
+    else:
+        workers = max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_chart_worker,
+            initargs=(logging.getLogger(ROOT_LOGGER_NAME).level,),
+        ) as executor:
+            # 1枚あたりの描画は短いため、まとめて渡してプロセス間通信の回数を減らす
+            chunksize = max(1, len(tasks) // (workers * 4))
+            paths = list(executor.map(render, tasks, chunksize=chunksize))
+
+    paths = [path for path in paths if path is not None]
+    logger.info("%s 枚のチャートを保存しました: %s", len(paths), output_dir)
+    return paths
@@ -16,6 +16,31 @@ TICKER_SYMBOLS = [
 START_DATE = "2015-01-01"  # より長い期間に設定
 # データ取得終了日 ('YYYY-MM-DD' 形式)
 END_DATE = "2025-06-07"  # 最新の日付に調整
+# データ取得元 ("yfinance": 実データ / "synthetic": 疑似データ。ネットワーク不要)
+DATA_PROVIDER = "yfinance"
+# データ取得モード
+# "full": 毎回全期間を取得し直す / "incremental": 既存CSVに不足している期間だけを並行取得して追記
+# "store": 列指向の価格ストア (PRICE_STORE_DIR) から読み込む (python -m src.price_store で作成。
+#          銘柄別CSVの方が新しい場合はエラー)
+DATA_FETCH_MODE = "full"
+# 列指向の価格ストアの保存先ディレクトリ (DataManager は data_dir の下の同じ名前のディレクトリを使う)
+PRICE_STORE_DIR = "data/store"
+# incremental モードで同時にダウンロードするスレッド数の上限
+DATA_FETCH_MAX_WORKERS = 8
+
+# --- 疑似データ設定 (DATA_PROVIDER = "synthetic" の場合) ---
+# 生成する銘柄数 (ティッカーは SYN0000, SYN0001, ...)
+SYNTHETIC_TICKER_COUNT = 1000
+# 乱数のシード値 (同じ値なら常に同じデータを生成)
+SYNTHETIC_SEED = 42
+# 年率のドリフト (期待リターン) と平常時の年率ボラティリティ
+SYNTHETIC_ANNUAL_DRIFT = 0.07
+SYNTHETIC_ANNUAL_VOLATILITY = 0.25
+# ボラティリティのレジームごとの倍率 (平常, 高ボラティリティ) と1日あたりの切り替え確率
+SYNTHETIC_VOLATILITY_MULTIPLIERS = (1.0, 2.5)
+SYNTHETIC_REGIME_SWITCH_PROB = 0.01
+# 疑似データのCSVを保存するディレクトリ
+SYNTHETIC_DATA_DIR = "data/synthetic"
 
 # --- 戦略設定 ---
 # 複数の戦略とそのデフォルトパラメータを定義
@@ -37,6 +62,8 @@ STRATEGIES = {
 INITIAL_CASH = 20_000_000  # 2,000万円に増額 (月10万円目標に対してより現実的に)
 # 利用するレバレッジ倍率 (例: 1 はレバレッジなし、2 は2倍レバレッジ)
 LEVERAGE_RATIO = 1.0  # レバレッジなしに設定 (リスクを大幅に低減)
+# バックテストの実装 ("python": 辞書ベース, "numpy": 配列ベースの高速版。結果は同一)
+BACKTEST_BACKEND = "python"
 
 # --- ウォークフォワード最適化設定 ---
 # パラメータ最適化に使用する過去データの期間 (日数)
@@ -45,15 +72,126 @@ OPTIMIZATION_WINDOW_DAYS = 180
 TEST_WINDOW_DAYS = 60
 # 最適化ウィンドウをずらす間隔 (日数)
 WALK_FORWARD_STEP_DAYS = 30
+# ウォークフォワードの各期間を並列実行するワーカープロセス数
+# (1 以下なら逐次実行、None ならCPUコア数)
+WALK_FORWARD_MAX_WORKERS = 1
 
 # 最適化するパラメータの探索範囲 (グリッドサーチ用)
 # 短期移動平均線の期間の探索範囲 (開始, 終了+1, ステップ)
 SMA_SHORT_RANGE = range(5, 26, 5)  # 例: 5, 10, 15, 20, 25
 # 長期移動平均線の期間の探索範囲 (開始, 終了+1, ステップ)
 SMA_LONG_RANGE = range(10, 61, 10)  # 例: 10, 20, 30, 40, 50, 60
+# RSIの計算期間の探索範囲
+RSI_PERIOD_RANGE = range(7, 29, 7)  # 例: 7, 14, 21, 28
+# RSIの売られすぎ閾値 (買いシグナル) の探索範囲
+RSI_OVERSOLD_RANGE = range(20, 41, 5)  # 例: 20, 25, 30, 35, 40
+# RSIの買われすぎ閾値 (売りシグナル) の探索範囲
+RSI_OVERBOUGHT_RANGE = range(60, 81, 5)  # 例: 60, 65, 70, 75, 80
+# SMA戦略の最適化の対象銘柄
+# "first_ticker": 最初の銘柄で最適化したパラメータを全銘柄に適用
+# "per_ticker": 全銘柄を一括で評価し、銘柄ごとに最良のパラメータを適用
+# "pooled": 全銘柄を一括で評価し、平均リターンが最大のパラメータを全銘柄に適用
+SMA_OPTIMIZATION_MODE = "first_ticker"
+# SMA戦略のパラメータの探索方法 (探索範囲の組み合わせが多い場合に評価回数を抑える)
+PARAMETER_SEARCH = {
+    # "grid": 全組み合わせ / "random": 無作為抽出 / "successive_halving": 期間を伸ばしながら絞り込み
+    # "coordinate": 短期・長期の軸ごとの局所探索
+    "method": "grid",
+    "budget": 200,  # 1期間あたりに評価する組み合わせ数の上限 ("grid" では無視)
+    "seed": 0,  # 無作為抽出の乱数のシード値
+    "halving_factor": 3,  # successive_halving で各段階に残す割合の逆数 (上位 1/3)
+    "min_window_fraction": 0.25,  # successive_halving の最初の段階で使う最新期間の割合
+}
+# パラメータ最適化の結果をディスクにキャッシュし、同じデータ・設定の再実行で再利用する
+OPTIMIZATION_CACHE_ENABLED = True
+# 最適化キャッシュの保存先ディレクトリと合計サイズの上限 (超えた場合は古いものから削除)
+OPTIMIZATION_CACHE_DIR = "cache/optimization"
+OPTIMIZATION_CACHE_MAX_BYTES = 256 * 2**20  # 256 MB
+# ブートストラップによる頑健性評価 (日次リターンを再標本化した資産推移の分布)
+ROBUSTNESS_ENABLED = False
+ROBUSTNESS = {
+    # "iid": 1日ずつ独立に抽出 / "block": 固定長のブロック単位で抽出 (循環)
+    # "stationary": 平均 block_size 日の幾何分布の長さのブロックで抽出
+    "method": "block",
+    "n_paths": 10_000,  # 生成する資産推移の数
+    "block_size": 20,  # ブロックの長さ (日数、"stationary" では平均)
+    "seed": 0,  # 乱数のシード値
+    "chunk_size": 1_000,  # 一度に計算する資産推移の数 (メモリ使用量を抑える)
+    "percentiles": (5, 25, 50, 75, 95),  # 結果に表示するパーセンタイル
+}
+
+# --- ベンチマーク設定 (python -m src.benchmark) ---
+# 計測する銘柄数・期間 (年)・最適化グリッドの組み合わせ (全組み合わせを計測)
+BENCHMARK_TICKER_COUNTS = (10, 100)
+BENCHMARK_YEARS = (2, 10)
+BENCHMARK_GRID_SIZES = ("default", "large")
+# グリッドサイズごとの (短期MAの探索範囲, 長期MAの探索範囲)
+BENCHMARK_GRIDS = {
+    "small": (range(5, 16, 5), range(20, 41, 10)),
+    "default": (SMA_SHORT_RANGE, SMA_LONG_RANGE),
+    "large": (range(2, 51, 2), range(10, 201, 5)),
+}
+# 各段階の実行回数 (実行時間は中央値を採用。1回だけでは揺らぎで誤検出するため5回以上を推奨)
+BENCHMARK_REPEAT = 5
+# 計測結果の出力先とベースライン (比較対象) のファイルパス
+BENCHMARK_OUTPUT_DIR = "output/benchmarks"
+BENCHMARK_BASELINE_FILE = "output/benchmarks/baseline.json"
+# ベースラインとの比較で退行とみなす増加率 (0.2 なら 20% 超の悪化)
+BENCHMARK_TOLERANCE = 0.2
+# 実行時間の増加がこの秒数未満の場合は、増加率によらず退行とみなさない (計測の揺らぎ)
+BENCHMARK_MIN_DELTA_SECONDS = 0.05
+
+# --- ペーパートレード設定 (python -m src.paper_trading) ---
+# ポートフォリオの状態 (現金・保有株数・買値・処理済みの最終日) の保存先
+PAPER_TRADING_STATE_FILE = "output/paper_trading/state.json"
+# 日々の取引を追記する取引ログ (CSV)
+PAPER_TRADING_TRADE_LOG = "output/paper_trading/trades.csv"
+
+# --- ログ・メトリクス設定 ---
+# ログの出力レベル ("DEBUG" にすると指標計算などのデバッグ情報も出力)
+LOG_LEVEL = "INFO"
+# バッチモード (python -m src.main --batch) でのログレベル (警告とエラーのみ)
+BATCH_LOG_LEVEL = "WARNING"
+# ログファイルのパス (None なら画面のみに出力)
+LOG_FILE = None
+# 処理段階ごとの実行時間 (メトリクス) の出力先 (None なら出力しない)
+METRICS_FILE = "output/metrics.json"
+# プロファイル (python -m src.main --profile) の出力先ディレクトリ
+PROFILE_OUTPUT_DIR = "output"
+# プロファイルレポートに表示する上位の関数・行の数
+PROFILE_TOP_N = 25
+# メモリ確保ごとに記録する呼び出し履歴の深さ (深いほど正確だが遅くなる)
+PROFILE_TRACEMALLOC_FRAMES = 25
 
 # --- 出力設定 ---
 # レポートファイル名
 REPORT_FILE_NAME = "trading_simulation_results.xlsx"
+# レポートの形式
+# "full": ポートフォリオ履歴と取引履歴の全行をExcelに書き込む
+# "summary": Excelにはサマリーと集計 (月次・銘柄別) のみを書き込み、
+#            全行のデータはサイドカーファイルに出力する (大量の取引履歴向け)
+REPORT_MODE = "full"
+# 全行のデータを別ファイル (サイドカー) にも出力する形式 ("csv", "parquet", None)
+# "parquet" には pyarrow が必要 (ない場合は "csv" で出力)。
+# "summary" モードで None の場合は "csv" を使用します。
+REPORT_SIDECAR_FORMAT = None
+# Excel・サイドカーへ一度に書き込む行数 (メモリ使用量はこの行数分に抑えられる)
+REPORT_CHUNK_SIZE = 50_000
 # グラフファイル名
 PLOT_FILE_NAME = "portfolio_and_signals.png"
+# True の場合はグラフを画面に表示せず、ファイルへの保存のみ行う (--batch 指定時も同様)
+PLOT_HEADLESS = False
+# グラフを保存する解像度 (dpi) と形式 ("png", "svg", "pdf" など)
+PLOT_DPI = 300
+PLOT_FORMAT = "png"
+# 1本の線に描画する最大の点数 (超える場合は形を保つように間引く、None で間引かない)
+PLOT_MAX_POINTS = 2000
+# 銘柄・期間ごとのシグナルチャートの一括出力
+# "ticker": 銘柄ごとに全テスト期間のチャート, "window": テスト期間×銘柄ごとのチャート,
+# "both": 両方, None: 出力しない
+CHART_BATCH_MODE = None
+# 一括出力するチャートの保存先と解像度
+CHART_OUTPUT_DIR = "output/charts"
+CHART_DPI = 100
+# チャートを描画するワーカープロセス数 (1 以下なら逐次実行、None ならCPUコア数)
+CHART_MAX_WORKERS = None
@@ -1,21 +1,191 @@
 # stock_trading_bot/src/data_manager.py
 
+import json
+import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from datetime import timedelta
 
 import numpy as np
 import pandas as pd
 import yfinance as yf
 
 # ★ここを修正/追加★
-from .config import STRATEGIES  # 修正
+from .config import DATA_FETCH_MAX_WORKERS, STRATEGIES  # 修正
+from .logger import get_logger
+from .metrics import StageMetrics
+from .price_store import MANIFEST_FILE, PriceStore, store_dir_for
 
 # ★ここまで修正/追加★
 
+logger = get_logger(__name__)
+
+# compute_rsi_table で指定できる平均化の方法
+RSI_SMOOTHING_METHODS = ("sma", "wilder")
+
+# 銘柄ごとに取得を要求した開始日を記録するファイル (data_dir 内)
+COVERAGE_FILE = "coverage.json"
+
+
+def compute_rsi_table(
+    close: np.ndarray,
+    periods: list,
+    smoothing: str = "sma",
+    min_periods: int = 1,
+    dtype=np.float64,
+) -> np.ndarray:
+    """
+    終値から複数期間のRSIを一度にまとめて計算します。
+
+    上昇幅・下落幅は一度だけ計算し、全期間の平均を同じ走査で求めます。
+    上昇幅・下落幅の定義は `DataManager.compute_rsi` と同じで、
+    smoothing="sma", min_periods=1 の結果は compute_rsi と (累積和による
+    丸め誤差の範囲で) 一致します。期間内に下落がない行は NaN です。
+
+    Args:
+        close (np.ndarray): 終値の配列 (日付順)。
+        periods (list[int]): RSIの計算期間のリスト。
+        smoothing (str): 上昇幅・下落幅の平均化の方法。
+            "sma": 単純移動平均 (累積和の差分で計算)。
+            "wilder": Wilder の平滑化 (alpha = 1/期間 の指数移動平均。
+            期間に満たない先頭行は利用可能な値の平均)。
+        min_periods (int, optional): 値を出力するのに必要な最小の行数。
+            None の場合は各期間と同じ (期間に満たない先頭行は NaN)。
+        dtype (np.dtype): 戻り値の型 (多数の銘柄・期間を保持する場合は
+            np.float32 でメモリを半分にできます)。
+
+    Returns:
+        np.ndarray: 形状 (日付, len(periods)) のRSI。
+    """
+    if smoothing not in RSI_SMOOTHING_METHODS:
+        raise ValueError(
+            f"未知の平均化の方法です: {smoothing} (指定可能: {RSI_SMOOTHING_METHODS})"
+        )
+
+    close = np.asarray(close, dtype=float)
+    period_values = np.asarray(list(periods), dtype=np.int64)
+    n_rows = len(close)
+    rows = np.arange(n_rows)
+
+    # 先頭行と欠損の前後は差分が NaN となり、上昇幅・下落幅ともに 0 とする
+    delta = np.diff(close, prepend=np.nan)
+    gain = np.where(delta > 0, delta, 0.0)
+    loss = np.where(delta < 0, -delta, 0.0)
+
+    if smoothing == "sma":
+        # 各行の窓の開始位置 (期間に満たない先頭行は0行目から)
+        window_start = np.maximum(rows[:, np.newaxis] - period_values + 1, 0)
+        window_count = rows[:, np.newaxis] + 1 - window_start
+
+        def rolling_mean(values: np.ndarray) -> np.ndarray:
+            cumsum = np.concatenate([[0.0], np.cumsum(values)])
+            positive_count = np.concatenate([[0], np.cumsum(values > 0)])
+            means = (cumsum[rows + 1][:, np.newaxis] - cumsum[window_start]) / (
+                window_count
+            )
+            # 窓内が全て 0 の場合は累積和の丸め誤差を残さず、ちょうど 0 とする
+            empty = (
+                positive_count[rows + 1][:, np.newaxis] == positive_count[window_start]
+            )
+            means[empty] = 0.0
+            return means
+
+        avg_gain = rolling_mean(gain)
+        avg_loss = rolling_mean(loss)
+    else:
+        avg_gain = np.empty((n_rows, len(period_values)))
+        avg_loss = np.empty((n_rows, len(period_values)))
+        current_gain = np.zeros(len(period_values))
+        current_loss = np.zeros(len(period_values))
+        for i in range(n_rows):
+            # 期間に満たない間は 1/(i+1) で累積平均、以降は 1/期間 で平滑化する
+            alpha = 1.0 / np.minimum(i + 1, period_values)
+            current_gain += (gain[i] - current_gain) * alpha
+            current_loss += (loss[i] - current_loss) * alpha
+            avg_gain[i] = current_gain
+            avg_loss[i] = current_loss
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100 - (100 / (1 + avg_gain / np.where(avg_loss == 0, np.nan, avg_loss)))
+
+    required_rows = (
+        period_values if min_periods is None else np.minimum(min_periods, period_values)
+    )
+    rsi[rows[:, np.newaxis] + 1 < required_rows] = np.nan
+    return rsi.astype(dtype, copy=False)
+
 
 class DataManager:
-    def __init__(self):
-        self.data_dir = "data"
+    def __init__(
+        self, provider=None, data_dir: str = "data", metrics: StageMetrics | None = None
+    ):
+        """
+        DataManagerのコンストラクタ。
+
+        Args:
+            provider (Callable[[str, str, str], pd.DataFrame], optional):
+                (ティッカー, 開始日, 終了日) を受け取り、インデックスがDateで
+                Open/High/Low/Close/Volume 列を持つDataFrameを返すデータ取得関数。
+                終了日は含みません。省略時は yfinance から取得します。
+            data_dir (str): 銘柄別CSVファイルを保存するディレクトリ。
+                列指向の価格ストアはこの下の 'store' (PRICE_STORE_DIR と同じ名前)
+                に置きます。
+            metrics (StageMetrics, optional): 銘柄ごとのデータ取得時間を記録する
+                メトリクス。省略時は記録しません。
+        """
+        self.data_dir = data_dir
         os.makedirs(self.data_dir, exist_ok=True)
+        self.store_dir = store_dir_for(self.data_dir)
+        self.provider = (
+            provider if provider is not None else self.fetch_data_from_yfinance
+        )
+        self.metrics = metrics
+        self._coverage_lock = threading.Lock()
+
+    def _load_coverage(self) -> dict:
+        """
+        銘柄ごとに取得済みの期間の開始日を記録したファイルを読み込みます。
+
+        CSVの最初の行は取引所の休場日などで要求した開始日より後になるため、
+        キャッシュがどの開始日から取得したものかはこのファイルで判断します。
+
+        Returns:
+            dict: 銘柄 -> 取得を要求した開始日 ('YYYY-MM-DD')。
+        """
+        path = os.path.join(self.data_dir, COVERAGE_FILE)
+        if not os.path.exists(path):
+            return {}
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save_coverage(self, coverage: dict):
+        """
+        銘柄ごとに取得済みの期間の開始日を保存します。
+
+        Args:
+            coverage (dict): 銘柄 -> 取得を要求した開始日 ('YYYY-MM-DD')。
+        """
+        path = os.path.join(self.data_dir, COVERAGE_FILE)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(coverage, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(temp_path, path)
+
+    def _fetch_timer(self, ticker: str):
+        """
+        銘柄のデータ取得時間を計測するコンテキストマネージャを返します。
+
+        Args:
+            ticker (str): ティッカーシンボル。
+
+        Returns:
+            ContextManager: メトリクスが未設定の場合は何もしないコンテキスト。
+        """
+        if self.metrics is None:
+            return nullcontext()
+        return self.metrics.timer("fetch", ticker=ticker)
 
     def fetch_data_from_yfinance(
         self, ticker: str, start_date: str, end_date: str
@@ -23,13 +193,16 @@ class DataManager:
         """
         yfinanceから指定した銘柄の株価データを取得します。
         """
-        print(
-            f"yfinance から '{ticker}' のデータを取得中 ({start_date} から {end_date})..."
+        logger.info(
+            "yfinance から '%s' のデータを取得中 (%s から %s)...",
+            ticker,
+            start_date,
+            end_date,
         )
         try:
             df = yf.download(ticker, start=start_date, end=end_date, auto_adjust=True)
             if df.empty:
-                print(f"警告: '{ticker}' のデータが取得できませんでした。")
+                logger.warning("警告: '%s' のデータが取得できませんでした。", ticker)
                 return pd.DataFrame()
 
             df.reset_index(inplace=True)
@@ -43,23 +216,28 @@ class DataManager:
                 df.columns = df.columns.get_level_values(
                     0
                 )  # これが 'Close', 'High', etc. になることを期待
-                print(
-                    f"デバッグ: MultiIndex列をフラット化しました。新しい列: {df.columns.tolist()}"
+                logger.debug(
+                    "デバッグ: MultiIndex列をフラット化しました。新しい列: %s",
+                    df.columns.tolist(),
                 )
 
             # 最終的に必要な列だけを確実に取得
             required_cols = ["Open", "High", "Low", "Close", "Volume"]
             current_cols = df.columns.tolist()
             if not all(col in current_cols for col in required_cols):
-                print(
-                    f"エラー: 必要な列 ({required_cols}) の一部または全てがデータフレームにありません。現在の列: {current_cols}"
+                logger.error(
+                    "エラー: 必要な列 (%s) の一部または全てがデータフレームにありません。現在の列: %s",
+                    required_cols,
+                    current_cols,
                 )
                 return pd.DataFrame()
 
             return df[required_cols]
 
         except Exception as e:
-            print(f"エラー: '{ticker}' のデータ取得中に問題が発生しました: {e}")
+            logger.error(
+                "エラー: '%s' のデータ取得中に問題が発生しました: %s", ticker, e
+            )
             return pd.DataFrame()
 
     def fetch_multiple_data_from_yfinance(
@@ -69,41 +247,278 @@ class DataManager:
         複数の銘柄の株価データをyfinanceから取得し、CSVに保存します。
         """
         all_dfs = {}
+        coverage = self._load_coverage()
         for ticker in tickers:
             file_path = os.path.join(self.data_dir, f"{ticker}.csv")
-            df = self.fetch_data_from_yfinance(ticker, start_date, end_date)
+            with self._fetch_timer(ticker):
+                df = self.provider(ticker, start_date, end_date)
 
             if not df.empty:
                 df.reset_index(inplace=True)
                 df.to_csv(file_path, index=False)
-                print(
-                    f"'{ticker}' のデータ取得完了。CSVファイルに保存します: {file_path}"
+                coverage[ticker] = start_date
+                logger.info(
+                    "'%s' のデータ取得完了。CSVファイルに保存します: %s",
+                    ticker,
+                    file_path,
                 )
                 df.set_index("Date", inplace=True)
                 all_dfs[ticker] = df
             else:
                 all_dfs[ticker] = pd.DataFrame()
+        self._save_coverage(coverage)
         return all_dfs
 
+    def fetch_multiple_data_incremental(
+        self,
+        tickers: list,
+        start_date: str,
+        end_date: str,
+        max_workers: int = DATA_FETCH_MAX_WORKERS,
+    ) -> dict:
+        """
+        既存のCSVキャッシュに不足している期間だけを取得し、複数銘柄を並行して更新します。
+
+        Args:
+            tickers (list): ティッカーシンボルのリスト。
+            start_date (str): データ取得開始日 ('YYYY-MM-DD')。
+            end_date (str): データ取得終了日 ('YYYY-MM-DD'、この日を含まない)。
+            max_workers (int): 同時にダウンロードするスレッド数の上限。
+
+        Returns:
+            dict: 銘柄ごとの [start_date, end_date) の株価データ。
+                取得できなかった銘柄は空のDataFrame。
+        """
+        coverage = self._load_coverage()
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            dfs = list(
+                executor.map(
+                    lambda ticker: self._update_ticker_data(
+                        ticker, start_date, end_date, coverage
+                    ),
+                    tickers,
+                )
+            )
+        self._save_coverage(coverage)
+        return dict(zip(tickers, dfs))
+
+    def _update_ticker_data(
+        self, ticker: str, start_date: str, end_date: str, coverage: dict | None = None
+    ) -> pd.DataFrame:
+        """
+        1銘柄のCSVキャッシュを読み込み、不足期間の差分を取得して統合・保存します。
+
+        末尾側の差分は、キャッシュの最終日の1本を重ねて取得します。その終値が
+        キャッシュと異なる場合は、分割や配当で過去の調整後価格が変わったものと
+        みなし、全期間を取得し直してCSVを書き換えます。
+
+        Args:
+            ticker (str): ティッカーシンボル。
+            start_date (str): データ取得開始日 ('YYYY-MM-DD')。
+            end_date (str): データ取得終了日 ('YYYY-MM-DD'、この日を含まない)。
+            coverage (dict, optional): 銘柄 -> 取得を要求した開始日。
+                取得後の開始日で更新されます。
+
+        Returns:
+            pd.DataFrame: [start_date, end_date) の株価データ。
+        """
+        if coverage is None:
+            coverage = {}
+        file_path = os.path.join(self.data_dir, f"{ticker}.csv")
+        start = pd.Timestamp(start_date)
+        end = pd.Timestamp(end_date)
+
+        cached_df = (
+            self.load_data_from_csv(ticker)
+            if os.path.exists(file_path)
+            else pd.DataFrame()
+        )
+
+        # キャッシュに含まれない先頭側・末尾側の期間を求める (終了日は含まない)
+        head_range = None
+        tail_range = None
+        if cached_df.empty:
+            covered_start = start
+            head_range = (start, end)
+        else:
+            with self._coverage_lock:
+                recorded_start = coverage.get(ticker)
+            covered_start = cached_df.index.min()
+            if recorded_start is not None:
+                covered_start = min(covered_start, pd.Timestamp(recorded_start))
+            if start < covered_start:
+                head_range = (start, covered_start)
+                covered_start = start
+            last_date = cached_df.index.max()
+            if last_date + timedelta(days=1) < end:
+                tail_range = (last_date, end)
+
+        def fetch(range_start: pd.Timestamp, range_end: pd.Timestamp):
+            delta_df = self.provider(
+                ticker,
+                range_start.strftime("%Y-%m-%d"),
+                range_end.strftime("%Y-%m-%d"),
+            )
+            if delta_df is None or delta_df.empty:
+                return None
+            return delta_df
+
+        rewrite = cached_df.empty or head_range is not None
+        delta_dfs = []
+        with self._fetch_timer(ticker):
+            if head_range is not None:
+                delta_dfs.append(fetch(*head_range))
+            if tail_range is not None:
+                tail_df = fetch(*tail_range)
+                if tail_df is not None and last_date in tail_df.index:
+                    cached_close = cached_df.loc[last_date, "Close"]
+                    fetched_close = tail_df.loc[last_date, "Close"]
+                    if not np.isclose(fetched_close, cached_close, rtol=1e-9):
+                        logger.info(
+                            "'%s' の調整後価格が変更されたため、全期間を取得し直します。",
+                            ticker,
+                        )
+                        cached_df = pd.DataFrame()
+                        rewrite = True
+                        delta_dfs = [fetch(covered_start, end)]
+                        tail_df = None
+                delta_dfs.append(tail_df)
+        delta_dfs = [df for df in delta_dfs if df is not None]
+
+        with self._coverage_lock:
+            coverage[ticker] = covered_start.strftime("%Y-%m-%d")
+
+        if delta_dfs:
+            merged_df = pd.concat([cached_df] + delta_dfs)
+            merged_df = merged_df[~merged_df.index.duplicated(keep="last")]
+            merged_df.sort_index(inplace=True)
+            merged_df.index.name = "Date"
+
+            if rewrite:
+                merged_df.reset_index().to_csv(file_path, index=False)
+                new_row_count = len(merged_df) - len(cached_df)
+            else:
+                # 末尾への追加のみの場合は、差分の行だけをCSVに追記する
+                new_rows = merged_df[merged_df.index > last_date]
+                new_rows.reset_index().to_csv(
+                    file_path, mode="a", header=False, index=False
+                )
+                new_row_count = len(new_rows)
+            logger.info(
+                "'%s' の差分データ %d 行を取得し、CSVファイルを更新しました: %s",
+                ticker,
+                new_row_count,
+                file_path,
+            )
+        else:
+            merged_df = cached_df
+
+        if merged_df.empty:
+            logger.warning("警告: '%s' のデータが取得できませんでした。", ticker)
+            return pd.DataFrame()
+
+        return merged_df[(merged_df.index >= start) & (merged_df.index < end)]
+
     def load_data_from_csv(self, ticker: str) -> pd.DataFrame:
         """
         CSVファイルから株価データをロードします。
         """
         file_path = os.path.join(self.data_dir, f"{ticker}.csv")
         if os.path.exists(file_path):
-            df = pd.read_csv(file_path, parse_dates=["Date"], index_col="Date")
+            # 取得時と同じ値に戻るよう、浮動小数点数は丸めずに読み込む
+            df = pd.read_csv(
+                file_path,
+                parse_dates=["Date"],
+                index_col="Date",
+                float_precision="round_trip",
+            )
             df.sort_index(inplace=True)
             return df
         else:
-            print(f"エラー: CSVファイルが見つかりません: {file_path}")
+            logger.error("エラー: CSVファイルが見つかりません: %s", file_path)
             return pd.DataFrame()
 
+    def load_data_from_store(
+        self,
+        tickers: list,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        columns: list | None = None,
+    ) -> dict:
+        """
+        列指向の価格ストアから、指定した銘柄・列・期間の株価データをロードします。
+
+        Args:
+            tickers (list): ティッカーシンボルのリスト。
+            start_date (str, optional): 開始日 (この日を含む)。
+            end_date (str, optional): 終了日 (この日を含まない)。
+            columns (list, optional): 読み込む列。省略時は全列。
+
+        Returns:
+            dict: 銘柄ごとの、インデックスがDateの株価データ。
+                ストアが銘柄別CSVより古い場合は空の辞書。
+        """
+        store = PriceStore(self.store_dir)
+        if store.exists():
+            store_mtime = os.path.getmtime(os.path.join(self.store_dir, MANIFEST_FILE))
+            stale_tickers = [
+                ticker
+                for ticker in tickers
+                if os.path.exists(os.path.join(self.data_dir, f"{ticker}.csv"))
+                and os.path.getmtime(os.path.join(self.data_dir, f"{ticker}.csv"))
+                > store_mtime
+            ]
+            if stale_tickers:
+                logger.error(
+                    "エラー: 価格ストア (%s) が銘柄別CSVより古いため読み込みません (%s)。"
+                    "python -m src.price_store --data-dir %s で作成し直してください。",
+                    self.store_dir,
+                    ", ".join(stale_tickers),
+                    self.data_dir,
+                )
+                return {}
+        return store.load(tickers, columns, start_date, end_date)
+
+    def compute_sma(self, close: pd.Series, window: int) -> pd.Series:
+        """
+        終値の単純移動平均を計算します。
+
+        Args:
+            close (pd.Series): 終値の系列。
+            window (int): 移動平均の期間。
+
+        Returns:
+            pd.Series: 単純移動平均 (期間に満たない先頭行は利用可能な値の平均)。
+        """
+        return close.rolling(window=window, min_periods=1).mean()
+
+    def compute_rsi(self, close: pd.Series, period: int) -> pd.Series:
+        """
+        終値のRSI (Relative Strength Index) を計算します。
+
+        Args:
+            close (pd.Series): 終値の系列。
+            period (int): RSIの計算期間。
+
+        Returns:
+            pd.Series: RSI。期間内に下落がない行は NaN になります。
+        """
+        delta = close.diff()
+        gain = delta.where(delta > 0, 0)
+        loss = -delta.where(delta < 0, 0)
+
+        avg_gain = gain.rolling(window=period, min_periods=1).mean()
+        avg_loss = loss.rolling(window=period, min_periods=1).mean()
+
+        rs = avg_gain / avg_loss.replace(0, np.nan)
+        return 100 - (100 / (1 + rs))
+
     def calculate_moving_averages(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         データフレームに短期および長期移動平均線を追加します。
         """
         if df.empty:
-            print(
+            logger.warning(
                 "警告: calculate_moving_averages に空のデータフレームが渡されました。"
             )
             return None
@@ -112,28 +527,32 @@ class DataManager:
         sma_short_col = f"SMA_{STRATEGIES['SMA_Strategy']['short_ma']}"  # 修正
         sma_long_col = f"SMA_{STRATEGIES['SMA_Strategy']['long_ma']}"  # 修正
 
-        print(
-            f"\n--- MA計算デバッグ: DataFrameサイズ={len(df_copy)}, 列={df_copy.columns.tolist()} ---"
-        )
-        print(
-            f"MA計算対象のデータ期間: {df_copy.index.min().strftime('%Y-%m-%d')} - {df_copy.index.max().strftime('%Y-%m-%d')}"
-        )
-        print(f"Close列の最初の5行:\n{df_copy['Close'].head()}")
+        # デバッグ情報の組み立て (期間の計算や head の整形) は出力する場合だけ行う
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "\n--- MA計算デバッグ: DataFrameサイズ=%d, 列=%s ---",
+                len(df_copy),
+                df_copy.columns.tolist(),
+            )
+            logger.debug(
+                "MA計算対象のデータ期間: %s - %s",
+                df_copy.index.min().strftime("%Y-%m-%d"),
+                df_copy.index.max().strftime("%Y-%m-%d"),
+            )
+            logger.debug("Close列の最初の5行:\n%s", df_copy["Close"].head())
 
         # 計算を実行
-        df_copy[sma_short_col] = (
-            df_copy["Close"]
-            .rolling(window=STRATEGIES["SMA_Strategy"]["short_ma"], min_periods=1)
-            .mean()  # 修正
+        df_copy[sma_short_col] = self.compute_sma(
+            df_copy["Close"], STRATEGIES["SMA_Strategy"]["short_ma"]
         )
-        df_copy[sma_long_col] = (
-            df_copy["Close"]
-            .rolling(window=STRATEGIES["SMA_Strategy"]["long_ma"], min_periods=1)
-            .mean()  # 修正
+        df_copy[sma_long_col] = self.compute_sma(
+            df_copy["Close"], STRATEGIES["SMA_Strategy"]["long_ma"]
         )
 
-        print(
-            f"MA計算後デバッグ: DataFrameサイズ={len(df_copy)}, 新しい列={df_copy.columns.tolist()}"
+        logger.debug(
+            "MA計算後デバッグ: DataFrameサイズ=%d, 新しい列=%s",
+            len(df_copy),
+            df_copy.columns.tolist(),
         )
 
         cols_to_check = []
@@ -144,34 +563,38 @@ class DataManager:
         ):
             cols_to_check.append(sma_short_col)
         else:
-            print(
-                f"警告: SMA列 '{sma_short_col}' がデータフレームに作成されないか、全てNaNです。このSMA列はdropnaの対象外とします。"
+            logger.warning(
+                "警告: SMA列 '%s' がデータフレームに作成されないか、全てNaNです。このSMA列はdropnaの対象外とします。",
+                sma_short_col,
             )
 
         if sma_long_col in df_copy.columns and not df_copy[sma_long_col].isnull().all():
             cols_to_check.append(sma_long_col)
         else:
-            print(
-                f"警告: SMA列 '{sma_long_col}' がデータフレームに作成されないか、全てNaNです。このSMA列はdropnaの対象外とします。"
+            logger.warning(
+                "警告: SMA列 '%s' がデータフレームに作成されないか、全てNaNです。このSMA列はdropnaの対象外とします。",
+                sma_long_col,
             )
 
         if not cols_to_check:
-            print(
+            logger.warning(
                 "警告: 短期および長期移動平均線のいずれも有効なデータを含みません。計算をスキップしNoneを返します。"
             )
             return None
 
-        print(f"dropna対象の列: {cols_to_check}")
+        logger.debug("dropna対象の列: %s", cols_to_check)
         df_copy.dropna(subset=cols_to_check, inplace=True)
 
         if df_copy.empty:
-            print(
+            logger.warning(
                 "警告: 移動平均線計算後にデータフレームが空になりました。原因: NaNが多い。"
             )
             return None
 
-        print(
-            f"MA計算とdropna後デバッグ: DataFrameサイズ={len(df_copy)}, 列={df_copy.columns.tolist()} ---"
+        logger.debug(
+            "MA計算とdropna後デバッグ: DataFrameサイズ=%d, 列=%s ---",
+            len(df_copy),
+            df_copy.columns.tolist(),
         )
         return df_copy
 
@@ -180,52 +603,52 @@ class DataManager:
         データフレームにRSI (Relative Strength Index) を追加します。
         """
         if df.empty:
-            print("警告: calculate_rsi に空のデータフレームが渡されました。")
+            logger.warning("警告: calculate_rsi に空のデータフレームが渡されました。")
             return None
 
         df_copy = df.copy()
 
-        print(
-            f"\n--- RSI計算デバッグ: DataFrameサイズ={len(df_copy)}, 列={df_copy.columns.tolist()} ---"
-        )
-        print(
-            f"RSI計算対象のデータ期間: {df_copy.index.min().strftime('%Y-%m-%d')} - {df_copy.index.max().strftime('%Y-%m-%d')}"
-        )
-        print(f"Close列の最初の5行:\n{df_copy['Close'].head()}")
-
-        delta = df_copy["Close"].diff()
-        gain = delta.where(delta > 0, 0)
-        loss = -delta.where(delta < 0, 0)
-
-        # ここで RSI_PERIOD が定義されていないというエラーが出ていました
-        avg_gain = gain.rolling(
-            window=STRATEGIES["RSI_Strategy"]["rsi_period"], min_periods=1
-        ).mean()  # 修正
-        avg_loss = loss.rolling(
-            window=STRATEGIES["RSI_Strategy"]["rsi_period"], min_periods=1
-        ).mean()  # 修正
-
-        rs = avg_gain / avg_loss.replace(0, np.nan)
-        df_copy["RSI"] = 100 - (100 / (1 + rs))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "\n--- RSI計算デバッグ: DataFrameサイズ=%d, 列=%s ---",
+                len(df_copy),
+                df_copy.columns.tolist(),
+            )
+            logger.debug(
+                "RSI計算対象のデータ期間: %s - %s",
+                df_copy.index.min().strftime("%Y-%m-%d"),
+                df_copy.index.max().strftime("%Y-%m-%d"),
+            )
+            logger.debug("Close列の最初の5行:\n%s", df_copy["Close"].head())
 
-        print(
-            f"RSI計算後デバッグ: DataFrameサイズ={len(df_copy)}, 新しい列={df_copy.columns.tolist()}"
+        df_copy["RSI"] = self.compute_rsi(
+            df_copy["Close"], STRATEGIES["RSI_Strategy"]["rsi_period"]
         )
-        if "RSI" in df_copy.columns:
-            print(f"RSIのNaN数: {df_copy['RSI'].isnull().sum()}")
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "RSI計算後デバッグ: DataFrameサイズ=%d, 新しい列=%s",
+                len(df_copy),
+                df_copy.columns.tolist(),
+            )
+            logger.debug("RSIのNaN数: %d", df_copy["RSI"].isnull().sum())
 
         if "RSI" not in df_copy.columns or df_copy["RSI"].isnull().all():
-            print(
+            logger.warning(
                 "警告: RSI列がデータフレームに作成されないか、全てNaNです。計算をスキップします。"
             )
             return None
 
         df_copy.dropna(subset=["RSI"], inplace=True)
         if df_copy.empty:
-            print("警告: RSI計算後にデータフレームが空になりました。原因: NaNが多い。")
+            logger.warning(
+                "警告: RSI計算後にデータフレームが空になりました。原因: NaNが多い。"
+            )
             return None
 
-        print(
-            f"RSI計算とdropna後デバッグ: DataFrameサイズ={len(df_copy)}, 列={df_copy.columns.tolist()} ---"
+        logger.debug(
+            "RSI計算とdropna後デバッグ: DataFrameサイズ=%d, 列=%s ---",
+            len(df_copy),
+            df_copy.columns.tolist(),
         )
         return df_copy
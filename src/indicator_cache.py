@@ -0,0 +1,272 @@
+# stock_trading_bot/src/indicator_cache.py
+
+import hashlib
+
+import pandas as pd
+
+from .data_manager import DataManager
+from .logger import get_logger
+from .strategy_registry import indicator_column
+
+logger = get_logger(__name__)
+
+
+class IndicatorCache:
+    """
+    銘柄ごとのテクニカル指標を全期間で一度だけ計算し、再利用するキャッシュ。
+
+    キーは (銘柄, 指標名, パラメータ, データバージョン) です。データバージョンは
+    生データの内容から計算したハッシュで、同じ銘柄でもデータが更新された場合は
+    別のキーとして扱われます。ウォークフォワードの各期間では、キャッシュした
+    全期間の系列から必要な期間だけをスライスして利用します。
+    """
+
+    def __init__(self, data_manager: DataManager):
+        """
+        IndicatorCacheのコンストラクタ。
+
+        Args:
+            data_manager (DataManager): 指標の計算に使用するDataManager。
+        """
+        self.data_manager = data_manager
+        self._raw_dfs = {}  # 銘柄 -> 生データ (インデックスはDate)
+        self._versions = {}  # 銘柄 -> データバージョン
+        self._entries = {}  # (銘柄, 指標名, パラメータ, データバージョン) -> 計算結果
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def compute_data_version(df: pd.DataFrame) -> str:
+        """
+        データフレームの内容からデータバージョン (ハッシュ文字列) を計算します。
+
+        Args:
+            df (pd.DataFrame): 生の株価データ。
+
+        Returns:
+            str: データバージョン。
+        """
+        row_hashes = pd.util.hash_pandas_object(df, index=True).to_numpy()
+        return hashlib.sha1(row_hashes.tobytes()).hexdigest()[:16]
+
+    def register(self, ticker: str, df: pd.DataFrame) -> str:
+        """
+        銘柄の生データを登録し、データバージョンを返します。
+
+        データバージョンが変わった場合、その銘柄の古いキャッシュは破棄されます。
+
+        Args:
+            ticker (str): ティッカーシンボル。
+            df (pd.DataFrame): インデックスがDateの生の株価データ。
+
+        Returns:
+            str: 登録したデータのデータバージョン。
+        """
+        version = self.compute_data_version(df)
+        if self._versions.get(ticker) != version:
+            self._entries = {
+                key: value for key, value in self._entries.items() if key[0] != ticker
+            }
+        self._raw_dfs[ticker] = df
+        self._versions[ticker] = version
+        return version
+
+    def _get_or_compute(self, ticker: str, indicator: str, params: tuple, compute):
+        """
+        キャッシュから値を取得し、存在しない場合は計算して保存します。
+
+        Args:
+            ticker (str): ティッカーシンボル。
+            indicator (str): 指標名。
+            params (tuple): 指標のパラメータ。
+            compute (Callable[[], object]): キャッシュミス時に呼び出す計算関数。
+
+        Returns:
+            object: キャッシュされた計算結果。
+        """
+        key = (ticker, indicator, params, self._versions[ticker])
+        if key in self._entries:
+            self.hits += 1
+            return self._entries[key]
+
+        self.misses += 1
+        value = compute()
+        self._entries[key] = value
+        return value
+
+    def get_sma(self, ticker: str, window: int) -> pd.Series:
+        """
+        登録済み銘柄の全期間の単純移動平均を取得します。
+
+        Args:
+            ticker (str): ティッカーシンボル。
+            window (int): 移動平均の期間。
+
+        Returns:
+            pd.Series: 全期間の単純移動平均。
+        """
+        return self._get_or_compute(
+            ticker,
+            "SMA",
+            (window,),
+            lambda: self.data_manager.compute_sma(
+                self._raw_dfs[ticker]["Close"], window
+            ),
+        )
+
+    def get_rsi(self, ticker: str, period: int) -> pd.Series:
+        """
+        登録済み銘柄の全期間のRSIを取得します。
+
+        Args:
+            ticker (str): ティッカーシンボル。
+            period (int): RSIの計算期間。
+
+        Returns:
+            pd.Series: 全期間のRSI。
+        """
+        return self._get_or_compute(
+            ticker,
+            "RSI",
+            (period,),
+            lambda: self.data_manager.compute_rsi(
+                self._raw_dfs[ticker]["Close"], period
+            ),
+        )
+
+    def get_indicator(self, ticker: str, indicator: tuple) -> pd.Series:
+        """
+        登録済み銘柄の全期間の指標を、指標の指定 (指標名, パラメータ) から取得します。
+
+        Args:
+            ticker (str): ティッカーシンボル。
+            indicator (tuple): 指標の指定 (例: ("SMA", (5,)), ("RSI", (14,)))。
+
+        Returns:
+            pd.Series: 全期間の指標。未知の指標の場合はNone。
+        """
+        name, params = indicator
+        if name == "SMA":
+            return self.get_sma(ticker, *params)
+        if name == "RSI":
+            return self.get_rsi(ticker, *params)
+        logger.warning("警告: 未知の指標 '%s' が指定されました。", name)
+        return None
+
+    def get_indicators_frame(self, ticker: str, indicators: list):
+        """
+        生データに、指定した全ての指標の列を加えた全期間の処理済みデータを取得します。
+
+        複数の戦略が必要とする指標の和集合 (strategy_registry.required_indicators)
+        を渡すと、共通の指標は1回だけ計算され、全戦略が同じ行の範囲で
+        シグナルを計算できるデータになります。列名は
+        strategy_registry.indicator_column (例: 'SMA_5', 'RSI_14') です。
+
+        Args:
+            ticker (str): ティッカーシンボル。
+            indicators (list[tuple]): 指標の指定のリスト。
+
+        Returns:
+            pd.DataFrame | None: 'Date' 列を持つ処理済みデータ。
+                有効な行がない場合はNone。
+        """
+        return self._get_or_compute(
+            ticker,
+            "Indicators",
+            tuple(indicators),
+            lambda: self._build_indicators_frame(ticker, indicators),
+        )
+
+    def _build_indicators_frame(self, ticker: str, indicators: list):
+        """
+        キャッシュ済みの系列から、指定した指標の列を持つ処理済みデータを組み立てます。
+
+        Args:
+            ticker (str): ティッカーシンボル。
+            indicators (list[tuple]): 指標の指定のリスト。
+
+        Returns:
+            pd.DataFrame | None: 'Date' 列を持つ処理済みデータ、またはNone。
+        """
+        df = self._raw_dfs[ticker].copy()
+        columns = []
+        for indicator in indicators:
+            series = self.get_indicator(ticker, indicator)
+            if series is None:
+                continue
+            column = indicator_column(indicator)
+            df[column] = series
+            columns.append(column)
+
+        df.dropna(subset=columns, inplace=True)
+        if df.empty:
+            logger.warning(
+                "警告: %s の指標計算後にデータフレームが空になりました。", ticker
+            )
+            return None
+
+        df.reset_index(inplace=True)
+        return df
+
+    def get_indicator_frame(
+        self, ticker: str, short_ma: int, long_ma: int, rsi_period: int
+    ):
+        """
+        生データにSMA (短期・長期) とRSIの列を加えた全期間の処理済みデータを取得します。
+
+        get_indicators_frame に SMA/RSI の指標の指定を渡す簡易版で、列名も同じ
+        (例: 'SMA_5', 'SMA_20', 'RSI_14') です。
+
+        Args:
+            ticker (str): ティッカーシンボル。
+            short_ma (int): 短期移動平均線の期間。
+            long_ma (int): 長期移動平均線の期間。
+            rsi_period (int): RSIの計算期間。
+
+        Returns:
+            pd.DataFrame | None: 'Date' 列を持つ処理済みデータ。
+                有効な行がない場合はNone。
+        """
+        indicators = [("SMA", (short_ma,)), ("SMA", (long_ma,)), ("RSI", (rsi_period,))]
+        return self.get_indicators_frame(ticker, list(dict.fromkeys(indicators)))
+
+    @staticmethod
+    def slice_period(frame: pd.DataFrame, start_date, end_date) -> pd.DataFrame:
+        """
+        'Date' 列で昇順に並んだ処理済みデータから [start_date, end_date) を切り出します。
+
+        Args:
+            frame (pd.DataFrame): get_indicators_frame で取得した処理済みデータ。
+            start_date (pd.Timestamp): 開始日 (この日を含む)。
+            end_date (pd.Timestamp): 終了日 (この日を含まない)。
+
+        Returns:
+            pd.DataFrame: 期間内の行のコピー。
+        """
+        dates = frame["Date"]
+        start = dates.searchsorted(start_date, side="left")
+        stop = dates.searchsorted(end_date, side="left")
+        return frame.iloc[start:stop].copy()
+
+    def add_stats(self, stats: dict):
+        """
+        他のプロセスで発生したヒット/ミス件数を集計に加えます。
+
+        Args:
+            stats (dict): 'hits' と 'misses' を含む辞書。
+        """
+        self.hits += stats.get("hits", 0)
+        self.misses += stats.get("misses", 0)
+
+    def stats(self) -> dict:
+        """
+        キャッシュのヒット/ミス件数を返します。
+
+        Returns:
+            dict: 'hits', 'misses', 'entries' を含む辞書。
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+        }
@@ -0,0 +1,213 @@
+# stock_trading_bot/src/ledger.py
+
+import numpy as np
+import pandas as pd
+
+# 最初に確保する行数 (不足したら2倍ずつ拡張する)
+LEDGER_INITIAL_CAPACITY = 1024
+
+# 売買区分の値 (シグナルと同じく 1: 買い, -1: 売り)
+SIDE_BUY = 1
+SIDE_SELL = -1
+
+# to_frame が返す列 (Backtester の取引履歴と同じ並び)
+TRADE_COLUMNS = [
+    "Date",
+    "Ticker",
+    "Trade_Type",
+    "Price",
+    "Shares",
+    "Cash_Left",
+    "Portfolio_Value",
+]
+
+
+class TradeLedger:
+    """
+    取引履歴を列ごとの型付き配列で保持する台帳。
+
+    1件ごとに辞書を作る代わりに、日付 (ナノ秒の整数)、銘柄ID、売買区分、
+    価格、株数、取引後の現金、ポートフォリオ価値をそれぞれNumPy配列へ
+    書き込みます。配列は容量が不足したときに2倍へ拡張するため、追加は
+    償却 O(1) です。銘柄名は銘柄IDの表で1回だけ保持します。
+
+    以前の取引履歴 (辞書のリスト) と同じく、`len`、インデックス・スライス
+    による参照、反復では TRADE_COLUMNS をキーとする辞書を返すため、
+    `pd.DataFrame(ledger)` も使えます。取引の追加は辞書ではなく
+    `append` の引数で渡します。
+    """
+
+    def __init__(
+        self, tickers: list | None = None, capacity: int = LEDGER_INITIAL_CAPACITY
+    ):
+        """
+        TradeLedgerのコンストラクタ。
+
+        Args:
+            tickers (list, optional): 事前に銘柄IDを割り当てる銘柄のリスト。
+                含まれない銘柄は追加時に割り当てます。
+            capacity (int): 最初に確保する行数。
+        """
+        self.tickers = []
+        self._ticker_ids = {}
+        for ticker in tickers or []:
+            self._ticker_id(ticker)
+
+        capacity = max(1, int(capacity))
+        self._dates = np.empty(capacity, dtype=np.int64)
+        self._ticker_id_column = np.empty(capacity, dtype=np.int32)
+        self._sides = np.empty(capacity, dtype=np.int8)
+        self._prices = np.empty(capacity, dtype=np.float64)
+        self._shares = np.empty(capacity, dtype=np.int64)
+        self._cash = np.empty(capacity, dtype=np.float64)
+        self._values = np.empty(capacity, dtype=np.float64)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index):
+        """
+        取引を辞書 (スライスの場合は辞書のリスト) で返します。
+
+        Args:
+            index (int | slice): 取引の位置 (負の値は末尾から)。
+
+        Returns:
+            dict | list[dict]: TRADE_COLUMNS をキーとする取引。
+        """
+        if isinstance(index, slice):
+            return [self._record(i) for i in range(*index.indices(self._size))]
+        i = int(index)
+        if i < 0:
+            i += self._size
+        if not 0 <= i < self._size:
+            raise IndexError(f"取引の位置が範囲外です: {index}")
+        return self._record(i)
+
+    def __iter__(self):
+        for i in range(self._size):
+            yield self._record(i)
+
+    def _record(self, i: int) -> dict:
+        """
+        i 番目の取引を、以前の取引履歴と同じ形式の辞書で返します。
+
+        Args:
+            i (int): 取引の位置 (0 <= i < len(self))。
+
+        Returns:
+            dict: TRADE_COLUMNS をキーとする取引。
+        """
+        return {
+            "Date": pd.Timestamp(self._dates[i]),
+            "Ticker": self.tickers[self._ticker_id_column[i]],
+            "Trade_Type": "BUY" if self._sides[i] == SIDE_BUY else "SELL",
+            "Price": float(self._prices[i]),
+            "Shares": int(self._shares[i]),
+            "Cash_Left": float(self._cash[i]),
+            "Portfolio_Value": float(self._values[i]),
+        }
+
+    @property
+    def capacity(self) -> int:
+        """確保済みの行数。"""
+        return len(self._dates)
+
+    def _ticker_id(self, ticker: str) -> int:
+        """
+        銘柄のIDを返します。未登録の銘柄には新しいIDを割り当てます。
+
+        Args:
+            ticker (str): ティッカーシンボル。
+
+        Returns:
+            int: 銘柄ID。
+        """
+        ticker_id = self._ticker_ids.get(ticker)
+        if ticker_id is None:
+            ticker_id = len(self.tickers)
+            self._ticker_ids[ticker] = ticker_id
+            self.tickers.append(ticker)
+        return ticker_id
+
+    def _grow(self):
+        """
+        全ての列の容量を2倍に拡張します。
+        """
+        capacity = self.capacity * 2
+        for name in (
+            "_dates",
+            "_ticker_id_column",
+            "_sides",
+            "_prices",
+            "_shares",
+            "_cash",
+            "_values",
+        ):
+            column = getattr(self, name)
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[: self._size] = column[: self._size]
+            setattr(self, name, grown)
+
+    def append(
+        self,
+        date: pd.Timestamp,
+        ticker: str,
+        side: int,
+        price: float,
+        shares: int,
+        cash: float,
+        value: float,
+    ):
+        """
+        取引を1件追加します。
+
+        Args:
+            date (pd.Timestamp): 取引日。
+            ticker (str): ティッカーシンボル。
+            side (int): 売買区分 (SIDE_BUY または SIDE_SELL)。
+            price (float): 約定価格。
+            shares (int): 株数 (売りの場合は売却後の保有数)。
+            cash (float): 取引後の現金。
+            value (float): 取引後のポートフォリオ価値。
+        """
+        if self._size == self.capacity:
+            self._grow()
+        i = self._size
+        self._dates[i] = pd.Timestamp(date).value
+        self._ticker_id_column[i] = self._ticker_id(ticker)
+        self._sides[i] = side
+        self._prices[i] = price
+        self._shares[i] = shares
+        self._cash[i] = cash
+        self._values[i] = value
+        self._size += 1
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        取引履歴をDataFrameに変換します。
+
+        数値と日付の列はコピーせず、台帳の配列のビューをそのまま使います。
+        そのため、返したDataFrameの値を書き換えると台帳の値も変わります。
+
+        Returns:
+            pd.DataFrame: TRADE_COLUMNS の列を持つ取引履歴。
+        """
+        n = self._size
+        tickers = np.array(self.tickers, dtype=object)
+        return pd.DataFrame(
+            {
+                "Date": self._dates[:n].view("datetime64[ns]"),
+                "Ticker": tickers[self._ticker_id_column[:n]],
+                "Trade_Type": np.where(
+                    self._sides[:n] == SIDE_BUY, "BUY", "SELL"
+                ).astype(object),
+                "Price": self._prices[:n],
+                "Shares": self._shares[:n],
+                "Cash_Left": self._cash[:n],
+                "Portfolio_Value": self._values[:n],
+            },
+            columns=TRADE_COLUMNS,
+            copy=False,
+        )
@@ -0,0 +1,61 @@
+# stock_trading_bot/src/logger.py
+
+import logging
+import os
+import sys
+
+from .config import LOG_FILE, LOG_LEVEL
+
+# 全モジュールのロガーの親となるロガー名
+ROOT_LOGGER_NAME = "stock_trading_bot"
+
+# ライブラリとして使われた場合 (setup_logging を呼ばない場合) は何も出力しない
+logging.getLogger(ROOT_LOGGER_NAME).addHandler(logging.NullHandler())
+
+
+def get_logger(module_name: str) -> logging.Logger:
+    """
+    モジュール用のロガーを取得します。
+
+    'src.data_manager' のようなモジュール名から、共通の親ロガーの子
+    ('stock_trading_bot.data_manager') を返します。
+
+    Args:
+        module_name (str): モジュール名 (通常は __name__)。
+
+    Returns:
+        logging.Logger: モジュール用のロガー。
+    """
+    return logging.getLogger(f"{ROOT_LOGGER_NAME}.{module_name.rsplit('.', 1)[-1]}")
+
+
+def setup_logging(level=LOG_LEVEL, log_file: str = LOG_FILE):
+    """
+    ログの出力レベルと出力先を設定します。
+
+    画面 (標準出力) にはメッセージ本文のみを出力し (従来の print と同じ見た目)、
+    ログファイルを指定した場合は時刻・レベル・モジュール名付きで追記します。
+    複数回呼び出した場合は、前回の設定を置き換えます。
+
+    Args:
+        level (str | int): 出力するログレベル ('DEBUG', 'INFO', 'WARNING' など)。
+        log_file (str, optional): ログファイルのパス。None なら画面のみ。
+    """
+    root_logger = logging.getLogger(ROOT_LOGGER_NAME)
+    root_logger.setLevel(level)
+    for handler in list(root_logger.handlers):
+        if not isinstance(handler, logging.NullHandler):
+            root_logger.removeHandler(handler)
+            handler.close()
+
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(logging.Formatter("%(message)s"))
+    root_logger.addHandler(console_handler)
+
+    if log_file:
+        os.makedirs(os.path.dirname(log_file) or ".", exist_ok=True)
+        file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        file_handler.setFormatter(
+            logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+        )
+        root_logger.addHandler(file_handler)
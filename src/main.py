@@ -1,47 +1,225 @@
 # stock_trading_bot/src/main.py
 
-from datetime import timedelta
+import argparse
 
 import pandas as pd
 
-from .backtester import Backtester
+from .chart_batch import CHART_MODES, generate_charts
 from .config import (
+    BATCH_LOG_LEVEL,
+    CHART_BATCH_MODE,
+    DATA_FETCH_MODE,
+    DATA_PROVIDER,
     END_DATE,
     INITIAL_CASH,
     LEVERAGE_RATIO,
+    LOG_FILE,
+    LOG_LEVEL,
+    METRICS_FILE,
+    OPTIMIZATION_CACHE_ENABLED,
     OPTIMIZATION_WINDOW_DAYS,
     PLOT_FILE_NAME,
+    PLOT_HEADLESS,
+    ROBUSTNESS_ENABLED,
     START_DATE,
     STRATEGIES,
+    SYNTHETIC_DATA_DIR,
+    SYNTHETIC_TICKER_COUNT,
     TEST_WINDOW_DAYS,
     TICKER_SYMBOLS,
+    WALK_FORWARD_MAX_WORKERS,
     WALK_FORWARD_STEP_DAYS,
 )
 from .data_manager import DataManager
+from .indicator_cache import IndicatorCache
+from .logger import get_logger, setup_logging
+from .metrics import StageMetrics
+from .optimization_cache import OptimizationCache
+from .profiler import RunProfiler
 from .report_generator import ReportGenerator
+from .robustness import RobustnessAnalyzer
 from .strategy_manager import StrategyManager
+from .synthetic_data import SyntheticDataProvider
 from .visualizer import Visualizer
+from .walk_forward import generate_walk_forward_windows, run_walk_forward
 
+logger = get_logger(__name__)
 
-def main():
+
+def parse_args(argv: list | None = None) -> argparse.Namespace:
+    """
+    コマンドライン引数を解析します。
+
+    Args:
+        argv (list, optional): コマンドライン引数。省略時は sys.argv。
+
+    Returns:
+        argparse.Namespace: 解析結果。
+    """
+    parser = argparse.ArgumentParser(
+        description="ウォークフォワード最適化による株価自動取引シミュレーションを実行します。"
+    )
+    parser.add_argument(
+        "--log-level",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        help=f"ログの出力レベル (省略時は {LOG_LEVEL}、--batch 指定時は {BATCH_LOG_LEVEL})",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="バッチモード: 警告とエラー以外のログを出力せず、グラフを画面に表示しない",
+    )
+    parser.add_argument("--log-file", default=LOG_FILE, help="ログファイルのパス")
+    parser.add_argument(
+        "--metrics-file",
+        default=METRICS_FILE,
+        help="処理段階ごとの実行時間を保存するJSONファイルのパス",
+    )
+    parser.add_argument(
+        "--charts",
+        choices=CHART_MODES,
+        default=CHART_BATCH_MODE,
+        help="銘柄ごと (ticker)、テスト期間×銘柄ごと (window)、または両方 (both) の"
+        "シグナルチャートを一括で出力する",
+    )
+    parser.add_argument(
+        "--robustness",
+        action="store_true",
+        default=ROBUSTNESS_ENABLED,
+        help="日次リターンのブートストラップで最終価値・最大ドローダウンの分布を評価する",
+    )
+    parser.add_argument(
+        "--no-optimization-cache",
+        dest="optimization_cache",
+        action="store_false",
+        default=OPTIMIZATION_CACHE_ENABLED,
+        help="パラメータ最適化の結果をキャッシュから再利用せず、毎回最適化する",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="cProfile と tracemalloc で実行全体を計測し、結果を output/ に保存する"
+        " (計測のためウォークフォワードは逐次実行)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list | None = None):
     """
     株価自動取引シミュレーションのメイン実行関数です。
     ウォークフォワード最適化に基づいた、日次更新を想定したシミュレーションを行います。
+
+    Args:
+        argv (list, optional): コマンドライン引数。省略時は sys.argv。
     """
-    print("--- 株価自動取引シミュレーションを開始します ---")
+    args = parse_args(argv)
+    setup_logging(
+        args.log_level or (BATCH_LOG_LEVEL if args.batch else LOG_LEVEL),
+        args.log_file,
+    )
+    metrics = StageMetrics()
+
+    max_workers = WALK_FORWARD_MAX_WORKERS
+    profiler = None
+    if args.profile:
+        # ワーカープロセス内の処理は計測できないため、プロファイル時は逐次実行する
+        max_workers = 1
+        profiler = RunProfiler()
+        profiler.start()
+
+    optimization_cache = OptimizationCache() if args.optimization_cache else None
+
+    try:
+        run_simulation(
+            metrics,
+            max_workers,
+            profiler,
+            optimization_cache,
+            headless=PLOT_HEADLESS or args.batch,
+            chart_mode=args.charts,
+            robustness=args.robustness,
+        )
+    finally:
+        if profiler is not None:
+            profiler.take_snapshot("end")
+            profiler.stop()
+            profiler.write_reports()
+
+    # 処理段階ごとの実行時間をJSONに保存し、段階別の合計を表示する
+    if args.metrics_file:
+        metrics.dump(args.metrics_file)
+        logger.info("処理段階ごとの実行時間を保存しました: %s", args.metrics_file)
+    for stage, stats in metrics.summary().items():
+        logger.info(
+            "  %-10s 合計 %8.3f 秒 (%d 件, 最大 %.3f 秒)",
+            stage,
+            stats["total_seconds"],
+            stats["count"],
+            stats["max_seconds"],
+        )
 
-    data_manager = DataManager()
-    strategy_manager = StrategyManager()
+    logger.info("\n--- シミュレーションが完了しました ---")
+
+
+def run_simulation(
+    metrics: StageMetrics,
+    max_workers: int,
+    profiler: RunProfiler | None = None,
+    optimization_cache: OptimizationCache | None = None,
+    headless: bool = PLOT_HEADLESS,
+    chart_mode: str = CHART_BATCH_MODE,
+    robustness: bool = ROBUSTNESS_ENABLED,
+):
+    """
+    データ取得からウォークフォワード最適化、グラフ・レポート出力までを実行します。
+
+    Args:
+        metrics (StageMetrics): 処理段階ごとの実行時間を記録するメトリクス。
+        max_workers (int): ウォークフォワードのワーカープロセス数。
+        profiler (RunProfiler, optional): プロファイル時に、ウォークフォワード
+            直後のメモリのスナップショットを記録するプロファイラ。
+        optimization_cache (OptimizationCache, optional): パラメータ最適化の
+            結果を再利用するディスクキャッシュ。
+        headless (bool): True の場合はグラフを画面に表示せず、保存のみ行う。
+        chart_mode (str, optional): 銘柄・期間ごとのチャートの出力単位
+            ("ticker", "window", "both")。None の場合は出力しない。
+        robustness (bool): True の場合、日次リターンのブートストラップで
+            結果の分布を評価する。
+    """
+    logger.info("--- 株価自動取引シミュレーションを開始します ---")
+
+    if DATA_PROVIDER == "synthetic":
+        # ネットワークを使わず、疑似データで全体のパイプラインを実行する
+        tickers = SyntheticDataProvider.make_tickers(SYNTHETIC_TICKER_COUNT)
+        data_manager = DataManager(
+            provider=SyntheticDataProvider(),
+            data_dir=SYNTHETIC_DATA_DIR,
+            metrics=metrics,
+        )
+    else:
+        tickers = TICKER_SYMBOLS
+        data_manager = DataManager(metrics=metrics)
+    strategy_manager = StrategyManager(optimization_cache=optimization_cache)
 
     # 全期間の生データを一度取得・更新 (後でウォークフォワード用に分割)
     # config.START_DATE と config.END_DATE を使って全期間のデータを取得
-    print(f"データ取得期間: {START_DATE} から {END_DATE}")
-    raw_dfs = data_manager.fetch_multiple_data_from_yfinance(
-        TICKER_SYMBOLS, START_DATE, END_DATE
-    )
+    logger.info("データ取得期間: %s から %s", START_DATE, END_DATE)
+    with metrics.timer("fetch"):
+        if DATA_FETCH_MODE == "store":
+            # 列指向の価格ストアから必要な銘柄・期間だけを読み込む
+            raw_dfs = data_manager.load_data_from_store(tickers, START_DATE, END_DATE)
+        elif DATA_FETCH_MODE == "incremental":
+            # 既存CSVを読み込み、不足期間だけを並行して取得する
+            raw_dfs = data_manager.fetch_multiple_data_incremental(
+                tickers, START_DATE, END_DATE
+            )
+        else:
+            raw_dfs = data_manager.fetch_multiple_data_from_yfinance(
+                tickers, START_DATE, END_DATE
+            )
 
     if not raw_dfs:
-        print("データ取得に失敗しました。終了します。")
+        logger.error("データ取得に失敗しました。終了します。")
         return
 
     # 最初の最適化開始日を決定
@@ -51,256 +229,87 @@ def main():
         df for df in raw_dfs.values() if df is not None and not df.empty
     ]
     if not valid_dfs_for_min_max_date:
-        print("有効なデータが見つかりませんでした。終了します。")
+        logger.error("有効なデータが見つかりませんでした。終了します。")
         return
 
     # データフレームのインデックス (Date) から最小値と最大値を取得
     min_date = min(df.index.min() for df in valid_dfs_for_min_max_date)
     max_date = max(df.index.max() for df in valid_dfs_for_min_max_date)
-    print(
-        f"全銘柄のデータ最小日: {min_date.strftime('%Y-%m-%d')}, 最大日: {max_date.strftime('%Y-%m-%d')}"
+    logger.info(
+        "全銘柄のデータ最小日: %s, 最大日: %s",
+        min_date.strftime("%Y-%m-%d"),
+        max_date.strftime("%Y-%m-%d"),
     )
 
-    current_optimization_start_date = min_date
-
-    # ウォークフォワードシミュレーションの結果を保存するためのリスト
-    # ★ここから追加/修正★
-    all_walk_forward_results = []  # 各テスト期間のサマリー結果
-    all_walk_forward_trades = pd.DataFrame()  # 全期間の統合された取引履歴
-    all_walk_forward_portfolio_dfs = []  # 各テスト期間のポートフォリオ推移DF
-    # ★ここまで追加/修正★
-
-    # ウォークフォワードループ
-    while True:
-        # ウォークフォワードのウィンドウを定義
-        # 最適化期間の終了日は、開始日 + OPTIMIZATION_WINDOW_DAYS
-        optimization_end_date = current_optimization_start_date + timedelta(
-            days=OPTIMIZATION_WINDOW_DAYS
-        )
-        # テスト期間の開始日は最適化期間の「次の日」
-        test_start_date = optimization_end_date + timedelta(days=1)
-        # テスト期間の終了日は、テスト期間の開始日 + TEST_WINDOW_DAYS
-        test_end_date = test_start_date + timedelta(days=TEST_WINDOW_DAYS)
-
-        # テスト期間が全データ期間を超過したら終了
-        # データがない期間で最適化・テストを試みないようにする
-        if (
-            optimization_end_date > max_date
-            or test_start_date >= test_end_date
-            or test_start_date > max_date
-        ):
-            print("\nウォークフォワード最適化が全データ期間をカバーしました。")
-            break
-
-        print(
-            f"\n--- ウォークフォワード期間: 最適化期間 [{current_optimization_start_date.strftime('%Y-%m-%d')} - {optimization_end_date.strftime('%Y-%m-%d')}] ---"
-        )
-        print(
-            f"--- テスト期間: [{test_start_date.strftime('%Y-%m-%d')} - {test_end_date.strftime('%Y-%m-%d')}] ---"
-        )
-
-        # 各銘柄のデータを最適化期間とテスト期間に分割
-        current_processed_dfs_for_optimization = {}
-        current_processed_dfs_for_test = {}
-
-        # 生データに対して一度MA/RSIを計算し、それを期間で区切る
-        # ここで `full_processed_dfs` は、各銘柄の全期間に対して指標を計算したものを一時的に保持
-        full_processed_dfs = {}
-        for ticker, df in raw_dfs.items():
-            if df is None or df.empty:
-                print(
-                    f"警告: {ticker} の生データが空またはNoneです。この銘柄の処理をスキップします。"
-                )
-                continue
-
-            df_copy = df.copy()
-            # MA/RSI計算はインデックスベースで行われる
-            print(
-                f"--- {ticker} 全期間データ（MA計算前）のサイズ: {len(df_copy)}, 列: {df_copy.columns.tolist()} ---"
-            )
-            df_ma = data_manager.calculate_moving_averages(df_copy)
-            if df_ma is None:  # calculate_moving_averagesがNoneを返す場合
-                print(
-                    f"!! 致命的警告: {ticker} の全期間MA計算が失敗し、Noneが返されました。この銘柄をスキップします。"
-                )
-                continue
-
-            print(
-                f"--- {ticker} 全期間データ（MA計算後）のサイズ: {len(df_ma)}, 列: {df_ma.columns.tolist()} ---"
+    # 指標は銘柄ごとに全期間で一度だけ計算し、各ウォークフォワード期間ではスライスして使う
+    indicator_cache = IndicatorCache(data_manager)
+    rsi_period = STRATEGIES["RSI_Strategy"]["rsi_period"]
+
+    # ここで `full_processed_dfs` は、各銘柄の全期間に対して指標を計算したものを保持
+    full_processed_dfs = {}
+    for ticker, df in raw_dfs.items():
+        if df is None or df.empty:
+            logger.warning(
+                "警告: %s の生データが空またはNoneです。この銘柄の処理をスキップします。",
+                ticker,
             )
-            df_final = data_manager.calculate_rsi(df_ma)
-            if df_final is None:  # calculate_rsiがNoneを返す場合
-                print(
-                    f"!! 致命的警告: {ticker} の全期間RSI計算が失敗し、Noneが返されました。この銘柄をスキップします。"
-                )
-                continue
+            continue
 
-            # strategy_manager が 'Date' 列を必要とするため、ここでインデックスをリセット
-            df_final.reset_index(inplace=True)
-            full_processed_dfs[ticker] = df_final
-            print(
-                f"--- {ticker} 全期間データ（最終処理後）のサイズ: {len(df_final)}, 列: {df_final.columns.tolist()} ---"
+        with metrics.timer("indicators", ticker=ticker):
+            indicator_cache.register(ticker, df)
+            df_final = indicator_cache.get_indicator_frame(
+                ticker,
+                STRATEGIES["SMA_Strategy"]["short_ma"],
+                STRATEGIES["SMA_Strategy"]["long_ma"],
+                rsi_period,
             )
-
-        # 全期間の処理済みデータから、現在のウォークフォワード期間にスライスする
-        for ticker, df_full_processed in full_processed_dfs.items():
-            # 最適化期間のデータ
-            opt_df = df_full_processed[
-                (df_full_processed["Date"] >= current_optimization_start_date)
-                & (df_full_processed["Date"] < optimization_end_date)
-            ].copy()
-            if not opt_df.empty:
-                current_processed_dfs_for_optimization[ticker] = opt_df
-            else:
-                print(
-                    f"警告: {ticker} の最適化期間 [{current_optimization_start_date.strftime('%Y-%m-%d')} - {optimization_end_date.strftime('%Y-%m-%d')}] のデータが空です。"
-                )
-
-            # テスト期間のデータ
-            test_df = df_full_processed[
-                (df_full_processed["Date"] >= test_start_date)
-                & (df_full_processed["Date"] < test_end_date)
-            ].copy()
-            if not test_df.empty:
-                current_processed_dfs_for_test[ticker] = test_df
-            else:
-                print(
-                    f"警告: {ticker} のテスト期間 [{test_start_date.strftime('%Y-%m-%d')} - {test_end_date.strftime('%Y-%m-%d')}] のデータが空です。"
-                )
-
-        if not current_processed_dfs_for_optimization:
-            print(
-                "最適化期間のデータが不足しているため、このウォークフォワード期間をスキップします。"
+        if df_final is None:
+            logger.warning(
+                "!! 致命的警告: %s の全期間の指標計算が失敗しました。この銘柄をスキップします。",
+                ticker,
             )
-            current_optimization_start_date += timedelta(days=WALK_FORWARD_STEP_DAYS)
             continue
 
-        # 最も有望な銘柄のデータを取得 (ここでは最適化期間の代表銘柄として最初の銘柄を使用)
-        # current_processed_dfs_for_optimization が空でないことは上で確認済み
-        optimization_ticker = list(current_processed_dfs_for_optimization.keys())[0]
-        df_for_optimization = current_processed_dfs_for_optimization[
-            optimization_ticker
-        ]
-
-        # 1. パラメータ最適化 (最適化期間のデータを使用)
-        best_params = strategy_manager.optimize_strategy_parameters(
-            df_for_optimization, "SMA_Strategy"
+        full_processed_dfs[ticker] = df_final
+        logger.debug(
+            "--- %s 全期間データ（最終処理後）のサイズ: %s, 列: %s ---",
+            ticker,
+            len(df_final),
+            df_final.columns.tolist(),
         )
 
-        if not best_params:
-            print("パラメータ最適化に失敗しました。スキップします。")
-            current_optimization_start_date += timedelta(days=WALK_FORWARD_STEP_DAYS)
-            continue
-
-        # 最適化されたパラメータを元に、戦略マネージャーのシグナルを生成し直す
-        # config のグローバル変数を一時的に変更する (ベストプラクティスではないが簡略化のため)
-        import src.config
-
-        # config のグローバル変数を一時的に変更する (ベストプラクティスではないが簡略化のため)
-        # STRATEGIES ディクショナリからデフォルト値を取得するように変更
-        src.config.STRATEGIES["SMA_Strategy"]["short_ma"] = best_params.get(
+    # ウォークフォワードの各期間は独立しているため、まとめて実行し期間順に統合する
+    windows = generate_walk_forward_windows(min_date, max_date)
+    walk_forward_output = run_walk_forward(
+        windows,
+        full_processed_dfs,
+        indicator_cache,
+        max_workers,
+        strategy_manager=strategy_manager,
+        metrics=metrics,
+        keep_signals=chart_mode is not None,
+    )
+    if profiler is not None:
+        profiler.take_snapshot("walk_forward")
+    all_walk_forward_results = walk_forward_output["results"]
+    all_walk_forward_trades = walk_forward_output["trades"]
+    all_walk_forward_portfolio_dfs = walk_forward_output["portfolio_dfs"]
+
+    # 最後に最適化されたパラメータを設定に反映する (参照銘柄のグラフ描画で使用)
+    # config のグローバル変数を変更する (ベストプラクティスではないが簡略化のため)
+    last_best_params = walk_forward_output["best_params"]
+    if last_best_params:
+        STRATEGIES["SMA_Strategy"]["short_ma"] = last_best_params.get(
             "short_ma", STRATEGIES["SMA_Strategy"]["short_ma"]
         )
-        src.config.STRATEGIES["SMA_Strategy"]["long_ma"] = best_params.get(
+        STRATEGIES["SMA_Strategy"]["long_ma"] = last_best_params.get(
             "long_ma", STRATEGIES["SMA_Strategy"]["long_ma"]
         )
-        # 必要なら RSI_OVERBOUGHT, RSI_OVERSOLD も同様に設定
-
-        processed_dfs_for_test_with_optimized_params = {}
-        for (
-            ticker,
-            df_test_raw_current_period,
-        ) in current_processed_dfs_for_test.items():
-            # df_test_raw_current_period はすでにMA/RSIが計算済みだが、
-            # configのMA期間が変更されたので、シグナル生成のために再計算が必要
-
-            # raw_dfsからテスト期間の生データを抽出
-            # raw_dfsのDFはインデックスがDateになっているので、.indexでアクセス
-            raw_test_data = raw_dfs[ticker][
-                (raw_dfs[ticker].index >= test_start_date)
-                & (raw_dfs[ticker].index < test_end_date)
-            ].copy()
-
-            if raw_test_data.empty:
-                print(
-                    f"警告: {ticker} の生データ（テスト期間）が空です。シグナル生成をスキップします。"
-                )
-                continue
-
-            # 再計算: 最適化されたconfig値を使ってMA/RSIを計算
-            print(
-                f"--- {ticker} テスト期間データ（MA再計算前）のサイズ: {len(raw_test_data)}, 列: {raw_test_data.columns.tolist()} ---"
-            )
-            df_recalculated_ma = data_manager.calculate_moving_averages(raw_test_data)
-            if df_recalculated_ma is None:  # calculate_moving_averagesがNoneを返す場合
-                print(
-                    f"!! 致命的警告: {ticker} のテスト期間のMA再計算に失敗し、Noneが返されました。スキップします。"
-                )
-                continue
-
-            print(
-                f"--- {ticker} テスト期間データ（MA再計算後）のサイズ: {len(df_recalculated_ma)}, 列: {df_recalculated_ma.columns.tolist()} ---"
-            )
-            df_recalculated_final = data_manager.calculate_rsi(df_recalculated_ma)
-            if df_recalculated_final is None:  # calculate_rsiがNoneを返す場合
-                print(
-                    f"!! 致命的警告: {ticker} のテスト期間のRSI再計算に失敗し、Noneが返されました。スキップします。"
-                )
-                continue
 
-            # strategy_manager が 'Date' 列を必要とするため、ここでインデックスをリセット
-            df_recalculated_final.reset_index(inplace=True)
-
-            # シグナル生成
-            df_test_signals = strategy_manager.generate_trading_signals(
-                df_recalculated_final, "SMA_Strategy", best_params
-            )
-            if df_test_signals is None or df_test_signals.empty:
-                print(
-                    f"警告: {ticker} のテスト期間のシグナル生成に失敗しました。スキップします。"
-                )
-                continue
-
-            processed_dfs_for_test_with_optimized_params[ticker] = df_test_signals
-
-        if not processed_dfs_for_test_with_optimized_params:
-            print("テスト期間のデータ処理に失敗しました。スキップします。")
-            current_optimization_start_date += timedelta(days=WALK_FORWARD_STEP_DAYS)
-            continue
-
-        # 2. テスト期間でバックテストを実行 (最適化されたパラメータを使用)
-        # processed_dfs_for_test_with_optimized_params が空でないことは上で確認済み
-
-        backtester = Backtester(
-            processed_dfs_for_test_with_optimized_params,
-            strategy_name="SMA_Strategy",  # 追加
-            initial_cash=INITIAL_CASH,
-            leverage_ratio=LEVERAGE_RATIO,
-        )
-
-        df_portfolio_current_test, df_trades_current_test = backtester.run_simulation()
-
-        if df_portfolio_current_test is None or df_trades_current_test is None:
-            print("バックテスト実行に失敗しました。スキップします。")
-            current_optimization_start_date += timedelta(days=WALK_FORWARD_STEP_DAYS)
-            continue
-
-        summary_results_current_test = backtester.get_summary_results()
-
-        # 結果を蓄積
-        all_walk_forward_results.append(summary_results_current_test)
-        all_walk_forward_trades = pd.concat(
-            [all_walk_forward_trades, df_trades_current_test], ignore_index=True
-        )
-        all_walk_forward_portfolio_dfs.append(df_portfolio_current_test)
-
-        # 次の最適化期間の開始日を設定
-        current_optimization_start_date += timedelta(days=WALK_FORWARD_STEP_DAYS)
-
-    print("\n--- ウォークフォワードシミュレーション完了 ---")
+    logger.info("\n--- ウォークフォワードシミュレーション完了 ---")
 
     if not all_walk_forward_results:
-        print("実行可能なシミュレーション期間がありませんでした。")
+        logger.warning("実行可能なシミュレーション期間がありませんでした。")
         return
 
     # 全期間を通した統合されたポートフォリオ価値を計算し、可視化
@@ -315,7 +324,7 @@ def main():
             .reset_index(drop=True)
         )
     else:
-        print(
+        logger.warning(
             "統合されたポートフォリオ履歴データがありません。最終グラフ描画をスキップします。"
         )
 
@@ -332,89 +341,134 @@ def main():
         else 0
     )
 
-    print("\n--- 統合シミュレーション結果の概要 ---")
-    print(f"対象銘柄: {', '.join(TICKER_SYMBOLS)}")
-    print(f"データ期間: {START_DATE} から {END_DATE}")
-    print(
-        f"ウォークフォワード設定: 最適化期間 {OPTIMIZATION_WINDOW_DAYS}日, テスト期間 {TEST_WINDOW_DAYS}日, ステップ {WALK_FORWARD_STEP_DAYS}日"
+    logger.info("\n--- 統合シミュレーション結果の概要 ---")
+    logger.info("対象銘柄: %s", ", ".join(tickers))
+    logger.info("データ期間: %s から %s", START_DATE, END_DATE)
+    logger.info(
+        "ウォークフォワード設定: 最適化期間 %s日, テスト期間 %s日, ステップ %s日",
+        OPTIMIZATION_WINDOW_DAYS,
+        TEST_WINDOW_DAYS,
+        WALK_FORWARD_STEP_DAYS,
+    )
+    logger.info("初期資産 (各テスト期間ごと): %s 円", f"{INITIAL_CASH:,.0f}")
+    logger.info("利用レバレッジ: %s 倍", LEVERAGE_RATIO)
+    logger.info(
+        "全期間の最終ポートフォリオ価値: %s 円",
+        f"{total_final_portfolio_value:,.0f}",
     )
-    print(f"初期資産 (各テスト期間ごと): {INITIAL_CASH:,.0f} 円")
-    print(f"利用レバレッジ: {LEVERAGE_RATIO} 倍")
-    print(f"全期間の最終ポートフォリオ価値: {total_final_portfolio_value:,.0f} 円")
-    print(f"全期間の総リターン (%): {total_overall_return_percentage:.2f}%")
-    print("\n--- 注意 ---")
-    print(
+    logger.info("全期間の総リターン (%%): %.2f%%", total_overall_return_percentage)
+
+    if robustness:
+        # テスト期間ごとの日次リターンを再標本化し、起こり得た結果のばらつきを評価する
+        with metrics.timer("robustness"):
+            analyzer = RobustnessAnalyzer()
+            robustness_result = analyzer.simulate(
+                RobustnessAnalyzer.daily_returns(all_walk_forward_portfolio_dfs),
+                INITIAL_CASH,
+            )
+        if robustness_result is not None:
+            logger.info(
+                "\n--- 頑健性評価 (%s ブートストラップ, %s 本) ---",
+                analyzer.method,
+                analyzer.n_paths,
+            )
+            logger.info(
+                "\n%s",
+                RobustnessAnalyzer.summarize(robustness_result).to_string(
+                    float_format=lambda value: f"{value:,.2f}"
+                ),
+            )
+            logger.info(
+                "最終価値が初期資金を下回る確率: %.1f%%",
+                (robustness_result["final_values"] < INITIAL_CASH).mean() * 100,
+            )
+    logger.info("\n--- 注意 ---")
+    logger.info(
         "「半年で5倍」という目標は非常に高いリスクを伴い、本シミュレーションは極端な戦略に基づいています。"
     )
-    print(
+    logger.info(
         "現実の投資では、これほどの高リターンを安定的に得ることは困難であり、資金を大きく失う可能性があります。"
     )
 
     # 統合された結果の可視化とレポート生成
-    print("グラフ描画中...")
+    logger.info("グラフ描画中...")
     # ★ここを修正★
     visualizer = Visualizer(
-        final_integrated_portfolio_df
+        final_integrated_portfolio_df, headless=headless
     )  # df_portfolio_history を渡す
     # ★ここまで修正★
 
     # 基準となる銘柄のデータを取得 (参照用)
     reference_ticker_df = None
-    if TICKER_SYMBOLS and TICKER_SYMBOLS[0] in raw_dfs:
-        temp_df = raw_dfs[TICKER_SYMBOLS[0]].copy()
-
-        print(
-            f"\n--- 参照銘柄 ({TICKER_SYMBOLS[0]}) データ処理前（全期間）のサイズ: {len(temp_df)}, 列: {temp_df.columns.tolist()} ---"
+    if tickers and tickers[0] in full_processed_dfs:
+        # 全期間の指標はキャッシュ済みのため再計算しない
+        temp_df = indicator_cache.get_indicator_frame(
+            tickers[0],
+            STRATEGIES["SMA_Strategy"]["short_ma"],
+            STRATEGIES["SMA_Strategy"]["long_ma"],
+            rsi_period,
         )
-
-        temp_df = data_manager.calculate_moving_averages(temp_df)
         if temp_df is not None:
-            print(
-                f"--- 参照銘柄 ({TICKER_SYMBOLS[0]}) MA計算後のサイズ: {len(temp_df)}, 列: {temp_df.columns.tolist()} ---"
+            reference_ticker_df = strategy_manager.generate_trading_signals(
+                temp_df, "SMA_Strategy", STRATEGIES["SMA_Strategy"]
             )
-
-            temp_df = data_manager.calculate_rsi(temp_df)
-            if temp_df is not None:
-                print(
-                    f"--- 参照銘柄 ({TICKER_SYMBOLS[0]}) RSI計算後のサイズ: {len(temp_df)}, 列: {temp_df.columns.tolist()} ---"
-                )
-
-                temp_df.reset_index(inplace=True)
-                reference_ticker_df = strategy_manager.generate_trading_signals(
-                    temp_df, "SMA_Strategy", STRATEGIES["SMA_Strategy"]
-                )
-                if reference_ticker_df is not None:
-                    reference_ticker_df["Ticker"] = TICKER_SYMBOLS[0]
-                else:
-                    print(
-                        f"警告: 参照銘柄 ({TICKER_SYMBOLS[0]}) のシグナル生成に失敗しました。"
-                    )
+            if reference_ticker_df is not None:
+                reference_ticker_df["Ticker"] = tickers[0]
             else:
-                print(f"警告: 参照銘柄 ({TICKER_SYMBOLS[0]}) のRSI計算が失敗しました。")
+                logger.warning(
+                    "警告: 参照銘柄 (%s) のシグナル生成に失敗しました。", tickers[0]
+                )
         else:
-            print(f"警告: 参照銘柄 ({TICKER_SYMBOLS[0]}) のMA計算が失敗しました。")
+            logger.warning("警告: 参照銘柄 (%s) の指標計算が失敗しました。", tickers[0])
+
+    with metrics.timer("plot"):
+        visualizer.plot_results(
+            final_integrated_portfolio_df,
+            all_walk_forward_trades,
+            PLOT_FILE_NAME,
+            reference_ticker_data=reference_ticker_df,
+        )
 
-    visualizer.plot_results(
-        final_integrated_portfolio_df,
-        all_walk_forward_trades,
-        PLOT_FILE_NAME,
-        reference_ticker_data=reference_ticker_df,
-    )
+    if chart_mode is not None:
+        # ウォークフォワードで計算済みのシグナルから、銘柄・期間ごとのチャートを描画する
+        logger.info("銘柄別チャート描画中...")
+        with metrics.timer("charts"):
+            generate_charts(
+                walk_forward_output["window_signals"],
+                all_walk_forward_trades,
+                chart_mode,
+            )
 
-    print("レポート生成中...")
-    report_generator = ReportGenerator()
-    report_generator.generate_excel_report(
-        final_integrated_portfolio_df,
-        all_walk_forward_trades,
-        {
-            "initial_cash": INITIAL_CASH,
-            "final_portfolio_value": total_final_portfolio_value,
-            "total_return_percentage": total_overall_return_percentage,
-            "leverage_ratio": LEVERAGE_RATIO,
-        },
-    )
+    logger.info("レポート生成中...")
+    with metrics.timer("report"):
+        report_generator = ReportGenerator()
+        report_generator.generate_excel_report(
+            final_integrated_portfolio_df,
+            all_walk_forward_trades,
+            {
+                "initial_cash": INITIAL_CASH,
+                "final_portfolio_value": total_final_portfolio_value,
+                "total_return_percentage": total_overall_return_percentage,
+                "leverage_ratio": LEVERAGE_RATIO,
+            },
+        )
 
-    print("\n--- シミュレーションが完了しました ---")
+    cache_stats = indicator_cache.stats()
+    logger.info(
+        "指標キャッシュ: ヒット %s 件, ミス %s 件",
+        cache_stats["hits"],
+        cache_stats["misses"],
+    )
+    if optimization_cache is not None:
+        optimization_stats = optimization_cache.stats()
+        logger.info(
+            "最適化キャッシュ: ヒット %s 件, ミス %s 件, 削除 %s 件, 保存数 %s 件 (%.1f MB)",
+            optimization_stats["hits"],
+            optimization_stats["misses"],
+            optimization_stats["evictions"],
+            optimization_stats["entries"],
+            optimization_stats["total_bytes"] / 2**20,
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,108 @@
+# stock_trading_bot/src/metrics.py
+
+import json
+import os
+import time
+from contextlib import contextmanager
+
+
+class StageMetrics:
+    """
+    処理段階ごとの実行時間を記録し、JSONとして出力するメトリクス収集クラス。
+
+    1件の記録は (段階名, ウォークフォワード期間, 銘柄, 秒数) で、期間・銘柄に
+    関係しない段階では None になります。別プロセスで記録したメトリクスは
+    records を受け渡して merge で統合します。
+    """
+
+    def __init__(self):
+        """
+        StageMetricsのコンストラクタ。
+        """
+        self.records = []
+
+    @contextmanager
+    def timer(self, stage: str, window: str | None = None, ticker: str | None = None):
+        """
+        with ブロックの実行時間を計測して記録するコンテキストマネージャ。
+
+        Args:
+            stage (str): 段階名 ('fetch', 'indicators', 'optimize' など)。
+            window (str, optional): ウォークフォワード期間 (最適化開始日)。
+            ticker (str, optional): ティッカーシンボル。
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start, window, ticker)
+
+    def record(
+        self,
+        stage: str,
+        seconds: float,
+        window: str | None = None,
+        ticker: str | None = None,
+    ):
+        """
+        計測済みの実行時間を記録します。
+
+        Args:
+            stage (str): 段階名。
+            seconds (float): 実行時間 (秒)。
+            window (str, optional): ウォークフォワード期間 (最適化開始日)。
+            ticker (str, optional): ティッカーシンボル。
+        """
+        self.records.append(
+            {"stage": stage, "window": window, "ticker": ticker, "seconds": seconds}
+        )
+
+    def merge(self, records: list):
+        """
+        他のプロセスなどで記録されたメトリクスを統合します。
+
+        Args:
+            records (list[dict]): 他の StageMetrics の records。
+        """
+        self.records.extend(records)
+
+    def summary(self) -> dict:
+        """
+        段階ごとの集計 (件数、合計、平均、最大) を返します。
+
+        Returns:
+            dict: 段階名 -> {'count', 'total_seconds', 'mean_seconds',
+                'max_seconds'} の辞書 (記録順)。
+        """
+        totals = {}
+        for record in self.records:
+            stats = totals.setdefault(
+                record["stage"], {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+            )
+            stats["count"] += 1
+            stats["total_seconds"] += record["seconds"]
+            stats["max_seconds"] = max(stats["max_seconds"], record["seconds"])
+
+        for stats in totals.values():
+            stats["mean_seconds"] = stats["total_seconds"] / stats["count"]
+        return totals
+
+    def to_dict(self) -> dict:
+        """
+        集計と個々の記録をまとめた辞書を返します。
+
+        Returns:
+            dict: 'summary' (段階ごとの集計) と 'records' (個々の記録) を含む辞書。
+        """
+        return {"summary": self.summary(), "records": self.records}
+
+    def dump(self, file_path: str):
+        """
+        メトリクスをJSONファイルに保存します。
+
+        Args:
+            file_path (str): 保存先のファイルパス。
+        """
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
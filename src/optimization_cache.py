@@ -0,0 +1,243 @@
+# stock_trading_bot/src/optimization_cache.py
+
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import tempfile
+
+import pandas as pd
+
+from .config import OPTIMIZATION_CACHE_DIR, OPTIMIZATION_CACHE_MAX_BYTES
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+# キャッシュの形式や評価方法を変更した場合に値を上げ、古いエントリを無効にする
+CACHE_FORMAT_VERSION = 1
+CACHE_FILE_SUFFIX = ".pkl"
+
+
+def source_fingerprint(*objects) -> str:
+    """
+    関数・クラス・モジュールのソースコードから、評価方法の識別子を計算します。
+
+    最適化の評価関数を変更すると識別子が変わるため、キャッシュのキーに含めると
+    CACHE_FORMAT_VERSION を上げ忘れても古い評価方法の結果は再利用されません。
+
+    Args:
+        *objects: ソースコードを取得できる関数・クラス・モジュール。
+
+    Returns:
+        str: SHA-256 の16進文字列。
+    """
+    digest = hashlib.sha256()
+    for obj in objects:
+        try:
+            source = inspect.getsource(obj)
+        except (OSError, TypeError):
+            # ソースがない環境 (凍結した実行ファイルなど) では名前だけを使う
+            source = f"{getattr(obj, '__module__', '')}.{obj.__qualname__}"
+        digest.update(source.encode())
+    return digest.hexdigest()
+
+
+class OptimizationCache:
+    """
+    パラメータ最適化の結果 (最良パラメータとスコア表) をディスクに保存するキャッシュ。
+
+    キーは (最適化期間のデータ, 戦略名, 探索範囲, 目的関数, 評価関数のソースコード)
+    の内容から計算した SHA-256 ハッシュで、入力が同じなら別の実行・別の
+    プロセスからも同じ結果を再利用できます。エントリは1件1ファイルで、
+    一時ファイルに書き出してから置き換えるため、並列実行中に読み込んでも壊れたファイルは見えません。
+    合計サイズが上限を超えた場合は、最後に使われた時刻 (更新時刻) が古い
+    エントリから削除します。
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = OPTIMIZATION_CACHE_DIR,
+        max_bytes: int = OPTIMIZATION_CACHE_MAX_BYTES,
+    ):
+        """
+        OptimizationCacheのコンストラクタ。
+
+        Args:
+            cache_dir (str): キャッシュファイルを保存するディレクトリ。
+            max_bytes (int): キャッシュの合計サイズの上限 (バイト)。
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(
+        data,
+        strategy_name: str,
+        search_space: dict,
+        objective: str,
+        evaluator: str = "",
+    ) -> str:
+        """
+        最適化の入力からキャッシュのキーを計算します。
+
+        Args:
+            data (pd.DataFrame | dict): 最適化期間のデータ、または
+                銘柄 -> データの辞書 (全銘柄を一括で最適化する場合)。
+            strategy_name (str): 戦略名。
+            search_space (dict): 探索範囲や探索方法などの設定 (JSONに変換可能な値)。
+            objective (str): 目的関数の名前。
+            evaluator (str): 評価関数のソースコードの識別子 (`source_fingerprint`)。
+
+        Returns:
+            str: SHA-256 の16進文字列。
+        """
+        digest = hashlib.sha256()
+        header = {
+            "version": CACHE_FORMAT_VERSION,
+            "strategy_name": strategy_name,
+            "search_space": search_space,
+            "objective": objective,
+            "evaluator": evaluator,
+        }
+        digest.update(json.dumps(header, sort_keys=True, default=str).encode())
+
+        frames = data.items() if isinstance(data, dict) else [("", data)]
+        for name, df in frames:
+            digest.update(str(name).encode())
+            digest.update(json.dumps([str(column) for column in df.columns]).encode())
+            digest.update(
+                pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes()
+            )
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        """
+        キーに対応するキャッシュファイルのパスを返します。
+
+        Args:
+            key (str): キャッシュのキー。
+
+        Returns:
+            str: ファイルパス。
+        """
+        return os.path.join(self.cache_dir, key + CACHE_FILE_SUFFIX)
+
+    def get(self, key: str):
+        """
+        キャッシュされた値を取得します。
+
+        Args:
+            key (str): キャッシュのキー。
+
+        Returns:
+            Any: キャッシュされた値。存在しない場合はNone。
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError) as e:
+            logger.warning(
+                "警告: 最適化キャッシュを読み込めませんでした (%s): %s", path, e
+            )
+            self.misses += 1
+            return None
+
+        # 更新時刻を最後に使われた時刻として記録する (LRUでの削除順に使用)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value):
+        """
+        値をキャッシュに保存し、合計サイズが上限を超えた場合は古いエントリを削除します。
+
+        Args:
+            key (str): キャッシュのキー。
+            value (Any): 保存する値 (pickle 可能なオブジェクト)。
+        """
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self._path(key))
+        except OSError as e:
+            logger.warning("警告: 最適化キャッシュを保存できませんでした: %s", e)
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return
+        self._evict()
+
+    def _entries(self) -> list:
+        """
+        キャッシュファイルの一覧を、最後に使われた時刻の古い順に返します。
+
+        Returns:
+            list[tuple[float, int, str]]: (更新時刻, サイズ, パス) のリスト。
+        """
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(CACHE_FILE_SUFFIX):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:  # 他のプロセスが削除した場合
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        entries.sort()
+        return entries
+
+    def _evict(self):
+        """
+        合計サイズが上限以下になるまで、最後に使われた時刻が古いエントリを削除します。
+        """
+        entries = self._entries()
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total_bytes -= size
+            self.evictions += 1
+
+    def add_stats(self, stats: dict):
+        """
+        他のプロセスで発生したヒット/ミス/削除件数を集計に加えます。
+
+        Args:
+            stats (dict): 'hits', 'misses', 'evictions' を含む辞書。
+        """
+        self.hits += stats.get("hits", 0)
+        self.misses += stats.get("misses", 0)
+        self.evictions += stats.get("evictions", 0)
+
+    def stats(self) -> dict:
+        """
+        キャッシュの利用状況を返します。
+
+        Returns:
+            dict: 'hits', 'misses', 'evictions', 'entries', 'total_bytes' を含む辞書。
+        """
+        entries = self._entries()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(entries),
+            "total_bytes": sum(size for _, size, _ in entries),
+        }
@@ -0,0 +1,442 @@
+# stock_trading_bot/src/paper_trading.py
+
+import argparse
+import math
+import sys
+
+import numpy as np
+import pandas as pd
+
+from .backtester import Backtester, read_state
+from .config import (
+    DATA_PROVIDER,
+    INITIAL_CASH,
+    LEVERAGE_RATIO,
+    LOG_FILE,
+    LOG_LEVEL,
+    PAPER_TRADING_STATE_FILE,
+    PAPER_TRADING_TRADE_LOG,
+    START_DATE,
+    STRATEGIES,
+    SYNTHETIC_DATA_DIR,
+    SYNTHETIC_TICKER_COUNT,
+    TICKER_SYMBOLS,
+)
+from .data_manager import DataManager
+from .logger import get_logger, setup_logging
+from .strategy_manager import StrategyManager
+from .streaming_indicators import StreamingIndicatorSet
+from .synthetic_data import SyntheticDataProvider
+
+logger = get_logger(__name__)
+
+
+# 状態ファイルに銘柄ごとの指標の状態を保存するキー
+INDICATOR_STATE_KEY = "indicators"
+
+
+class TickerSignalState:
+    """
+    1銘柄分の、日次でシグナルを計算するための状態。
+
+    指標の計算器 (StreamingIndicatorSet) に加えて、クロスの判定に使う直前の
+    有効な行 (全ての指標が計算できた行) と、シグナルを計算済みでまだ
+    ポートフォリオに反映していない行を保持します。他の銘柄のデータが
+    揃っていない日付はバックテストの共通の日付に含まれないため、
+    その日の行は次回まで持ち越します。
+    """
+
+    def __init__(
+        self,
+        indicators: StreamingIndicatorSet,
+        last_row: dict | None = None,
+        pending_rows: list | None = None,
+    ):
+        """
+        TickerSignalStateのコンストラクタ。
+
+        Args:
+            indicators (StreamingIndicatorSet): 指標の計算器。
+            last_row (dict, optional): 直前の有効な行。
+            pending_rows (list[dict], optional): ポートフォリオに未反映の行。
+        """
+        self.indicators = indicators
+        self.last_row = last_row
+        self.pending_rows = pending_rows or []
+
+    def matches(self, short_ma: int, long_ma: int, rsi_period: int) -> bool:
+        """
+        指標のパラメータが指定した値と一致するかどうかを返します。
+
+        Args:
+            short_ma (int): 短期移動平均線の期間。
+            long_ma (int): 長期移動平均線の期間。
+            rsi_period (int): RSIの計算期間。
+
+        Returns:
+            bool: 一致する場合はTrue。
+        """
+        return (
+            self.indicators.short_ma,
+            self.indicators.long_ma,
+            self.indicators.rsi_period,
+        ) == (short_ma, long_ma, rsi_period)
+
+    def update(
+        self, df: pd.DataFrame, strategy_manager: StrategyManager, strategies: dict
+    ) -> int:
+        """
+        新しい日足で指標を更新し、有効な行にシグナルを付けて未反映の行に加えます。
+
+        シグナルは直前の有効な行を先頭に加えたデータで、ウォークフォワードと
+        同じ戦略パイプライン (StrategyManager.generate_strategy_signals) を
+        使って計算するため、全期間をまとめて計算した場合と同じ値になります。
+
+        Args:
+            df (pd.DataFrame): インデックスがDateで 'Close' 列を持つ、
+                前回の更新より後の株価データ。
+            strategy_manager (StrategyManager): シグナルの計算に使うStrategyManager。
+            strategies (dict): 戦略名 -> 戦略パラメータ (売買には SMA_Strategy の
+                シグナルを使います)。
+
+        Returns:
+            int: 追加した有効な行の数。
+        """
+        new_rows = []
+        for date, close in zip(df.index, df["Close"].to_numpy(dtype=float)):
+            values = self.indicators.update(close, date)
+            if any(math.isnan(value) for value in values.values()):
+                continue
+            new_rows.append({"Date": pd.Timestamp(date), "Close": close, **values})
+        if not new_rows:
+            return 0
+
+        context_rows = [self.last_row] if self.last_row is not None else []
+        df_signals = strategy_manager.generate_strategy_signals(
+            pd.DataFrame(context_rows + new_rows),
+            strategies,
+            trade_strategy="SMA_Strategy",
+        )
+        signals = df_signals["Trade_Signal"].to_numpy()[len(context_rows) :]
+        for row, signal in zip(new_rows, signals):
+            row["Trade_Signal"] = int(signal)
+
+        self.last_row = new_rows[-1]
+        self.pending_rows.extend(new_rows)
+        return len(new_rows)
+
+    def drop_processed(self, last_processed_date: pd.Timestamp):
+        """
+        ポートフォリオに反映済みの日付以前の行を、未反映の行から除外します。
+
+        Args:
+            last_processed_date (pd.Timestamp): 処理済みの最終日。
+        """
+        self.pending_rows = [
+            row for row in self.pending_rows if row["Date"] > last_processed_date
+        ]
+
+    def frame(self) -> pd.DataFrame:
+        """
+        未反映の行を、Backtester に渡せるデータフレームとして返します。
+
+        Returns:
+            pd.DataFrame: 'Date', 'Close', 指標の列, 'Trade_Signal' 列を持つデータ。
+        """
+        columns = ["Date", "Close", *self.indicators.values(), "Trade_Signal"]
+        return pd.DataFrame(self.pending_rows, columns=columns)
+
+    def to_state(self) -> dict:
+        """
+        状態を、JSONに保存できる辞書で返します。
+
+        Returns:
+            dict: 銘柄の状態。
+        """
+
+        def serialize(row: dict) -> dict:
+            return {**row, "Date": row["Date"].isoformat()}
+
+        return {
+            "indicators": self.indicators.to_state(),
+            "last_row": (
+                serialize(self.last_row) if self.last_row is not None else None
+            ),
+            "pending_rows": [serialize(row) for row in self.pending_rows],
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "TickerSignalState":
+        """
+        to_state で保存した状態から復元します。
+
+        Args:
+            state (dict): 銘柄の状態。
+
+        Returns:
+            TickerSignalState: 復元した状態。
+        """
+
+        def deserialize(row: dict) -> dict:
+            return {**row, "Date": pd.Timestamp(row["Date"])}
+
+        return cls(
+            StreamingIndicatorSet.from_state(state["indicators"]),
+            (deserialize(state["last_row"]) if state["last_row"] is not None else None),
+            [deserialize(row) for row in state["pending_rows"]],
+        )
+
+
+def build_signal_dfs(
+    data_manager: DataManager,
+    tickers: list,
+    start_date: str,
+    end_date: str,
+    ticker_states: dict | None = None,
+    last_processed_date: pd.Timestamp | None = None,
+) -> dict:
+    """
+    各銘柄の株価データを更新し、前回より後の日付のシグナル付きデータを返します。
+
+    保存された指標の状態がある銘柄は、その最終日以降の株価データだけを
+    読み込み、新しい日足の分だけ指標とシグナルを更新します。状態がない銘柄、
+    指標のパラメータが変わった銘柄、最終日の終値が変わった (分割や配当で
+    調整後価格が再計算された) 銘柄は start_date から計算し直します。
+
+    Args:
+        data_manager (DataManager): データ取得に使うDataManager。
+        tickers (list): ティッカーシンボルのリスト。
+        start_date (str): データ取得開始日 ('YYYY-MM-DD')。
+        end_date (str): データ取得終了日 ('YYYY-MM-DD'、この日を含まない)。
+        ticker_states (dict, optional): 銘柄 -> TickerSignalState。
+            更新後の状態で上書きされます。
+        last_processed_date (pd.Timestamp, optional): ポートフォリオに反映済みの
+            最終日。この日以前の行は返しません。
+
+    Returns:
+        dict: 銘柄ごとの 'Date' 列と 'Trade_Signal' 列を持つ、未反映の日付のデータ。
+            株価データを取得できなかった銘柄は含みません。
+    """
+    if ticker_states is None:
+        ticker_states = {}
+    strategy_manager = StrategyManager()
+    strategies = {
+        "SMA_Strategy": STRATEGIES["SMA_Strategy"],
+        "RSI_Strategy": STRATEGIES["RSI_Strategy"],
+    }
+    indicator_params = (
+        strategies["SMA_Strategy"]["short_ma"],
+        strategies["SMA_Strategy"]["long_ma"],
+        strategies["RSI_Strategy"]["rsi_period"],
+    )
+
+    # 状態を引き継げる銘柄は、状態の最終日 (終値の照合用) 以降だけを読み込む
+    resumable_tickers = [
+        ticker
+        for ticker in tickers
+        if ticker in ticker_states
+        and ticker_states[ticker].matches(*indicator_params)
+        and ticker_states[ticker].indicators.last_date is not None
+    ]
+    raw_dfs = {}
+    if resumable_tickers:
+        resume_date = min(
+            ticker_states[ticker].indicators.last_date for ticker in resumable_tickers
+        )
+        raw_dfs.update(
+            data_manager.fetch_multiple_data_incremental(
+                resumable_tickers, resume_date.strftime("%Y-%m-%d"), end_date
+            )
+        )
+
+    seed_tickers = [ticker for ticker in tickers if ticker not in resumable_tickers]
+    for ticker in resumable_tickers:
+        df = raw_dfs[ticker]
+        if df is None or df.empty:
+            continue
+        indicators = ticker_states[ticker].indicators
+        if indicators.last_date not in df.index or not np.isclose(
+            df.loc[indicators.last_date, "Close"], indicators.last_close, rtol=1e-9
+        ):
+            logger.info(
+                "%s の %s の終値が変わったため、指標を計算し直します。",
+                ticker,
+                indicators.last_date.strftime("%Y-%m-%d"),
+            )
+            seed_tickers.append(ticker)
+            continue
+        ticker_states[ticker].update(
+            df[df.index > indicators.last_date], strategy_manager, strategies
+        )
+
+    if seed_tickers:
+        raw_dfs.update(
+            data_manager.fetch_multiple_data_incremental(
+                seed_tickers, start_date, end_date
+            )
+        )
+        for ticker in seed_tickers:
+            df = raw_dfs[ticker]
+            if df is None or df.empty:
+                continue
+            ticker_states[ticker] = TickerSignalState(
+                StreamingIndicatorSet(*indicator_params)
+            )
+            ticker_states[ticker].update(df, strategy_manager, strategies)
+
+    signal_dfs = {}
+    for ticker in tickers:
+        df = raw_dfs.get(ticker)
+        if df is None or df.empty:
+            logger.warning(
+                "警告: %s の株価データが空です。この銘柄をスキップします。", ticker
+            )
+            continue
+        if last_processed_date is not None:
+            ticker_states[ticker].drop_processed(last_processed_date)
+        signal_dfs[ticker] = ticker_states[ticker].frame()
+    return signal_dfs
+
+
+def run_daily(
+    data_manager: DataManager,
+    tickers: list,
+    start_date: str,
+    end_date: str,
+    state_file: str,
+    trade_log_file: str,
+) -> int:
+    """
+    保存された状態から再開し、新しい営業日分だけペーパートレードを実行します。
+
+    指標の状態はポートフォリオの状態と同じファイルに、1回の書き込みで
+    保存します。
+
+    Args:
+        data_manager (DataManager): データ取得に使うDataManager。
+        tickers (list): ティッカーシンボルのリスト。
+        start_date (str): 状態がない銘柄のデータ取得開始日 ('YYYY-MM-DD')。
+        end_date (str): データ取得終了日 ('YYYY-MM-DD'、この日を含まない)。
+        state_file (str): 状態を保存するJSONファイルのパス。
+        trade_log_file (str): 取引を追記するCSVファイルのパス。
+
+    Returns:
+        int: 終了コード (0: 正常終了, 1: データなし)。
+    """
+    saved_state = read_state(state_file) or {}
+    last_processed_date = (
+        pd.Timestamp(saved_state["last_processed_date"])
+        if saved_state.get("last_processed_date") is not None
+        else None
+    )
+    ticker_states = {
+        ticker: TickerSignalState.from_state(state)
+        for ticker, state in saved_state.get(INDICATOR_STATE_KEY, {}).items()
+    }
+
+    signal_dfs = build_signal_dfs(
+        data_manager, tickers, start_date, end_date, ticker_states, last_processed_date
+    )
+    if not signal_dfs:
+        logger.error("エラー: ペーパートレードに使えるデータがありません。")
+        return 1
+    if any(df.empty for df in signal_dfs.values()):
+        # 全銘柄に共通する新しい日付がない (指標の状態は次回も同じ日足から更新する)
+        logger.info("新しく処理する日付はありません。")
+        return 0
+
+    backtester = Backtester(
+        signal_dfs,
+        strategy_name="SMA_Strategy",
+        initial_cash=INITIAL_CASH,
+        leverage_ratio=LEVERAGE_RATIO,
+    )
+    if backtester.dates:
+        for state in ticker_states.values():
+            state.drop_processed(backtester.dates[-1])
+    df_portfolio, _ = backtester.run_daily_update(
+        state_file,
+        trade_log_file,
+        {
+            INDICATOR_STATE_KEY: {
+                ticker: state.to_state() for ticker, state in ticker_states.items()
+            }
+        },
+    )
+
+    if df_portfolio is not None and not df_portfolio.empty:
+        logger.info(
+            "%s 時点のポートフォリオ価値: %s 円 (現金 %s 円)",
+            df_portfolio["Date"].iloc[-1].strftime("%Y-%m-%d"),
+            f"{df_portfolio['Portfolio_Value'].iloc[-1]:,.0f}",
+            f"{backtester.current_cash:,.0f}",
+        )
+    return 0
+
+
+def main(argv: list | None = None) -> int:
+    """
+    日次のペーパートレードを1回分実行します。
+
+    保存されたポートフォリオの状態を読み込み、前回処理した日より後の
+    営業日だけをシミュレーションして、取引ログへの追記と状態の保存を
+    行ってから終了します。状態ファイルがない初回は、初期資金から
+    取得できる全期間をシミュレーションします。
+
+    Args:
+        argv (list, optional): コマンドライン引数。省略時は sys.argv。
+
+    Returns:
+        int: 終了コード (0: 正常終了, 1: データなし)。
+    """
+    parser = argparse.ArgumentParser(
+        description="保存された状態から再開し、新しい営業日分だけペーパートレードを実行します。"
+    )
+    parser.add_argument(
+        "--end-date",
+        default=(pd.Timestamp.today().normalize() + pd.Timedelta(days=1)).strftime(
+            "%Y-%m-%d"
+        ),
+        help="データ取得終了日 (この日を含まない、省略時は今日まで)",
+    )
+    parser.add_argument(
+        "--state-file",
+        default=PAPER_TRADING_STATE_FILE,
+        help="ポートフォリオの状態を保存するJSONファイル",
+    )
+    parser.add_argument(
+        "--trade-log",
+        default=PAPER_TRADING_TRADE_LOG,
+        help="取引を追記するCSVファイル",
+    )
+    parser.add_argument(
+        "--log-level",
+        default=LOG_LEVEL,
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        help="ログの出力レベル",
+    )
+    parser.add_argument("--log-file", default=LOG_FILE, help="ログファイルのパス")
+    args = parser.parse_args(argv)
+    setup_logging(args.log_level, args.log_file)
+
+    if DATA_PROVIDER == "synthetic":
+        tickers = SyntheticDataProvider.make_tickers(SYNTHETIC_TICKER_COUNT)
+        data_manager = DataManager(
+            provider=SyntheticDataProvider(), data_dir=SYNTHETIC_DATA_DIR
+        )
+    else:
+        tickers = TICKER_SYMBOLS
+        data_manager = DataManager()
+
+    return run_daily(
+        data_manager,
+        tickers,
+        START_DATE,
+        args.end_date,
+        args.state_file,
+        args.trade_log,
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
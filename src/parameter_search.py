@@ -0,0 +1,271 @@
+# stock_trading_bot/src/parameter_search.py
+
+import math
+
+import numpy as np
+
+from .config import PARAMETER_SEARCH
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+# 指定できる探索方法
+SEARCH_METHODS = ("grid", "random", "successive_halving", "coordinate")
+
+
+class ParameterSearch:
+    """
+    (短期期間, 長期期間) のパラメータ空間を、評価回数の上限 (予算) の範囲で探索するクラス。
+
+    評価は `evaluate(pairs, first_row=0)` の形の関数に委ねます。この関数は
+    組み合わせのリストを受け取り、最適化期間の first_row 行目以降で評価した
+    総リターンの配列 (評価できない組み合わせは NaN) を返します。
+    探索方法は次のとおりです。
+
+    - "grid": 全ての組み合わせを評価します (予算は無視)。
+    - "random": 予算の数だけ組み合わせを無作為に選んで評価します。
+    - "successive_halving": 無作為に選んだ候補を、最新の短い期間から順に
+      期間を伸ばしながら評価し、各段階で上位 1/halving_factor に絞り込みます。
+      最終段階のみ最適化期間全体で評価します。
+    - "coordinate": 初期値から短期・長期の軸を交互に1本ずつ評価して改善を続け、
+      局所解に収束したら未評価の組み合わせから無作為に再開します。
+    """
+
+    def __init__(
+        self,
+        method: str = PARAMETER_SEARCH["method"],
+        budget: int = PARAMETER_SEARCH["budget"],
+        seed: int = PARAMETER_SEARCH["seed"],
+        halving_factor: int = PARAMETER_SEARCH["halving_factor"],
+        min_window_fraction: float = PARAMETER_SEARCH["min_window_fraction"],
+    ):
+        """
+        ParameterSearchのコンストラクタ。
+
+        Args:
+            method (str): 探索方法 (SEARCH_METHODS のいずれか)。
+            budget (int): 1回の探索で評価する組み合わせ数の上限。
+            seed (int): 無作為抽出の乱数のシード値 (同じ値なら同じ探索順)。
+            halving_factor (int): successive_halving で各段階に残す割合の逆数。
+            min_window_fraction (float): successive_halving の最初の段階で使う、
+                最適化期間のうち最新の部分の割合。
+        """
+        if method not in SEARCH_METHODS:
+            logger.warning(
+                "警告: 未知の探索方法 '%s' が指定されました。'grid' を使用します。",
+                method,
+            )
+            method = "grid"
+        self.method = method
+        self.budget = max(1, int(budget))
+        self.seed = seed
+        self.halving_factor = max(2, int(halving_factor))
+        self.min_window_fraction = min(max(float(min_window_fraction), 0.0), 1.0)
+
+    def search(
+        self,
+        short_values: list,
+        long_values: list,
+        evaluate,
+        n_rows: int,
+        start: tuple | None = None,
+    ) -> dict:
+        """
+        パラメータ空間を探索し、最適化期間全体で評価した組み合わせのスコアを返します。
+
+        Args:
+            short_values (list[int]): 短期期間の候補。
+            long_values (list[int]): 長期期間の候補。
+            evaluate (Callable[[list, int], np.ndarray]): 組み合わせを評価する関数。
+            n_rows (int): 最適化期間の行数 (successive_halving の期間の分割に使用)。
+            start (tuple, optional): coordinate の初期値 (短期期間, 長期期間)。
+                省略時は候補の中央付近から開始します。
+
+        Returns:
+            dict: (短期期間, 長期期間) -> 総リターン。探索しなかった組み合わせは
+                含まれません。
+        """
+        candidates = [
+            (short_ma, long_ma)
+            for short_ma in short_values
+            for long_ma in long_values
+            if short_ma < long_ma
+        ]
+        if not candidates:
+            return {}
+
+        rng = np.random.default_rng(self.seed)
+        if self.method == "grid" or self.budget >= len(candidates):
+            # 予算内で全ての組み合わせを評価できる場合はグリッドサーチと同じ
+            return dict(zip(candidates, evaluate(candidates)))
+        if self.method == "random":
+            return self._random_search(candidates, evaluate, rng)
+        if self.method == "successive_halving":
+            return self._successive_halving(candidates, evaluate, n_rows, rng)
+        return self._coordinate_search(
+            candidates, short_values, long_values, evaluate, start, rng
+        )
+
+    def _random_search(self, candidates: list, evaluate, rng) -> dict:
+        """
+        予算の数だけ無作為に選んだ組み合わせを一括で評価します。
+
+        Args:
+            candidates (list[tuple]): 評価可能な組み合わせ。
+            evaluate (Callable): 組み合わせを評価する関数。
+            rng (np.random.Generator): 乱数生成器。
+
+        Returns:
+            dict: (短期期間, 長期期間) -> 総リターン。
+        """
+        chosen = np.sort(rng.choice(len(candidates), size=self.budget, replace=False))
+        pairs = [candidates[i] for i in chosen]
+        return dict(zip(pairs, evaluate(pairs)))
+
+    def _halving_schedule(self, n_initial: int) -> list:
+        """
+        各段階で評価する候補数の列を返します (最後は halving_factor 個以下)。
+
+        Args:
+            n_initial (int): 最初の段階の候補数。
+
+        Returns:
+            list[int]: 段階ごとの候補数。
+        """
+        sizes = [n_initial]
+        while sizes[-1] > self.halving_factor:
+            sizes.append(math.ceil(sizes[-1] / self.halving_factor))
+        return sizes
+
+    def _successive_halving(self, candidates: list, evaluate, n_rows: int, rng) -> dict:
+        """
+        評価期間を伸ばしながら候補を絞り込みます。
+
+        Args:
+            candidates (list[tuple]): 評価可能な組み合わせ。
+            evaluate (Callable): 組み合わせを評価する関数。
+            n_rows (int): 最適化期間の行数。
+            rng (np.random.Generator): 乱数生成器。
+
+        Returns:
+            dict: 最終段階で最適化期間全体を使って評価した組み合わせのスコア。
+        """
+        # 全段階の評価回数の合計が予算に収まる最大の初期候補数を選ぶ
+        n_initial = min(len(candidates), self.budget)
+        while n_initial > 1 and sum(self._halving_schedule(n_initial)) > self.budget:
+            n_initial -= 1
+        sizes = self._halving_schedule(n_initial)
+
+        chosen = np.sort(rng.choice(len(candidates), size=n_initial, replace=False))
+        survivors = [candidates[i] for i in chosen]
+        for stage in range(len(sizes) - 1):
+            # 段階が進むごとに halving_factor 倍ずつ長い、最新の期間で評価する
+            fraction = max(
+                self.min_window_fraction,
+                float(self.halving_factor) ** -(len(sizes) - 1 - stage),
+            )
+            first_row = int(n_rows * (1 - fraction))
+            scores = np.nan_to_num(
+                evaluate(survivors, first_row=first_row), nan=-np.inf
+            )
+            # 同点の場合は元の並び (探索順) を優先する
+            ranked = np.argsort(-scores, kind="stable")[: sizes[stage + 1]]
+            survivors = [survivors[i] for i in np.sort(ranked)]
+
+        return dict(zip(survivors, evaluate(survivors)))
+
+    def _coordinate_search(
+        self,
+        candidates: list,
+        short_values: list,
+        long_values: list,
+        evaluate,
+        start: tuple,
+        rng,
+    ) -> dict:
+        """
+        短期・長期の軸ごとの探索を交互に繰り返して改善します。
+
+        Args:
+            candidates (list[tuple]): 評価可能な組み合わせ。
+            short_values (list[int]): 短期期間の候補。
+            long_values (list[int]): 長期期間の候補。
+            evaluate (Callable): 組み合わせを評価する関数。
+            start (tuple | None): 初期値 (短期期間, 長期期間)。
+            rng (np.random.Generator): 乱数生成器。
+
+        Returns:
+            dict: (短期期間, 長期期間) -> 総リターン。
+        """
+        candidate_set = set(candidates)
+        scores = {}
+
+        def evaluate_new(pairs: list):
+            # 未評価の組み合わせだけを、残りの予算の範囲で一括評価する
+            remaining = self.budget - len(scores)
+            new_pairs = list(
+                dict.fromkeys(
+                    pair
+                    for pair in pairs
+                    if pair in candidate_set and pair not in scores
+                )
+            )[:remaining]
+            if new_pairs:
+                scores.update(zip(new_pairs, evaluate(new_pairs)))
+
+        def score_of(pair: tuple) -> float:
+            score = scores.get(pair, np.nan)
+            return -np.inf if np.isnan(score) else score
+
+        current = self._nearest_candidate(candidates, start, short_values, long_values)
+        evaluate_new([current])
+        while True:
+            improved = False
+            for axis in (0, 1):
+                if axis == 0:
+                    line = [(short_ma, current[1]) for short_ma in short_values]
+                else:
+                    line = [(current[0], long_ma) for long_ma in long_values]
+                evaluate_new(line)
+                best_on_line = max(
+                    (pair for pair in line if pair in scores), key=score_of
+                )
+                if score_of(best_on_line) > score_of(current):
+                    current = best_on_line
+                    improved = True
+
+            if improved:
+                continue
+            # 局所解に収束したら、未評価の組み合わせから無作為に再開する
+            unevaluated = [pair for pair in candidates if pair not in scores]
+            if not unevaluated or len(scores) >= self.budget:
+                break
+            current = unevaluated[int(rng.integers(len(unevaluated)))]
+            evaluate_new([current])
+        return scores
+
+    @staticmethod
+    def _nearest_candidate(
+        candidates: list, start: tuple, short_values: list, long_values: list
+    ) -> tuple:
+        """
+        初期値に最も近い評価可能な組み合わせを返します。
+
+        Args:
+            candidates (list[tuple]): 評価可能な組み合わせ。
+            start (tuple | None): 初期値。None の場合は各候補の中央値。
+            short_values (list[int]): 短期期間の候補。
+            long_values (list[int]): 長期期間の候補。
+
+        Returns:
+            tuple: (短期期間, 長期期間)。
+        """
+        if start is None:
+            start = (
+                sorted(short_values)[len(short_values) // 2],
+                sorted(long_values)[len(long_values) // 2],
+            )
+        return min(
+            candidates,
+            key=lambda pair: abs(pair[0] - start[0]) + abs(pair[1] - start[1]),
+        )
@@ -0,0 +1,288 @@
+# stock_trading_bot/src/price_store.py
+
+import argparse
+import glob
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from .config import PRICE_STORE_DIR, STOCK_DATA_FILE
+from .logger import get_logger, setup_logging
+
+PRICE_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+MANIFEST_FILE = "manifest.json"
+DATES_FILE = "dates.npy"
+
+logger = get_logger(__name__)
+
+
+def store_dir_for(data_dir: str) -> str:
+    """
+    銘柄別CSVのディレクトリに対応する価格ストアのディレクトリを返します。
+
+    ストアは data_dir の下の、PRICE_STORE_DIR と同じ名前のディレクトリに置きます
+    (data_dir が 'data' の場合は PRICE_STORE_DIR と同じ)。
+
+    Args:
+        data_dir (str): 銘柄別CSVファイルのディレクトリ。
+
+    Returns:
+        str: 価格ストアのディレクトリ。
+    """
+    return os.path.join(data_dir, os.path.basename(os.path.normpath(PRICE_STORE_DIR)))
+
+
+class PriceStore:
+    """
+    全銘柄の株価データを列ごとのバイナリ配列として保存する列指向ストア。
+
+    列ごとに (銘柄 × 日付) の float64 配列を `.npy` ファイルとして保存し、
+    読み込み時はメモリマップで開くため、必要な銘柄・列・期間の部分だけを
+    読み出せます。銘柄一覧と各銘柄のデータ期間は manifest.json に記録します。
+    """
+
+    def __init__(self, store_dir: str = PRICE_STORE_DIR):
+        """
+        PriceStoreのコンストラクタ。
+
+        Args:
+            store_dir (str): ストアを保存するディレクトリ。
+        """
+        self.store_dir = store_dir
+        self._manifest = None
+
+    def exists(self) -> bool:
+        """
+        ストアが作成済みかどうかを返します。
+
+        Returns:
+            bool: manifest.json が存在する場合は True。
+        """
+        return os.path.exists(os.path.join(self.store_dir, MANIFEST_FILE))
+
+    @property
+    def manifest(self) -> dict:
+        """
+        ストアのマニフェスト (銘柄一覧、列、データ期間) を返します。
+
+        Returns:
+            dict: マニフェストの内容。
+        """
+        if self._manifest is None:
+            with open(
+                os.path.join(self.store_dir, MANIFEST_FILE), encoding="utf-8"
+            ) as f:
+                self._manifest = json.load(f)
+        return self._manifest
+
+    def write(self, dfs: dict):
+        """
+        銘柄ごとの株価データをストアに書き込みます (既存のストアは置き換えます)。
+
+        全てのファイルを一時ディレクトリに書き出してからディレクトリごと
+        置き換えるため、書き込み中や失敗時に、古いマニフェストと新しい
+        列ファイルが混在したストアを読むことはありません。
+
+        Args:
+            dfs (dict): 銘柄ごとの、インデックスがDateの株価データ。
+        """
+        valid_dfs = {
+            ticker: df for ticker, df in dfs.items() if df is not None and not df.empty
+        }
+        if not valid_dfs:
+            logger.warning("警告: ストアに書き込む有効なデータがありません。")
+            return
+
+        store_dir = os.path.normpath(self.store_dir)
+        temp_dir = f"{store_dir}.tmp"
+        if os.path.exists(temp_dir):
+            shutil.rmtree(temp_dir)
+        os.makedirs(temp_dir)
+        tickers = list(valid_dfs.keys())
+
+        # 全銘柄の日付の和集合を共通の日付軸とする
+        date_index = valid_dfs[tickers[0]].index
+        for ticker in tickers[1:]:
+            date_index = date_index.union(valid_dfs[ticker].index)
+        date_index = pd.DatetimeIndex(date_index.unique().sort_values())
+
+        aligned = {
+            ticker: df[~df.index.duplicated(keep="last")].reindex(date_index)
+            for ticker, df in valid_dfs.items()
+        }
+        for column in PRICE_COLUMNS:
+            values = np.full((len(tickers), len(date_index)), np.nan)
+            for row, ticker in enumerate(tickers):
+                if column in aligned[ticker].columns:
+                    values[row] = aligned[ticker][column].to_numpy(dtype=float)
+            np.save(os.path.join(temp_dir, f"{column}.npy"), values)
+
+        np.save(
+            os.path.join(temp_dir, DATES_FILE),
+            date_index.values.astype("datetime64[ns]").astype(np.int64),
+        )
+
+        manifest = {
+            "tickers": tickers,
+            "columns": PRICE_COLUMNS,
+            "num_dates": len(date_index),
+            "start_date": date_index[0].strftime("%Y-%m-%d"),
+            "end_date": date_index[-1].strftime("%Y-%m-%d"),
+            "ticker_ranges": {
+                ticker: [
+                    df.index.min().strftime("%Y-%m-%d"),
+                    df.index.max().strftime("%Y-%m-%d"),
+                ]
+                for ticker, df in valid_dfs.items()
+            },
+        }
+        with open(os.path.join(temp_dir, MANIFEST_FILE), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+        # 既存のストアを退避してから置き換える (ディレクトリは空でないと上書きできない)
+        old_dir = f"{store_dir}.old"
+        if os.path.exists(old_dir):
+            shutil.rmtree(old_dir)
+        if os.path.exists(store_dir):
+            os.replace(store_dir, old_dir)
+        os.replace(temp_dir, store_dir)
+        if os.path.exists(old_dir):
+            shutil.rmtree(old_dir)
+        self._manifest = manifest
+        logger.info(
+            "%s 銘柄 × %s 日のデータをストアに保存しました: %s",
+            len(tickers),
+            len(date_index),
+            self.store_dir,
+        )
+
+    def load(
+        self,
+        tickers: list | None = None,
+        columns: list | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+    ) -> dict:
+        """
+        ストアから指定した銘柄・列・期間のデータだけを読み込みます。
+
+        Args:
+            tickers (list, optional): 読み込む銘柄。省略時は全銘柄。
+            columns (list, optional): 読み込む列。省略時は全列。
+            start_date (str, optional): 開始日 (この日を含む)。
+            end_date (str, optional): 終了日 (この日を含まない)。
+
+        Returns:
+            dict: 銘柄ごとの、インデックスがDateの株価データ。
+                ストアに存在しない銘柄は空のDataFrame。
+        """
+        if not self.exists():
+            logger.error("エラー: 価格ストアが見つかりません: %s", self.store_dir)
+            return {ticker: pd.DataFrame() for ticker in tickers or []}
+
+        manifest = self.manifest
+        tickers = list(tickers) if tickers is not None else manifest["tickers"]
+        columns = list(columns) if columns is not None else manifest["columns"]
+        ticker_positions = {ticker: i for i, ticker in enumerate(manifest["tickers"])}
+
+        # 日付軸は小さいため全体を読み込み、二分探索で期間の行範囲を求める
+        dates = np.load(os.path.join(self.store_dir, DATES_FILE))
+        start = (
+            np.searchsorted(dates, pd.Timestamp(start_date).value, side="left")
+            if start_date is not None
+            else 0
+        )
+        stop = (
+            np.searchsorted(dates, pd.Timestamp(end_date).value, side="left")
+            if end_date is not None
+            else len(dates)
+        )
+        date_index = pd.DatetimeIndex(dates[start:stop].astype("datetime64[ns]"))
+        date_index.name = "Date"
+
+        # 列ファイルをメモリマップで開き、必要な部分だけを読み出す
+        arrays = {
+            column: np.load(
+                os.path.join(self.store_dir, f"{column}.npy"), mmap_mode="r"
+            )
+            for column in columns
+        }
+
+        result = {}
+        for ticker in tickers:
+            row = ticker_positions.get(ticker)
+            if row is None:
+                logger.warning("警告: 価格ストアに '%s' のデータがありません。", ticker)
+                result[ticker] = pd.DataFrame()
+                continue
+
+            df = pd.DataFrame(
+                {
+                    column: np.array(arrays[column][row, start:stop])
+                    for column in columns
+                },
+                index=date_index,
+            )
+            # 共通の日付軸のうち、この銘柄に取引がない日は除外する
+            df.dropna(how="all", inplace=True)
+            if "Volume" in df.columns and not df["Volume"].isnull().any():
+                df["Volume"] = df["Volume"].astype(np.int64)
+            result[ticker] = df
+        return result
+
+    def migrate_from_csv(self, data_dir: str = "data") -> list:
+        """
+        既存の銘柄別CSVファイル (data/*.csv) を読み込み、ストアへ一括で移行します。
+
+        Args:
+            data_dir (str): 銘柄別CSVファイルのディレクトリ。
+
+        Returns:
+            list: 移行した銘柄のリスト。
+        """
+        dfs = {}
+        for file_path in sorted(glob.glob(os.path.join(data_dir, "*.csv"))):
+            # 複数銘柄をまとめた旧形式のファイルは対象外
+            if os.path.basename(file_path) == os.path.basename(STOCK_DATA_FILE):
+                continue
+
+            # DataManager.load_data_from_csv と同じ値になるよう、丸めずに読み込む
+            df = pd.read_csv(
+                file_path,
+                parse_dates=["Date"],
+                index_col="Date",
+                float_precision="round_trip",
+            )
+            if not all(column in df.columns for column in PRICE_COLUMNS):
+                logger.warning(
+                    "警告: 必要な列がないため移行をスキップします: %s", file_path
+                )
+                continue
+
+            df.sort_index(inplace=True)
+            ticker = os.path.splitext(os.path.basename(file_path))[0]
+            dfs[ticker] = df[PRICE_COLUMNS]
+
+        self.write(dfs)
+        return list(dfs.keys())
+
+
+if __name__ == "__main__":
+    # python -m src.price_store [--data-dir DIR] で DIR/*.csv をストアへ移行する
+    parser = argparse.ArgumentParser(
+        description="銘柄別CSVファイルを列指向の価格ストアへ移行します。"
+    )
+    parser.add_argument(
+        "--data-dir",
+        default="data",
+        help="銘柄別CSVファイルのディレクトリ (ストアはその下に作成)",
+    )
+    args = parser.parse_args()
+    setup_logging()
+    migrated_tickers = PriceStore(store_dir_for(args.data_dir)).migrate_from_csv(
+        args.data_dir
+    )
+    logger.info("移行した銘柄: %s", ", ".join(migrated_tickers))
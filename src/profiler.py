@@ -0,0 +1,233 @@
+# stock_trading_bot/src/profiler.py
+
+import cProfile
+import io
+import os
+import pstats
+import re
+import tracemalloc
+from datetime import datetime
+
+from .config import PROFILE_OUTPUT_DIR, PROFILE_TOP_N, PROFILE_TRACEMALLOC_FRAMES
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+# プロファイル結果を集計する単位 (コンポーネント名 -> モジュールのファイル名)
+PROFILE_COMPONENTS = {
+    "DataManager": "data_manager.py",
+    "IndicatorCache": "indicator_cache.py",
+    "StrategyManager": "strategy_manager.py",
+    "Backtester": "backtester.py",
+    "walk_forward": "walk_forward.py",
+    "Visualizer": "visualizer.py",
+    "ReportGenerator": "report_generator.py",
+}
+
+# コンポーネントのモジュールがあるディレクトリ (同名の外部ファイルと区別するため)
+SOURCE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+PSTATS_FILE_NAME = "profile.pstats"
+PROFILE_REPORT_FILE_NAME = "profile_report.txt"
+
+
+class RunProfiler:
+    """
+    シミュレーション全体の実行時間 (cProfile) とメモリ確保 (tracemalloc) を計測するクラス。
+
+    計測結果は、そのまま pstats や snakeviz で開ける `.pstats` ファイルと、
+    コンポーネント (DataManager, StrategyManager, Backtester など) ごとに
+    集計したテキストレポートとして出力ディレクトリに保存します。
+    メモリは take_snapshot を呼んだ時点で確保されている量を、確保した
+    コンポーネントのソース行ごとに集計します。
+    """
+
+    def __init__(
+        self,
+        output_dir: str = PROFILE_OUTPUT_DIR,
+        top_n: int = PROFILE_TOP_N,
+        traceback_frames: int = PROFILE_TRACEMALLOC_FRAMES,
+    ):
+        """
+        RunProfilerのコンストラクタ。
+
+        Args:
+            output_dir (str): 計測結果の出力先ディレクトリ。
+            top_n (int): レポートに表示する上位の関数・行の数。
+            traceback_frames (int): メモリ確保ごとに記録する呼び出し履歴の深さ。
+                確保した行をコンポーネントのコードまで遡るのに使います。
+        """
+        self.output_dir = output_dir
+        self.top_n = top_n
+        self.traceback_frames = traceback_frames
+        self._profile = cProfile.Profile()
+        self._snapshots = []  # (ラベル, tracemalloc.Snapshot)
+        self._peak_bytes = 0
+        self._started_at = None
+        self._elapsed_seconds = 0.0
+
+    def start(self):
+        """
+        計測を開始します。
+        """
+        tracemalloc.start(self.traceback_frames)
+        self._started_at = datetime.now()
+        self._profile.enable()
+
+    def take_snapshot(self, label: str):
+        """
+        現時点で確保されているメモリのスナップショットを記録します。
+
+        Args:
+            label (str): レポートに表示するスナップショットの名前 (例: 'walk_forward')。
+        """
+        if not tracemalloc.is_tracing():
+            return
+        self._profile.disable()
+        self._snapshots.append((label, tracemalloc.take_snapshot()))
+        self._profile.enable()
+
+    def stop(self):
+        """
+        計測を終了します。
+        """
+        self._profile.disable()
+        if tracemalloc.is_tracing():
+            _, self._peak_bytes = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        if self._started_at is not None:
+            self._elapsed_seconds = (datetime.now() - self._started_at).total_seconds()
+
+    def write_reports(self) -> tuple[str, str]:
+        """
+        計測結果を `.pstats` ファイルとテキストレポートに保存します。
+
+        Returns:
+            tuple[str, str]: (pstats ファイルのパス, テキストレポートのパス)。
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        pstats_path = os.path.join(self.output_dir, PSTATS_FILE_NAME)
+        report_path = os.path.join(self.output_dir, PROFILE_REPORT_FILE_NAME)
+
+        self._profile.dump_stats(pstats_path)
+        with open(report_path, "w", encoding="utf-8") as f:
+            f.write("=== プロファイル結果 ===\n")
+            f.write(f"計測時間: {self._elapsed_seconds:.3f} 秒\n")
+            f.write(f"ピークメモリ (tracemalloc): {self._peak_bytes / 2**20:.1f} MB\n")
+            f.write(self._format_cpu_report())
+            f.writelines(
+                self._format_memory_report(label, snapshot)
+                for label, snapshot in self._snapshots
+            )
+
+        logger.info("プロファイル結果を保存しました: %s, %s", pstats_path, report_path)
+        return pstats_path, report_path
+
+    def _format_cpu_report(self) -> str:
+        """
+        全体とコンポーネントごとの関数別の実行時間を整形します。
+
+        Returns:
+            str: レポートのCPU時間の部分。
+        """
+        stream = io.StringIO()
+        stats = pstats.Stats(self._profile, stream=stream)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE)
+
+        stream.write(f"\n--- 全体: 累積時間の上位 {self.top_n} 関数 ---\n")
+        stats.print_stats(self.top_n)
+
+        # コンポーネントごとの自己時間 (関数自身の処理時間) の合計
+        self_seconds = {component: 0.0 for component in PROFILE_COMPONENTS}
+        for (filename, _, _), (_, _, tottime, _, _) in stats.stats.items():
+            component = self._component_of(filename)
+            if component is not None:
+                self_seconds[component] += tottime
+
+        stream.write("\n--- コンポーネントごとの自己時間の合計 ---\n")
+        for component, seconds in self_seconds.items():
+            stream.write(f"  {component:<16} {seconds:10.3f} 秒\n")
+
+        for component, module_file in PROFILE_COMPONENTS.items():
+            stream.write(
+                f"\n--- {component} ({module_file}): 累積時間の上位 {self.top_n} 関数 ---\n"
+            )
+            # pstats の絞り込みは正規表現で、"ファイル名:行番号(関数名)" に対して行われる
+            stats.print_stats(
+                re.escape(os.path.join(SOURCE_DIR, module_file)) + ":", self.top_n
+            )
+        return stream.getvalue()
+
+    def _format_memory_report(self, label: str, snapshot) -> str:
+        """
+        スナップショット時点で確保されているメモリを、全体の上位行と
+        コンポーネントごとの上位行に整形します。
+
+        メモリを実際に確保するのは pandas/NumPy の内部であることが多いため、
+        コンポーネントごとの集計では、呼び出し履歴の中で最も内側にある
+        そのコンポーネントの行に確保量を割り当てます。
+
+        Args:
+            label (str): スナップショットの名前。
+            snapshot (tracemalloc.Snapshot): メモリのスナップショット。
+
+        Returns:
+            str: レポートのメモリの部分。
+        """
+        snapshot = snapshot.filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            ]
+        )
+        lines = [f"\n=== メモリ確保 ({label} 時点) ==="]
+
+        total_bytes = sum(stat.size for stat in snapshot.statistics("filename"))
+        lines.append(f"確保中のメモリ合計: {total_bytes / 2**20:.1f} MB")
+        lines.append(f"\n--- 全体: 確保量の上位 {self.top_n} 行 ---")
+        for stat in snapshot.statistics("lineno")[: self.top_n]:
+            frame = stat.traceback[0]
+            lines.append(
+                f"  {stat.size / 2**20:10.2f} MB {stat.count:8d} 個  "
+                f"{frame.filename}:{frame.lineno}"
+            )
+
+        component_lines = {component: {} for component in PROFILE_COMPONENTS}
+        for trace in snapshot.traces:
+            # 呼び出し履歴は古い順に並んでいるため、後ろから最も内側の行を探す
+            for frame in reversed(trace.traceback):
+                component = self._component_of(frame.filename)
+                if component is not None:
+                    key = (os.path.basename(frame.filename), frame.lineno)
+                    sizes = component_lines[component]
+                    sizes[key] = sizes.get(key, 0) + trace.size
+                    break
+
+        for component, sizes in component_lines.items():
+            component_total = sum(sizes.values())
+            lines.append(
+                f"\n--- {component}: 合計 {component_total / 2**20:.2f} MB "
+                f"(上位 {self.top_n} 行) ---"
+            )
+            ranked = sorted(sizes.items(), key=lambda item: item[1], reverse=True)
+            for (filename, lineno), size in ranked[: self.top_n]:
+                lines.append(f"  {size / 2**20:10.2f} MB  {filename}:{lineno}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _component_of(filename: str):
+        """
+        ファイル名から対応するコンポーネント名を返します。
+
+        Args:
+            filename (str): ソースファイルのパス。
+
+        Returns:
+            str | None: コンポーネント名。対象外のファイルの場合はNone。
+        """
+        path = os.path.abspath(filename)
+        for component, module_file in PROFILE_COMPONENTS.items():
+            if path == os.path.join(SOURCE_DIR, module_file):
+                return component
+        return None
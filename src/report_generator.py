@@ -2,16 +2,82 @@
 
 import os
 
+import numpy as np
 import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
 
-from .config import REPORT_FILE_NAME  # ここを修正
+from .config import (  # ここを修正
+    REPORT_CHUNK_SIZE,
+    REPORT_FILE_NAME,
+    REPORT_MODE,
+    REPORT_SIDECAR_FORMAT,
+)
+from .logger import get_logger
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow がない場合、Parquet のサイドカーは CSV で出力する
+    pa = None
+    pq = None
+
+logger = get_logger(__name__)
+
+# 指定できるレポートの形式とサイドカーの形式
+REPORT_MODES = ("full", "summary")
+SIDECAR_FORMATS = ("csv", "parquet")
+# Excelの1シートに書き込める最大行数 (見出し行を含む)
+EXCEL_MAX_ROWS = 1_048_576
+# Excel・サイドカーに出力する日付の形式
+DATE_FORMAT = "%Y-%m-%d"
 
 
 class ReportGenerator:
-    def __init__(self):
+    def __init__(
+        self,
+        mode: str = REPORT_MODE,
+        sidecar_format: str = REPORT_SIDECAR_FORMAT,
+        chunk_size: int = REPORT_CHUNK_SIZE,
+    ):
+        """
+        ReportGeneratorのコンストラクタ。
+
+        Args:
+            mode (str): レポートの形式 ("full" または "summary")。
+            sidecar_format (str): 全行のデータを別ファイルに出力する形式
+                ("csv", "parquet", None)。
+            chunk_size (int): 一度に書き込む行数。
+        """
         self.output_dir = "output"
         os.makedirs(self.output_dir, exist_ok=True)
 
+        if mode not in REPORT_MODES:
+            logger.warning(
+                "警告: 未知のレポート形式 '%s' が指定されました。'full' を使用します。",
+                mode,
+            )
+            mode = "full"
+        self.mode = mode
+
+        if sidecar_format is not None and sidecar_format not in SIDECAR_FORMATS:
+            logger.warning(
+                "警告: 未知のサイドカー形式 '%s' が指定されました。'csv' を使用します。",
+                sidecar_format,
+            )
+            sidecar_format = "csv"
+        if sidecar_format == "parquet" and pq is None:
+            logger.warning(
+                "警告: pyarrow がインストールされていないため、サイドカーを CSV で出力します。"
+            )
+            sidecar_format = "csv"
+        if self.mode == "summary" and sidecar_format is None:
+            # 全行のデータはサイドカーにしか残らないため、必ず出力する
+            sidecar_format = "csv"
+        self.sidecar_format = sidecar_format
+        self.chunk_size = max(1, int(chunk_size))
+
     def generate_excel_report(
         self,
         portfolio_df: pd.DataFrame,
@@ -20,60 +86,224 @@ class ReportGenerator:
     ):
         """
         シミュレーション結果をExcelファイルとして出力します。
+
+        行は chunk_size 行ずつ書き込み専用のブックへ追加するため、履歴の
+        行数によらずメモリ使用量は一定です。"summary" モードではExcelに
+        サマリーと集計シートのみを書き込み、全行のデータはサイドカー
+        ファイルに出力します。渡されたDataFrameは変更しません。
+
+        Args:
+            portfolio_df (pd.DataFrame): 'Date', 'Portfolio_Value' 列を持つポートフォリオ履歴。
+            trade_history_df (pd.DataFrame): 取引履歴。
+            summary_results (dict): 'initial_cash', 'final_portfolio_value',
+                'total_return_percentage', 'leverage_ratio' を含む辞書。
         """
         report_path = os.path.join(self.output_dir, REPORT_FILE_NAME)
 
         try:
-            with pd.ExcelWriter(report_path, engine="openpyxl") as writer:
-                # サマリーシート
-                summary_data = {
-                    "項目": [
-                        "初期資金",
-                        "最終ポートフォリオ価値",
-                        "総リターン (%)",
-                        "利用レバレッジ",
-                    ],
-                    "値": [
-                        f"{summary_results['initial_cash']:,.0f} 円",
-                        f"{summary_results['final_portfolio_value']:,.0f} 円",
-                        f"{summary_results['total_return_percentage']:.2f} %",
-                        f"{summary_results['leverage_ratio']} 倍",
-                    ],
-                }
-                df_summary = pd.DataFrame(summary_data)
-                df_summary.to_excel(writer, sheet_name="Summary", index=False)
-
-                # ポートフォリオ履歴シート
-                if not portfolio_df.empty:
-                    # 日付列の表示形式を調整
-                    portfolio_df["Date"] = portfolio_df["Date"].dt.strftime("%Y-%m-%d")
-                    portfolio_df.to_excel(
-                        writer, sheet_name="Portfolio History", index=False
-                    )
-                else:
-                    empty_df = pd.DataFrame(
-                        {"Message": ["ポートフォリオ履歴データがありません。"]}
-                    )
-                    empty_df.to_excel(
-                        writer, sheet_name="Portfolio History", index=False
-                    )
+            workbook = Workbook(write_only=True)
 
-                # 取引履歴シート
-                if not trade_history_df.empty:
-                    # 日付列の表示形式を調整
-                    trade_history_df["Date"] = trade_history_df["Date"].dt.strftime(
-                        "%Y-%m-%d"
-                    )
-                    trade_history_df.to_excel(
-                        writer, sheet_name="Trade History", index=False
-                    )
-                else:
-                    empty_df = pd.DataFrame(
-                        {"Message": ["取引履歴データがありません。"]}
-                    )
-                    empty_df.to_excel(writer, sheet_name="Trade History", index=False)
+            # サマリーシート
+            summary_data = {
+                "項目": [
+                    "初期資金",
+                    "最終ポートフォリオ価値",
+                    "総リターン (%)",
+                    "利用レバレッジ",
+                ],
+                "値": [
+                    f"{summary_results['initial_cash']:,.0f} 円",
+                    f"{summary_results['final_portfolio_value']:,.0f} 円",
+                    f"{summary_results['total_return_percentage']:.2f} %",
+                    f"{summary_results['leverage_ratio']} 倍",
+                ],
+            }
+            self._write_sheet(workbook, "Summary", pd.DataFrame(summary_data))
+
+            if self.mode == "summary":
+                self._write_sheet(
+                    workbook,
+                    "Monthly Summary",
+                    self._monthly_summary(portfolio_df, summary_results),
+                    "ポートフォリオ履歴データがありません。",
+                )
+                self._write_sheet(
+                    workbook,
+                    "Trades by Ticker",
+                    self._trades_by_ticker(trade_history_df),
+                    "取引履歴データがありません。",
+                )
+            else:
+                self._write_sheet(
+                    workbook,
+                    "Portfolio History",
+                    portfolio_df,
+                    "ポートフォリオ履歴データがありません。",
+                )
+                self._write_sheet(
+                    workbook,
+                    "Trade History",
+                    trade_history_df,
+                    "取引履歴データがありません。",
+                )
 
-            print(f"レポートを保存しました: {report_path}")
+            workbook.save(report_path)
+            logger.info("レポートを保存しました: %s", report_path)
+
+            if self.sidecar_format is not None:
+                base_path = os.path.splitext(report_path)[0]
+                self._write_sidecar(portfolio_df, f"{base_path}_portfolio")
+                self._write_sidecar(trade_history_df, f"{base_path}_trades")
 
         except Exception as e:
-            print(f"レポートの生成中にエラーが発生しました: {e}")
+            logger.error("レポートの生成中にエラーが発生しました: %s", e)
+
+    def _write_sheet(
+        self,
+        workbook: Workbook,
+        sheet_name: str,
+        df: pd.DataFrame,
+        empty_message: str | None = None,
+    ):
+        """
+        DataFrameを chunk_size 行ずつシートに追加します。
+
+        Args:
+            workbook (Workbook): 書き込み専用のブック。
+            sheet_name (str): シート名。
+            df (pd.DataFrame): 書き込むデータ。
+            empty_message (str, optional): データが空の場合に代わりに書き込むメッセージ。
+        """
+        if df.empty and empty_message is not None:
+            df = pd.DataFrame({"Message": [empty_message]})
+        if len(df) >= EXCEL_MAX_ROWS:
+            logger.warning(
+                "警告: %s の %s 行はExcelの最大行数を超えるため、先頭の %s 行のみ書き込みます。"
+                "全行を出力するには REPORT_MODE を 'summary' にしてください。",
+                sheet_name,
+                len(df),
+                EXCEL_MAX_ROWS - 1,
+            )
+            df = df.iloc[: EXCEL_MAX_ROWS - 1]
+
+        worksheet = workbook.create_sheet(sheet_name)
+        header_font = Font(bold=True)
+        header = []
+        for column in df.columns:
+            cell = WriteOnlyCell(worksheet, value=str(column))
+            cell.font = header_font
+            header.append(cell)
+        worksheet.append(header)
+
+        for start in range(0, len(df), self.chunk_size):
+            chunk = df.iloc[start : start + self.chunk_size]
+            for row in zip(*(self._excel_values(chunk[c]) for c in chunk.columns)):
+                worksheet.append(row)
+
+    @staticmethod
+    def _excel_values(series: pd.Series) -> list:
+        """
+        列の値をExcelに書き込める Python の値のリストに変換します。
+
+        日付は DATE_FORMAT の文字列に、欠損値は空のセル (None) に変換します。
+
+        Args:
+            series (pd.Series): 変換する列。
+
+        Returns:
+            list: 変換後の値。
+        """
+        if pd.api.types.is_datetime64_any_dtype(series):
+            series = series.dt.strftime(DATE_FORMAT)
+        values = series.to_numpy()
+        missing = pd.isna(values)
+        if missing.any():
+            values = np.where(missing, None, values.astype(object))
+        return values.tolist()
+
+    def _write_sidecar(self, df: pd.DataFrame, base_path: str):
+        """
+        全行のデータをサイドカーファイルに chunk_size 行ずつ書き込みます。
+
+        Args:
+            df (pd.DataFrame): 書き込むデータ。
+            base_path (str): 拡張子を除いた出力先のパス。
+        """
+        path = f"{base_path}.{self.sidecar_format}"
+        if self.sidecar_format == "parquet":
+            # スキーマは全行から一度だけ求め、全チャンクで共通にする
+            # (欠損だけのチャンクなどで型の推論結果が変わると書き込めないため)
+            schema = pa.Schema.from_pandas(df, preserve_index=False)
+            with pq.ParquetWriter(path, schema) as writer:
+                for start in range(0, max(len(df), 1), self.chunk_size):
+                    writer.write_table(
+                        pa.Table.from_pandas(
+                            df.iloc[start : start + self.chunk_size],
+                            schema=schema,
+                            preserve_index=False,
+                        )
+                    )
+        else:
+            df.to_csv(
+                path, index=False, chunksize=self.chunk_size, date_format=DATE_FORMAT
+            )
+        logger.info("データを保存しました: %s (%s 行)", path, len(df))
+
+    @staticmethod
+    def _monthly_summary(
+        portfolio_df: pd.DataFrame, summary_results: dict
+    ) -> pd.DataFrame:
+        """
+        ポートフォリオ履歴を月末の値と月間リターンに集計します。
+
+        Args:
+            portfolio_df (pd.DataFrame): 'Date', 'Portfolio_Value' 列を持つポートフォリオ履歴。
+            summary_results (dict): 'initial_cash' を含む辞書 (最初の月のリターンの基準)。
+
+        Returns:
+            pd.DataFrame: 'Month', 'Month_End_Value', 'Monthly_Return_Pct' 列を持つ集計。
+        """
+        if portfolio_df.empty:
+            return pd.DataFrame()
+        month_end_values = portfolio_df.groupby(
+            portfolio_df["Date"].dt.to_period("M"), sort=True
+        )["Portfolio_Value"].last()
+        previous_values = month_end_values.shift(
+            1, fill_value=summary_results["initial_cash"]
+        )
+        return pd.DataFrame(
+            {
+                "Month": month_end_values.index.astype(str),
+                "Month_End_Value": month_end_values.to_numpy(),
+                "Monthly_Return_Pct": (
+                    (month_end_values / previous_values - 1) * 100
+                ).to_numpy(),
+            }
+        )
+
+    @staticmethod
+    def _trades_by_ticker(trade_history_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        取引履歴を銘柄ごとの売買回数と買付金額に集計します。
+
+        Args:
+            trade_history_df (pd.DataFrame): 取引履歴。
+
+        Returns:
+            pd.DataFrame: 'Ticker', 'Buy_Count', 'Sell_Count', 'Buy_Amount' 列を持つ集計。
+        """
+        if trade_history_df.empty:
+            return pd.DataFrame()
+        is_buy = trade_history_df["Trade_Type"] == "BUY"
+        buy_amount = (trade_history_df["Price"] * trade_history_df["Shares"]).where(
+            is_buy, 0.0
+        )
+        grouped = pd.DataFrame(
+            {
+                "Ticker": trade_history_df["Ticker"],
+                "Buy_Count": is_buy.astype(int),
+                "Sell_Count": (trade_history_df["Trade_Type"] == "SELL").astype(int),
+                "Buy_Amount": buy_amount.astype(float),
+            }
+        ).groupby("Ticker", sort=True)
+        return grouped.sum().reset_index()
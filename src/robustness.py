@@ -0,0 +1,224 @@
+# stock_trading_bot/src/robustness.py
+
+import math
+
+import numpy as np
+import pandas as pd
+
+from .config import ROBUSTNESS
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+# 指定できる再標本化の方法
+RESAMPLING_METHODS = ("iid", "block", "stationary")
+
+
+class RobustnessAnalyzer:
+    """
+    リターン系列をブートストラップで再標本化し、資産推移の分布から頑健性を評価するクラス。
+
+    1回のシミュレーション結果 (総リターン1つ) だけでは、同じ戦略で起こり得た
+    結果のばらつきが分かりません。このクラスは日次 (または取引ごと) の
+    リターンを復元抽出して並べ替えた資産推移を n_paths 本生成し、最終価値・
+    総リターン・最大ドローダウンの分布を返します。資産推移は chunk_size 本
+    ずつ (本数 × 日数) の配列でまとめて計算するため、メモリ使用量は
+    chunk_size × 日数に比例します。
+
+    - "iid": 1日ずつ独立に抽出します (リターンの自己相関は失われます)。
+    - "block": 長さ block_size のブロック単位で抽出します。系列の末尾は先頭へ
+      循環させるため、全ての日が同じ確率で選ばれます。
+    - "stationary": 平均 block_size の幾何分布に従う長さのブロックで抽出します
+      (Politis-Romano の定常ブートストラップ)。
+    """
+
+    def __init__(
+        self,
+        method: str = ROBUSTNESS["method"],
+        n_paths: int = ROBUSTNESS["n_paths"],
+        block_size: int = ROBUSTNESS["block_size"],
+        seed: int = ROBUSTNESS["seed"],
+        chunk_size: int = ROBUSTNESS["chunk_size"],
+    ):
+        """
+        RobustnessAnalyzerのコンストラクタ。
+
+        Args:
+            method (str): 再標本化の方法 (RESAMPLING_METHODS のいずれか)。
+            n_paths (int): 生成する資産推移の数。
+            block_size (int): ブロックの長さ ("stationary" では平均の長さ)。
+            seed (int): 乱数のシード値 (同じ値と chunk_size なら同じ結果)。
+            chunk_size (int): 一度に計算する資産推移の数。
+        """
+        if method not in RESAMPLING_METHODS:
+            logger.warning(
+                "警告: 未知の再標本化の方法 '%s' が指定されました。'block' を使用します。",
+                method,
+            )
+            method = "block"
+        self.method = method
+        self.n_paths = max(1, int(n_paths))
+        self.block_size = max(1, int(block_size))
+        self.seed = seed
+        self.chunk_size = max(1, int(chunk_size))
+
+    @staticmethod
+    def daily_returns(portfolio_dfs) -> np.ndarray:
+        """
+        ポートフォリオ履歴から日次リターンを計算します。
+
+        ウォークフォワードの各テスト期間は初期資金から始まるため、期間をまたぐ
+        変化はリターンに含めず、期間ごとに計算してから日付順に結合します。
+        同じ日付が複数の期間にある場合は、統合ポートフォリオと同じく後の期間の
+        値を使います。
+
+        Args:
+            portfolio_dfs (pd.DataFrame | list[pd.DataFrame]): 'Date', 'Portfolio_Value'
+                列を持つポートフォリオ履歴 (またはテスト期間ごとの履歴のリスト)。
+
+        Returns:
+            np.ndarray: 日付順の日次リターン (0.01 = 1%)。
+        """
+        if isinstance(portfolio_dfs, pd.DataFrame):
+            portfolio_dfs = [portfolio_dfs]
+
+        frames = []
+        for df in portfolio_dfs:
+            if df is None or len(df) < 2:
+                continue
+            values = df["Portfolio_Value"].to_numpy(dtype=float)
+            frames.append(
+                pd.DataFrame(
+                    {
+                        "Date": df["Date"].to_numpy()[1:],
+                        "Return": values[1:] / values[:-1] - 1,
+                    }
+                )
+            )
+        if not frames:
+            return np.empty(0)
+
+        returns = (
+            pd.concat(frames, ignore_index=True)
+            .drop_duplicates(subset="Date", keep="last")
+            .sort_values(by="Date", kind="stable")
+        )
+        return returns["Return"].to_numpy()
+
+    @staticmethod
+    def trade_returns(trade_history_df: pd.DataFrame) -> np.ndarray:
+        """
+        取引履歴から、取引ごとのポートフォリオ価値の変化率を計算します。
+
+        Args:
+            trade_history_df (pd.DataFrame): 'Portfolio_Value' 列を持つ取引履歴。
+
+        Returns:
+            np.ndarray: 取引順の変化率 (0.01 = 1%)。
+        """
+        if trade_history_df is None or len(trade_history_df) < 2:
+            return np.empty(0)
+        values = trade_history_df["Portfolio_Value"].to_numpy(dtype=float)
+        return values[1:] / values[:-1] - 1
+
+    def _resample_indices(self, rng, n_paths: int, n_days: int) -> np.ndarray:
+        """
+        再標本化した資産推移の各日に使う、元の系列の位置を生成します。
+
+        Args:
+            rng (np.random.Generator): 乱数生成器。
+            n_paths (int): 資産推移の数。
+            n_days (int): 元の系列の長さ (各資産推移の日数)。
+
+        Returns:
+            np.ndarray: (n_paths, n_days) の位置の配列。
+        """
+        if self.method == "iid":
+            return rng.integers(0, n_days, size=(n_paths, n_days))
+
+        block_size = min(self.block_size, n_days)
+        if self.method == "block":
+            n_blocks = math.ceil(n_days / block_size)
+            starts = rng.integers(0, n_days, size=(n_paths, n_blocks, 1))
+            indices = (starts + np.arange(block_size)) % n_days
+            return indices.reshape(n_paths, n_blocks * block_size)[:, :n_days]
+
+        # stationary: 各日を確率 1/block_size で新しいブロックの開始とし、
+        # 直前のブロックの開始日からの経過日数だけ開始位置を進める
+        days = np.arange(n_days)
+        is_new_block = rng.random((n_paths, n_days)) < 1.0 / block_size
+        is_new_block[:, 0] = True
+        block_start_day = np.maximum.accumulate(np.where(is_new_block, days, 0), axis=1)
+        starts = rng.integers(0, n_days, size=(n_paths, n_days))
+        block_start_index = np.take_along_axis(starts, block_start_day, axis=1)
+        return (block_start_index + (days - block_start_day)) % n_days
+
+    def simulate(self, returns, initial_value: float = 1.0) -> dict:
+        """
+        リターン系列を再標本化した資産推移を生成し、結果の分布を返します。
+
+        Args:
+            returns (array-like): 日次 (または取引ごと) のリターン (0.01 = 1%)。
+            initial_value (float): 資産推移の初期値。
+
+        Returns:
+            dict: 'final_values' (最終価値)、'total_returns' (総リターン %)、
+                'max_drawdowns' (最大ドローダウン %、0 以下) の、それぞれ長さ
+                n_paths の配列。リターンがない場合はNone。
+        """
+        returns = np.asarray(returns, dtype=float)
+        returns = returns[~np.isnan(returns)]
+        n_days = len(returns)
+        if n_days == 0:
+            logger.warning(
+                "警告: 頑健性評価に使えるリターンがありません。評価をスキップします。"
+            )
+            return None
+
+        growth_factors = 1.0 + returns
+        rng = np.random.default_rng(self.seed)
+        final_growth = np.empty(self.n_paths)
+        max_drawdowns = np.empty(self.n_paths)
+
+        for start in range(0, self.n_paths, self.chunk_size):
+            stop = min(start + self.chunk_size, self.n_paths)
+            indices = self._resample_indices(rng, stop - start, n_days)
+            # 初期値を 1 とした資産推移 (本数 × 日数)
+            equity = np.take(growth_factors, indices)
+            np.cumprod(equity, axis=1, out=equity)
+            final_growth[start:stop] = equity[:, -1]
+
+            # 初期値も高値として扱い、高値からの下落率の最小値を最大ドローダウンとする
+            peaks = np.maximum.accumulate(equity, axis=1)
+            np.maximum(peaks, 1.0, out=peaks)
+            np.divide(equity, peaks, out=equity)
+            max_drawdowns[start:stop] = equity.min(axis=1) - 1.0
+
+        return {
+            "final_values": final_growth * initial_value,
+            "total_returns": (final_growth - 1.0) * 100,
+            "max_drawdowns": max_drawdowns * 100,
+        }
+
+    @staticmethod
+    def summarize(result: dict, percentiles=ROBUSTNESS["percentiles"]) -> pd.DataFrame:
+        """
+        simulate の結果をパーセンタイルの表にまとめます。
+
+        Args:
+            result (dict): simulate の戻り値。
+            percentiles (Iterable[float]): 表に含めるパーセンタイル (0〜100)。
+
+        Returns:
+            pd.DataFrame: インデックスがパーセンタイル、列が 'Final_Value',
+                'Total_Return_Pct', 'Max_Drawdown_Pct' の表。
+        """
+        percentiles = list(percentiles)
+        return pd.DataFrame(
+            {
+                "Final_Value": np.percentile(result["final_values"], percentiles),
+                "Total_Return_Pct": np.percentile(result["total_returns"], percentiles),
+                "Max_Drawdown_Pct": np.percentile(result["max_drawdowns"], percentiles),
+            },
+            index=pd.Index(percentiles, name="Percentile"),
+        )
@@ -1,21 +1,351 @@
 # stock_trading_bot/src/strategy_manager.py
 
+import functools
+
+import numpy as np
 import pandas as pd
 
+from . import parameter_search
 from .config import (  # 最適化範囲をインポート
+    RSI_OVERBOUGHT_RANGE,
+    RSI_OVERSOLD_RANGE,
+    RSI_PERIOD_RANGE,
     SMA_LONG_RANGE,
+    SMA_OPTIMIZATION_MODE,
     SMA_SHORT_RANGE,
     STRATEGIES,  # 新しく追加
 )
+from .data_manager import compute_rsi_table
+from .logger import get_logger
+from .optimization_cache import OptimizationCache, source_fingerprint
+from .parameter_search import ParameterSearch
+from .strategy_registry import get_strategy, register_strategy, required_indicators
+
+logger = get_logger(__name__)
+
+# SMA戦略の最適化の対象銘柄の指定方法 (config.SMA_OPTIMIZATION_MODE)
+SMA_OPTIMIZATION_MODES = ("first_ticker", "per_ticker", "pooled")
+
+# 最適化の目的関数の名前 (最適化キャッシュのキーに含める)
+OPTIMIZATION_OBJECTIVE = "all_in_total_return"
+
+
+def detect_crossovers(short_ma: np.ndarray, long_ma: np.ndarray) -> np.ndarray:
+    """
+    短期/長期移動平均線のクロスを配列演算で検出します。
+
+    1行前と当日の大小関係を比較し、ゴールデンクロスを 1、デッドクロスを -1、
+    それ以外を 0 とします。先頭行は比較対象がないため常に 0 です。
+    NaN を含む比較は偽となるため、シグナルは発生しません。
+
+    Args:
+        short_ma (np.ndarray): 短期移動平均。形状は (日付,) または (日付, 銘柄)。
+        long_ma (np.ndarray): 長期移動平均。short_ma と同じ形状。
+
+    Returns:
+        np.ndarray: short_ma と同じ形状のシグナル配列 (int8)。
+    """
+    signals = np.zeros(short_ma.shape, dtype=np.int8)
+    if short_ma.shape[0] < 2:
+        return signals
+
+    prev_short, curr_short = short_ma[:-1], short_ma[1:]
+    prev_long, curr_long = long_ma[:-1], long_ma[1:]
+
+    # ゴールデンクロス
+    golden = (prev_short <= prev_long) & (curr_short > curr_long)
+    # デッドクロス (ゴールデンクロスが優先される元の if/elif と同じ判定順)
+    dead = ~golden & (prev_short >= prev_long) & (curr_short < curr_long)
+
+    signals[1:][golden] = 1  # 買い
+    signals[1:][dead] = -1  # 売り
+    return signals
+
+
+def _rolling_mean_table(values: np.ndarray, windows: list) -> np.ndarray:
+    """
+    累積和テーブルから複数期間の単純移動平均をまとめて計算します。
+
+    `pd.Series.rolling(window).mean()` と同様に、期間に満たない先頭行は NaN です。
+
+    Args:
+        values (np.ndarray): 時系列の値。形状は (日付,) または (日付, 銘柄)。
+        windows (list[int]): 移動平均の期間のリスト。
+
+    Returns:
+        np.ndarray: 形状 values.shape + (len(windows),) の移動平均テーブル。
+    """
+    n_rows = values.shape[0]
+    zeros = np.zeros((1,) + values.shape[1:])
+    missing = np.isnan(values)
+    cumsum = np.concatenate(
+        [zeros, np.cumsum(np.where(missing, 0.0, values), axis=0)], axis=0
+    )
+    missing_count = np.concatenate([zeros, np.cumsum(missing, axis=0)], axis=0)
+
+    table = np.full(values.shape + (len(windows),), np.nan)
+    for k, window in enumerate(windows):
+        if window > n_rows:
+            continue
+        means = (cumsum[window:] - cumsum[:-window]) / window
+        # 期間内に欠損を含む場合は rolling().mean() と同じく NaN とする
+        means[missing_count[window:] - missing_count[:-window] > 0] = np.nan
+        table[window - 1 :, ..., k] = means
+    return table
+
+
+def _evaluate_sma_pairs(
+    close: np.ndarray,
+    sma_table: np.ndarray,
+    short_idx: np.ndarray,
+    long_idx: np.ndarray,
+    max_chunk_elements: int = 2_000_000,
+) -> np.ndarray:
+    """
+    SMAパラメータの組み合わせごとの簡易リターンを一括で評価します。
+
+    メモリ使用量を抑えるため、組み合わせを (日付 × 組み合わせ) の要素数が
+    max_chunk_elements 以下となるチャンクに分けて処理します。
+
+    Args:
+        close (np.ndarray): 終値。形状は (日付,) または (日付, 銘柄)。
+        sma_table (np.ndarray): `_rolling_mean_table` の戻り値。
+        short_idx (np.ndarray): 組み合わせごとの短期期間の列番号。
+        long_idx (np.ndarray): 組み合わせごとの長期期間の列番号。
+        max_chunk_elements (int): 1チャンクあたりの最大要素数。
+
+    Returns:
+        np.ndarray: 形状 close.shape[1:] + (組み合わせ数,) の総リターン。
+    """
+    rows_per_pair = int(np.prod(close.shape))
+    chunk = max(1, max_chunk_elements // max(rows_per_pair, 1))
+    results = []
+    for start in range(0, len(short_idx), chunk):
+        stop = start + chunk
+        signals = detect_crossovers(
+            sma_table[..., short_idx[start:stop]],
+            sma_table[..., long_idx[start:stop]],
+        )
+        results.append(_simulate_all_in_returns(close, signals))
+    return np.concatenate(results, axis=-1)
+
+
+def _evaluate_rsi_combinations(
+    close: np.ndarray,
+    rsi_table: np.ndarray,
+    period_idx: np.ndarray,
+    oversold: np.ndarray,
+    overbought: np.ndarray,
+    max_chunk_elements: int = 2_000_000,
+) -> np.ndarray:
+    """
+    RSIパラメータの組み合わせごとの簡易リターンを一括で評価します。
+
+    シグナルは `_generate_rsi_signals` と同じく、RSIが売られすぎ閾値以下の日を
+    買い (1)、買われすぎ閾値以上の日を売り (-1) とします。メモリ使用量を
+    抑えるため、組み合わせを (日付 × 組み合わせ) の要素数が
+    max_chunk_elements 以下となるチャンクに分けて処理します。
+
+    Args:
+        close (np.ndarray): 終値。形状は (日付,)。
+        rsi_table (np.ndarray): `compute_rsi_table` で計算した (日付, 期間) のRSI。
+        period_idx (np.ndarray): 組み合わせごとのRSI期間の列番号。
+        oversold (np.ndarray): 組み合わせごとの売られすぎ閾値。
+        overbought (np.ndarray): 組み合わせごとの買われすぎ閾値。
+        max_chunk_elements (int): 1チャンクあたりの最大要素数。
+
+    Returns:
+        np.ndarray: 形状 (組み合わせ数,) の総リターン。
+    """
+    chunk = max(1, max_chunk_elements // max(len(close), 1))
+    results = []
+    for start in range(0, len(period_idx), chunk):
+        stop = start + chunk
+        rsi = rsi_table[:, period_idx[start:stop]]
+        signals = np.zeros(rsi.shape, dtype=np.int8)
+        signals[rsi <= oversold[start:stop]] = 1  # 売られすぎ -> 買い
+        signals[rsi >= overbought[start:stop]] = -1  # 買われすぎ -> 売り
+        results.append(_simulate_all_in_returns(close, signals))
+    return np.concatenate(results, axis=-1)
+
+
+def _simulate_all_in_returns(
+    close: np.ndarray, signals: np.ndarray, initial_cash: float = 1000000
+) -> np.ndarray:
+    """
+    最適化用の簡易売買シミュレーションを全パラメータについて同時に実行します。
+
+    買いシグナルで現金の全額分の株を買い、売りシグナルで全株を売却します。
+    状態 (現金・保有株数) は最後の軸 (パラメータ) と銘柄の軸について配列で保持し、
+    いずれかのシグナルがある日付だけを順番に処理します。
+
+    Args:
+        close (np.ndarray): 終値。形状は (日付,) または (日付, 銘柄)。
+        signals (np.ndarray): 形状 close.shape + (パラメータ数,) のシグナル。
+        initial_cash (float): 仮の初期資金。
+
+    Returns:
+        np.ndarray: 形状 signals.shape[1:] の総リターン。
+    """
+    state_shape = signals.shape[1:]
+    cash = np.full(state_shape, float(initial_cash))
+    shares = np.zeros(state_shape, dtype=np.int64)
+    prices = close[..., np.newaxis]
+
+    active_rows = np.flatnonzero(signals.reshape(len(signals), -1).any(axis=1))
+    for row in active_rows:
+        signal = signals[row]
+        price = np.broadcast_to(prices[row], state_shape)
+
+        # ゴールデンクロス (買いシグナル)
+        buy = (signal == 1) & (cash > 0)
+        shares_to_buy = np.zeros(state_shape, dtype=np.int64)
+        shares_to_buy[buy] = np.floor_divide(cash[buy], price[buy]).astype(np.int64)
+        buy &= shares_to_buy > 0
+        shares[buy] += shares_to_buy[buy]
+        cash[buy] -= shares_to_buy[buy] * price[buy]
+
+        # デッドクロス (売りシグナル)
+        sell = (signal == -1) & (shares > 0)
+        cash[sell] += shares[sell] * price[sell]
+        shares[sell] = 0
+
+    # 最終的な資産価値
+    final_price = np.broadcast_to(prices[-1], state_shape)
+    final_value = cash + np.where(shares > 0, shares * final_price, 0)
+    return (final_value - initial_cash) / initial_cash
+
+
+def sma_crossover_signals(df: pd.DataFrame, params: dict):
+    """
+    移動平均線 (SMA) のクロスに基づく売買シグナルを計算します。
+
+    Args:
+        df (pd.DataFrame): 'SMA_{期間}' 列を含むDataFrame。
+        params (dict): 戦略パラメータ (例: {'short_ma': 5, 'long_ma': 20})。
+
+    Returns:
+        np.ndarray | None: 売買シグナル (int64)。計算できない場合はNone。
+    """
+    short_ma_period = params.get("short_ma")
+    long_ma_period = params.get("long_ma")
+
+    if short_ma_period is None or long_ma_period is None:
+        logger.error("エラー: SMA戦略に必要なパラメータが不足しています。")
+        return None
+
+    short_ma_col = f"SMA_{short_ma_period}"
+    long_ma_col = f"SMA_{long_ma_period}"
+
+    if short_ma_col not in df.columns or long_ma_col not in df.columns:
+        logger.warning(
+            "警告: 必要なMA列 (%sまたは%s)が見つかりません。シグナル生成をスキップします。",
+            short_ma_col,
+            long_ma_col,
+        )
+        return None
+
+    return detect_crossovers(
+        df[short_ma_col].to_numpy(dtype=float),
+        df[long_ma_col].to_numpy(dtype=float),
+    ).astype(np.int64)
+
+
+def rsi_level_signals(df: pd.DataFrame, params: dict):
+    """
+    RSI (Relative Strength Index) の水準に基づく売買シグナルを計算します。
+
+    RSIは 'RSI_{期間}' 列 (パイプラインで計算した場合) を優先し、
+    ない場合は 'RSI' 列を使います。
+
+    Args:
+        df (pd.DataFrame): RSI列を含むDataFrame。
+        params (dict): 戦略パラメータ (例: {'rsi_period': 14, 'rsi_overbought': 70, 'rsi_oversold': 30})。
+
+    Returns:
+        np.ndarray | None: 売買シグナル (int64)。計算できない場合はNone。
+    """
+    rsi_overbought = params.get("rsi_overbought")
+    rsi_oversold = params.get("rsi_oversold")
+
+    if rsi_overbought is None or rsi_oversold is None:
+        logger.error("エラー: RSI戦略に必要なパラメータが不足しています。")
+        return None
+
+    rsi_col = f"RSI_{params.get('rsi_period')}"
+    if rsi_col not in df.columns:
+        rsi_col = "RSI"
+    if rsi_col not in df.columns:
+        logger.warning("警告: RSI列が見つかりません。RSIシグナル生成をスキップします。")
+        return None
+
+    rsi = df[rsi_col].to_numpy(dtype=float)
+    signals = np.zeros(len(rsi), dtype=np.int64)
+    signals[rsi <= rsi_oversold] = 1  # 売られすぎ -> 買い
+    signals[rsi >= rsi_overbought] = -1  # 買われすぎ -> 売り
+    return signals
+
+
+register_strategy(
+    "SMA_Strategy",
+    lambda params: [("SMA", (params["short_ma"],)), ("SMA", (params["long_ma"],))],
+    sma_crossover_signals,
+)
+register_strategy(
+    "RSI_Strategy",
+    lambda params: [("RSI", (params["rsi_period"],))],
+    rsi_level_signals,
+)
+# 他の戦略も register_strategy で登録する
 
 
 class StrategyManager:
-    def __init__(self):
+    def __init__(
+        self,
+        sma_short_range=SMA_SHORT_RANGE,
+        sma_long_range=SMA_LONG_RANGE,
+        rsi_period_range=RSI_PERIOD_RANGE,
+        rsi_oversold_range=RSI_OVERSOLD_RANGE,
+        rsi_overbought_range=RSI_OVERBOUGHT_RANGE,
+        sma_optimization_mode: str = SMA_OPTIMIZATION_MODE,
+        parameter_search: ParameterSearch | None = None,
+        optimization_cache: OptimizationCache | None = None,
+    ):
         """
         StrategyManagerのコンストラクタ。
         利用可能な戦略をconfigからロードします。
+
+        Args:
+            sma_short_range (Iterable[int]): SMA戦略の最適化で探索する短期期間。
+            sma_long_range (Iterable[int]): SMA戦略の最適化で探索する長期期間。
+            rsi_period_range (Iterable[int]): RSI戦略の最適化で探索するRSI期間。
+            rsi_oversold_range (Iterable[int]): RSI戦略の最適化で探索する売られすぎ閾値。
+            rsi_overbought_range (Iterable[int]): RSI戦略の最適化で探索する買われすぎ閾値。
+            sma_optimization_mode (str): SMA戦略の最適化の対象銘柄
+                ("first_ticker", "per_ticker", "pooled")。
+            parameter_search (ParameterSearch, optional): SMA戦略のパラメータの
+                探索方法。省略時は config.PARAMETER_SEARCH の設定。
+            optimization_cache (OptimizationCache, optional): 最適化結果を
+                保存・再利用するディスクキャッシュ。省略時はキャッシュしません。
         """
         self.available_strategies = STRATEGIES
+        self.sma_short_range = sma_short_range
+        self.sma_long_range = sma_long_range
+        self.rsi_period_range = rsi_period_range
+        self.rsi_oversold_range = rsi_oversold_range
+        self.rsi_overbought_range = rsi_overbought_range
+
+        if sma_optimization_mode not in SMA_OPTIMIZATION_MODES:
+            logger.warning(
+                "警告: 未知の最適化モード '%s' が指定されました。'first_ticker' を使用します。",
+                sma_optimization_mode,
+            )
+            sma_optimization_mode = "first_ticker"
+        self.sma_optimization_mode = sma_optimization_mode
+        self.parameter_search = (
+            parameter_search if parameter_search is not None else ParameterSearch()
+        )
+        self.optimization_cache = optimization_cache
 
     def _generate_sma_signals(self, df: pd.DataFrame, params: dict) -> pd.DataFrame:
         """
@@ -28,39 +358,41 @@ class StrategyManager:
         Returns:
             pd.DataFrame: 'MA_Signal' 列が追加されたDataFrame。
         """
-        df_copy = df.copy()
-        short_ma_period = params.get("short_ma")
-        long_ma_period = params.get("long_ma")
-
-        if short_ma_period is None or long_ma_period is None:
-            print("エラー: SMA戦略に必要なパラメータが不足しています。")
+        signals = sma_crossover_signals(df, params)
+        if signals is None:
             return pd.DataFrame()
 
-        short_ma_col = f"SMA_{short_ma_period}"
-        long_ma_col = f"SMA_{long_ma_period}"
-
-        if short_ma_col not in df_copy.columns or long_ma_col not in df_copy.columns:
-            print(
-                f"警告: 必要なMA列 ({short_ma_col}または{long_ma_col})が見つかりません。シグナル生成をスキップします。"
-            )
-            return pd.DataFrame()
+        df_copy = df.copy()
+        df_copy["MA_Signal"] = signals
+        return df_copy
 
-        df_copy["MA_Signal"] = 0
+    def generate_sma_signal_matrix(
+        self, price_panel: pd.DataFrame, short_ma: int, long_ma: int
+    ) -> pd.DataFrame:
+        """
+        複数銘柄の終値パネルから、SMAクロスの売買シグナル行列を一括で生成します。
 
-        for i in range(1, len(df_copy)):
-            prev_short_ma = df_copy[short_ma_col].iloc[i - 1]
-            curr_short_ma = df_copy[short_ma_col].iloc[i]
-            prev_long_ma = df_copy[long_ma_col].iloc[i - 1]
-            curr_long_ma = df_copy[long_ma_col].iloc[i]
+        移動平均は `DataManager.compute_sma` と同じく `min_periods=1` で
+        銘柄の列ごとに計算し、`generate_trading_signals(df, "SMA_Strategy", ...)`
+        と同じ +1/-1/0 のシグナルを返します。上場前などの NaN の区間では
+        シグナルは発生しません。
 
-            # ゴールデンクロス
-            if prev_short_ma <= prev_long_ma and curr_short_ma > curr_long_ma:
-                df_copy.loc[i, "MA_Signal"] = 1  # 買い
+        Args:
+            price_panel (pd.DataFrame): 行が日付、列が銘柄の終値パネル。
+            short_ma (int): 短期移動平均線の期間。
+            long_ma (int): 長期移動平均線の期間。
 
-            # デッドクロス
-            elif prev_short_ma >= prev_long_ma and curr_short_ma < curr_long_ma:
-                df_copy.loc[i, "MA_Signal"] = -1  # 売り
-        return df_copy
+        Returns:
+            pd.DataFrame: price_panel と同じ形状のシグナル行列 (int8)。
+        """
+        short_sma = price_panel.rolling(window=short_ma, min_periods=1).mean()
+        long_sma = price_panel.rolling(window=long_ma, min_periods=1).mean()
+        signals = detect_crossovers(
+            short_sma.to_numpy(dtype=float), long_sma.to_numpy(dtype=float)
+        )
+        return pd.DataFrame(
+            signals, index=price_panel.index, columns=price_panel.columns
+        )
 
     def _generate_rsi_signals(self, df: pd.DataFrame, params: dict) -> pd.DataFrame:
         """
@@ -73,25 +405,12 @@ class StrategyManager:
         Returns:
             pd.DataFrame: 'RSI_Signal' 列が追加されたDataFrame。
         """
-        df_copy = df.copy()
-        rsi_overbought = params.get("rsi_overbought")
-        rsi_oversold = params.get("rsi_oversold")
-
-        if rsi_overbought is None or rsi_oversold is None:
-            print("エラー: RSI戦略に必要なパラメータが不足しています。")
-            return pd.DataFrame()
-
-        if "RSI" not in df_copy.columns:
-            print("警告: RSI列が見つかりません。RSIシグナル生成をスキップします。")
+        signals = rsi_level_signals(df, params)
+        if signals is None:
             return pd.DataFrame()
 
-        df_copy["RSI_Signal"] = 0
-        df_copy.loc[df_copy["RSI"] <= rsi_oversold, "RSI_Signal"] = (
-            1  # 売られすぎ -> 買い
-        )
-        df_copy.loc[
-            df_copy["RSI"] >= rsi_overbought, "RSI_Signal"
-        ] = -1  # 買われすぎ -> 売り
+        df_copy = df.copy()
+        df_copy["RSI_Signal"] = signals
         return df_copy
 
     def generate_trading_signals(
@@ -114,18 +433,103 @@ class StrategyManager:
         df_copy = df.copy()
         df_copy["Trade_Signal"] = 0  # 初期化
 
-        if strategy_name == "SMA_Strategy":
-            df_with_ma_signal = self._generate_sma_signals(df_copy, params)
-            if not df_with_ma_signal.empty:
-                df_copy["Trade_Signal"] = df_with_ma_signal["MA_Signal"]
-        elif strategy_name == "RSI_Strategy":
-            df_with_rsi_signal = self._generate_rsi_signals(df_copy, params)
-            if not df_with_rsi_signal.empty:
-                df_copy["Trade_Signal"] = df_with_rsi_signal["RSI_Signal"]
-        # 他の戦略もここに追加
+        # 戦略は strategy_registry に登録されたシグナル関数で計算する
+        strategy = get_strategy(strategy_name)
+        if strategy is not None:
+            signals = strategy["signals"](df_copy, params)
+            if signals is not None:
+                df_copy["Trade_Signal"] = signals
 
         return df_copy
 
+    def generate_strategy_signals(
+        self,
+        df: pd.DataFrame,
+        strategies: dict | None = None,
+        trade_strategy: str | None = None,
+    ) -> pd.DataFrame:
+        """
+        複数の戦略の売買シグナルを1回の走査でまとめて生成します。
+
+        df には全戦略が必要とする指標の列 (IndicatorCache.get_indicators_frame
+        で計算) が含まれている前提です。各戦略のシグナルは '{戦略名}_Signal'
+        列に追加されます。
+
+        Args:
+            df (pd.DataFrame): 指標の列を含むDataFrame。
+            strategies (dict, optional): 戦略名 -> 戦略パラメータ。
+                省略時は config.STRATEGIES。
+            trade_strategy (str, optional): 売買に使う戦略名。指定した場合は
+                その戦略のシグナルを 'Trade_Signal' 列 (Backtester が使う列) にも
+                入れます。
+
+        Returns:
+            pd.DataFrame: シグナル列が追加されたDataFrame。
+        """
+        if strategies is None:
+            strategies = self.available_strategies
+        if df is None or df.empty:
+            return pd.DataFrame()
+
+        df_copy = df.copy()
+        for strategy_name, params in strategies.items():
+            strategy = get_strategy(strategy_name)
+            if strategy is None:
+                continue
+            signals = strategy["signals"](df_copy, params)
+            df_copy[f"{strategy_name}_Signal"] = 0 if signals is None else signals
+        if trade_strategy is not None:
+            df_copy["Trade_Signal"] = df_copy.get(f"{trade_strategy}_Signal", 0)
+        return df_copy
+
+    def run_strategies(
+        self,
+        indicator_cache,
+        tickers: list,
+        strategies: dict | None = None,
+        period: tuple | None = None,
+        trade_strategy: str | None = None,
+    ) -> dict:
+        """
+        登録済みの全戦略を、銘柄ごとに指標を一度だけ計算して実行します。
+
+        全戦略が必要とする指標の和集合を重複なしで求め (複数の戦略が
+        同じ指標を使う場合も計算は1回)、銘柄ごとに指標を揃えたデータを
+        作ってから全戦略のシグナルをまとめて生成します。期間を指定した
+        場合は、全期間の指標を期間に切り出してからシグナルを生成するため、
+        期間の初日にはクロスのシグナルが出ません (期間ごとのバックテストと同じ)。
+
+        Args:
+            indicator_cache (IndicatorCache): 銘柄の生データを登録済みのキャッシュ。
+            tickers (list[str]): 対象の銘柄。
+            strategies (dict, optional): 戦略名 -> 戦略パラメータ。
+                省略時は config.STRATEGIES。
+            period (tuple, optional): シグナルを生成する期間 (開始日, 終了日)。
+                終了日は含みません。省略時は全期間。
+            trade_strategy (str, optional): 'Trade_Signal' 列に入れる戦略名
+                (generate_strategy_signals を参照)。
+
+        Returns:
+            dict: 銘柄 -> '{戦略名}_Signal' 列を持つDataFrame
+                (有効な行がない銘柄は含まれません)。
+        """
+        if strategies is None:
+            strategies = self.available_strategies
+        indicators = required_indicators(strategies)
+        logger.debug("戦略パイプラインの指標: %s", indicators)
+
+        results = {}
+        for ticker in tickers:
+            frame = indicator_cache.get_indicators_frame(ticker, indicators)
+            if frame is not None and period is not None:
+                frame = indicator_cache.slice_period(frame, *period)
+            if frame is None or frame.empty:
+                continue
+            results[ticker] = self.generate_strategy_signals(
+                frame, strategies, trade_strategy
+            )
+        return results
+
     def optimize_strategy_parameters(self, df: pd.DataFrame, strategy_name: str):
         """
         与えられたデータフレームの期間内で、指定された戦略の最適なパラメータを見つけます。
@@ -139,90 +543,548 @@ class StrategyManager:
             dict: 最適化されたパラメータの辞書、またはNone。
         """
         if df is None or df.empty:
-            print("エラー: 最適化のためのデータがありません。")
+            logger.error("エラー: 最適化のためのデータがありません。")
             return None
 
         if strategy_name == "SMA_Strategy":
             return self._optimize_sma_parameters(df)
         elif strategy_name == "RSI_Strategy":
-            # RSI戦略の最適化ロジックをここに追加
-            print(
-                "RSI戦略の最適化は未実装です。SMA戦略のデフォルトパラメータを返します。"
-            )
-            return self.available_strategies.get("RSI_Strategy")
+            return self._optimize_rsi_parameters(df)
         else:
-            print(f"エラー: 未知の戦略 '{strategy_name}' です。")
+            logger.error("エラー: 未知の戦略 '%s' です。", strategy_name)
             return None
 
+    def _cached_optimization(
+        self, data, strategy_name: str, search_space: dict, optimize
+    ):
+        """
+        最適化キャッシュに同じ入力の結果があれば再利用し、なければ最適化して保存します。
+
+        Args:
+            data (pd.DataFrame | dict): 最適化期間のデータ (銘柄 -> データの辞書も可)。
+            strategy_name (str): キャッシュのキーに含める戦略名。
+            search_space (dict): キャッシュのキーに含める探索範囲・探索方法。
+            optimize (Callable[[], tuple]): キャッシュがない場合に実行する最適化。
+
+        Returns:
+            tuple: optimize の戻り値 (またはキャッシュされた同じ形式の値)。
+        """
+        if self.optimization_cache is None:
+            return optimize()
+
+        key = self.optimization_cache.make_key(
+            data,
+            strategy_name,
+            search_space,
+            OPTIMIZATION_OBJECTIVE,
+            _evaluator_fingerprint(),
+        )
+        cached = self.optimization_cache.get(key)
+        if cached is not None:
+            logger.debug(
+                "最適化キャッシュを使用します: %s (%s)", strategy_name, key[:12]
+            )
+            return cached
+
+        result = optimize()
+        self.optimization_cache.put(key, result)
+        return result
+
+    def _sma_search_space(self, short_values: list, long_values: list) -> dict:
+        """
+        SMA戦略の最適化結果を左右する設定を、キャッシュのキー用にまとめます。
+
+        Args:
+            short_values (list[int]): 短期期間の探索範囲。
+            long_values (list[int]): 長期期間の探索範囲。
+
+        Returns:
+            dict: 探索範囲と探索方法の設定。
+        """
+        return {
+            "short_range": short_values,
+            "long_range": long_values,
+            "parameter_search": vars(self.parameter_search),
+            # coordinate 探索の初期値
+            "default_params": self.available_strategies["SMA_Strategy"],
+        }
+
     def _optimize_sma_parameters(self, df: pd.DataFrame):
         """
         SMA戦略の最適なパラメータ（短期/長期移動平均線期間）を見つけます。
         """
-        best_params = {}
-        max_return = -float("inf")  # 負の無限大で初期化
+        logger.info("SMA戦略パラメータを最適化中...")
 
-        print("SMA戦略パラメータを最適化中...")
+        short_values = list(self.sma_short_range)
+        long_values = list(self.sma_long_range)
+        best_params, score_surface = self._cached_optimization(
+            df,
+            "SMA_Strategy",
+            self._sma_search_space(short_values, long_values),
+            lambda: self.search_sma_parameters(df, short_values, long_values),
+        )
+        max_return = (
+            score_surface.loc[best_params["short_ma"], best_params["long_ma"]]
+            if best_params
+            else -float("inf")
+        )
 
-        for short_ma in SMA_SHORT_RANGE:
-            for long_ma in SMA_LONG_RANGE:
-                if short_ma >= long_ma:  # 短期MAが長期MAより短いことを確認
-                    continue
+        logger.info(
+            "最適化完了。最良パラメータ: %s, 最大リターン: %.2f%%",
+            best_params,
+            max_return * 100,
+        )
+        return best_params
 
-                df_temp = df.copy()
-                df_temp[f"SMA_{short_ma}"] = (
-                    df_temp["Close"].rolling(window=short_ma).mean()
-                )
-                df_temp[f"SMA_{long_ma}"] = (
-                    df_temp["Close"].rolling(window=long_ma).mean()
-                )
-                df_temp.dropna(inplace=True)
-                df_temp.reset_index(drop=True, inplace=True)
+    def optimize_sma_grid(
+        self,
+        df: pd.DataFrame,
+        short_range=SMA_SHORT_RANGE,
+        long_range=SMA_LONG_RANGE,
+    ) -> tuple[dict, pd.DataFrame]:
+        """
+        SMA戦略のグリッドサーチを配列演算で一括評価します。
+
+        必要な全期間の移動平均を累積和テーブルから一度だけ計算し、
+        全パラメータの組み合わせのシグナルと簡易リターンをまとめて評価します。
+        評価方法 (全額買い・全株売りの簡易シミュレーション) と
+        最良パラメータの選び方 (探索順で最初に最大となる組み合わせ) は
+        従来のループ実装と同じです。
+
+        Args:
+            df (pd.DataFrame): 'Close' 列を含む最適化期間の株価データ。
+            short_range (Iterable[int]): 短期移動平均線の期間の探索範囲。
+            long_range (Iterable[int]): 長期移動平均線の期間の探索範囲。
+
+        Returns:
+            tuple[dict, pd.DataFrame]: 最良パラメータの辞書
+                (評価可能な組み合わせがない場合は空の辞書) と、
+                行が短期期間・列が長期期間の総リターン表
+                (評価対象外の組み合わせは NaN)。
+        """
+        short_values = list(short_range)
+        long_values = list(long_range)
+        score_surface = pd.DataFrame(
+            np.nan,
+            index=pd.Index(short_values, name="short_ma"),
+            columns=pd.Index(long_values, name="long_ma"),
+        )
+
+        # 従来実装の dropna と同じく、欠損を含む行は評価対象から除外する
+        row_positions = np.flatnonzero(df.notna().all(axis=1).to_numpy())
+
+        pairs = [
+            (i, j, short_ma, long_ma)
+            for i, short_ma in enumerate(short_values)
+            for j, long_ma in enumerate(long_values)
+            # 短期MAが長期MAより短く、移動平均が1行以上計算できる組み合わせのみ
+            if short_ma < long_ma
+            and len(row_positions) > 0
+            and row_positions[-1] >= long_ma - 1
+        ]
+        if not pairs:
+            return {}, score_surface
+
+        returns = self.evaluate_sma_pairs(df, [(s, lg) for _, _, s, lg in pairs])
+
+        for (i, j, _, _), ret in zip(pairs, returns):
+            score_surface.iat[i, j] = ret
+
+        # np.argmax は最初の最大値を返すため、従来の探索順での選択と一致する
+        best = int(np.argmax(returns))
+        best_params = {"short_ma": pairs[best][2], "long_ma": pairs[best][3]}
+        return best_params, score_surface
+
+    def evaluate_sma_pairs(
+        self, df: pd.DataFrame, pairs: list, first_row: int = 0
+    ) -> np.ndarray:
+        """
+        指定したSMAパラメータの組み合わせの簡易リターンを一括で評価します。
+
+        移動平均は最適化期間全体の終値で計算し、売買の評価だけを
+        first_row 行目 (欠損を含む行を除いた後の位置) 以降に限定します。
+
+        Args:
+            df (pd.DataFrame): 'Close' 列を含む最適化期間の株価データ。
+            pairs (list[tuple]): (短期期間, 長期期間) のリスト。
+            first_row (int): 評価を開始する行の位置。
+
+        Returns:
+            np.ndarray: 組み合わせごとの総リターン。短期期間が長期期間以上の
+                組み合わせや、移動平均が計算できない組み合わせは NaN。
+        """
+        returns = np.full(len(pairs), np.nan)
+        row_mask = df.notna().all(axis=1).to_numpy()
+        row_positions = np.flatnonzero(row_mask)
+        valid = [
+            k
+            for k, (short_ma, long_ma) in enumerate(pairs)
+            if short_ma < long_ma
+            and len(row_positions) > first_row
+            and row_positions[-1] >= long_ma - 1
+        ]
+        if not valid:
+            return returns
+
+        close = df["Close"].to_numpy(dtype=float)
+        windows = sorted({window for k in valid for window in pairs[k]})
+        window_pos = {window: k for k, window in enumerate(windows)}
+        sma_table = _rolling_mean_table(close, windows)[row_mask][first_row:]
+
+        short_idx = np.array([window_pos[pairs[k][0]] for k in valid])
+        long_idx = np.array([window_pos[pairs[k][1]] for k in valid])
+        returns[valid] = _evaluate_sma_pairs(
+            close[row_mask][first_row:], sma_table, short_idx, long_idx
+        )
+        return returns
+
+    def search_sma_parameters(
+        self,
+        df: pd.DataFrame,
+        short_range=SMA_SHORT_RANGE,
+        long_range=SMA_LONG_RANGE,
+    ) -> tuple[dict, pd.DataFrame]:
+        """
+        設定された探索方法 (parameter_search) でSMA戦略のパラメータを探索します。
+
+        探索方法が "grid" の場合は optimize_sma_grid と同じです。戻り値の形式も
+        optimize_sma_grid と同じで、探索しなかった組み合わせのスコアは NaN です。
+
+        Args:
+            df (pd.DataFrame): 'Close' 列を含む最適化期間の株価データ。
+            short_range (Iterable[int]): 短期移動平均線の期間の探索範囲。
+            long_range (Iterable[int]): 長期移動平均線の期間の探索範囲。
+
+        Returns:
+            tuple[dict, pd.DataFrame]: 最良パラメータの辞書
+                (評価可能な組み合わせがない場合は空の辞書) と、
+                行が短期期間・列が長期期間の総リターン表。
+        """
+        if self.parameter_search.method == "grid":
+            return self.optimize_sma_grid(df, short_range, long_range)
+
+        short_values = list(short_range)
+        long_values = list(long_range)
+        score_surface = pd.DataFrame(
+            np.nan,
+            index=pd.Index(short_values, name="short_ma"),
+            columns=pd.Index(long_values, name="long_ma"),
+        )
+        default_params = self.available_strategies["SMA_Strategy"]
+        scores = self.parameter_search.search(
+            short_values,
+            long_values,
+            lambda pairs, first_row=0: self.evaluate_sma_pairs(df, pairs, first_row),
+            n_rows=int(df.notna().all(axis=1).sum()),
+            start=(default_params["short_ma"], default_params["long_ma"]),
+        )
 
-                if df_temp.empty:
+        best_params = {}
+        best_score = -np.inf
+        # 探索順 (短期期間, 長期期間の昇順) で最初に最大となる組み合わせを選ぶ
+        for i, short_ma in enumerate(short_values):
+            for j, long_ma in enumerate(long_values):
+                score = scores.get((short_ma, long_ma), np.nan)
+                if np.isnan(score):
                     continue
+                score_surface.iat[i, j] = score
+                if score > best_score:
+                    best_score = score
+                    best_params = {"short_ma": short_ma, "long_ma": long_ma}
+        return best_params, score_surface
 
-                # 簡易的な総リターン計算 (この期間でどれだけ増えたか)
-                cash = 1000000  # 仮の初期資金
-                shares = 0
-
-                for k in range(1, len(df_temp)):
-                    prev_short_ma = df_temp[f"SMA_{short_ma}"].iloc[k - 1]
-                    curr_short_ma = df_temp[f"SMA_{short_ma}"].iloc[k]
-                    prev_long_ma = df_temp[f"SMA_{long_ma}"].iloc[k - 1]
-                    curr_long_ma = df_temp[f"SMA_{long_ma}"].iloc[k]
-
-                    curr_close = df_temp["Close"].iloc[k]
-
-                    # ゴールデンクロス (買いシグナル)
-                    if prev_short_ma <= prev_long_ma and curr_short_ma > curr_long_ma:
-                        if cash > 0:
-                            shares_to_buy = int(cash // curr_close)
-                            if shares_to_buy > 0:
-                                shares += shares_to_buy
-                                cash -= shares_to_buy * curr_close
-
-                    # デッドクロス (売りシグナル)
-                    elif prev_short_ma >= prev_long_ma and curr_short_ma < curr_long_ma:
-                        if shares > 0:
-                            cash += shares * curr_close
-                            shares = 0
-
-                # 最終的な資産価値
-                final_value = cash + (
-                    shares * df_temp["Close"].iloc[-1] if shares > 0 else 0
-                )
-                current_return = (
-                    final_value - 1000000
-                ) / 1000000  # 簡易的なリターン計算
-
-                if current_return > max_return:
-                    max_return = current_return
-                    best_params = {
-                        "short_ma": short_ma,
-                        "long_ma": long_ma,
+    def optimize_sma_cross_section(
+        self,
+        dfs: dict,
+        mode: str | None = None,
+        short_range=None,
+        long_range=None,
+    ) -> tuple[dict, pd.DataFrame]:
+        """
+        全銘柄のSMA戦略のグリッドサーチを (日付 × 銘柄 × 組み合わせ) の配列演算で一括評価します。
+
+        銘柄ごとに最適化期間の行数が異なるため、終値と移動平均は末尾 (最新日) を
+        揃えて先頭を NaN で埋めたパネルにまとめます。NaN の区間ではクロスが
+        発生しないため、各銘柄のリターンは銘柄ごとに `optimize_sma_grid` を
+        実行した場合と同じです。
+
+        Args:
+            dfs (dict): 銘柄ごとの 'Close' 列を含む最適化期間の株価データ。
+            mode (str, optional): "per_ticker" なら銘柄ごとに最良のパラメータを、
+                "pooled" なら全銘柄の平均リターンが最大のパラメータを選びます。
+                省略時は sma_optimization_mode ("first_ticker" の場合は "pooled")。
+            short_range (Iterable[int], optional): 短期移動平均線の期間の探索範囲。
+            long_range (Iterable[int], optional): 長期移動平均線の期間の探索範囲。
+
+        Returns:
+            tuple[dict, pd.DataFrame]: 銘柄ごとの最良パラメータの辞書
+                (評価可能な組み合わせがない銘柄は含まれません) と、
+                行が銘柄・列が (short_ma, long_ma) の総リターン表
+                (評価対象外の組み合わせは NaN)。
+        """
+        if mode is None:
+            mode = (
+                self.sma_optimization_mode
+                if self.sma_optimization_mode != "first_ticker"
+                else "pooled"
+            )
+        short_values = list(
+            self.sma_short_range if short_range is None else short_range
+        )
+        long_values = list(self.sma_long_range if long_range is None else long_range)
+        return self._cached_optimization(
+            {ticker: df for ticker, df in dfs.items() if df is not None},
+            "SMA_Strategy/cross_section",
+            {
+                "mode": mode,
+                "short_range": short_values,
+                "long_range": long_values,
+            },
+            lambda: self._optimize_sma_cross_section(
+                dfs, mode, short_values, long_values
+            ),
+        )
+
+    def _optimize_sma_cross_section(
+        self, dfs: dict, mode: str, short_values: list, long_values: list
+    ) -> tuple[dict, pd.DataFrame]:
+        """
+        optimize_sma_cross_section の評価本体です (キャッシュを使わずに計算します)。
+
+        Args:
+            dfs (dict): 銘柄ごとの 'Close' 列を含む最適化期間の株価データ。
+            mode (str): "per_ticker" または "pooled"。
+            short_values (list[int]): 短期移動平均線の期間の探索範囲。
+            long_values (list[int]): 長期移動平均線の期間の探索範囲。
+
+        Returns:
+            tuple[dict, pd.DataFrame]: optimize_sma_cross_section と同じ。
+        """
+        tickers = [
+            ticker for ticker, df in dfs.items() if df is not None and not df.empty
+        ]
+        pairs = [
+            (short_ma, long_ma)
+            for short_ma in short_values
+            for long_ma in long_values
+            if short_ma < long_ma
+        ]
+        score_surface = pd.DataFrame(
+            np.nan,
+            index=pd.Index(tickers, name="ticker"),
+            columns=pd.MultiIndex.from_tuples(pairs, names=["short_ma", "long_ma"]),
+        )
+        if not tickers or not pairs:
+            return {}, score_surface
+
+        # 銘柄ごとの終値と、optimize_sma_grid と同じく欠損を含まない行の位置
+        closes = [dfs[ticker]["Close"].to_numpy(dtype=float) for ticker in tickers]
+        row_positions = [
+            np.flatnonzero(dfs[ticker].notna().all(axis=1).to_numpy())
+            for ticker in tickers
+        ]
+
+        # 末尾を揃えた終値パネルで、全期間の移動平均を一度に計算する
+        n_rows = max(len(close) for close in closes)
+        raw_panel = np.full((n_rows, len(tickers)), np.nan)
+        for t, close in enumerate(closes):
+            raw_panel[n_rows - len(close) :, t] = close
+        windows = sorted({window for pair in pairs for window in pair})
+        window_pos = {window: k for k, window in enumerate(windows)}
+        raw_sma_table = _rolling_mean_table(raw_panel, windows)
+
+        # 欠損を含まない行だけを、改めて末尾を揃えて詰める
+        n_valid = max(len(rows) for rows in row_positions)
+        close_panel = np.full((n_valid, len(tickers)), np.nan)
+        sma_table = np.full((n_valid, len(tickers), len(windows)), np.nan)
+        for t, rows in enumerate(row_positions):
+            if len(rows) == 0:
+                continue
+            panel_rows = rows + (n_rows - len(closes[t]))
+            close_panel[n_valid - len(rows) :, t] = raw_panel[panel_rows, t]
+            sma_table[n_valid - len(rows) :, t] = raw_sma_table[panel_rows, t]
+
+        short_idx = np.array([window_pos[short_ma] for short_ma, _ in pairs])
+        long_idx = np.array([window_pos[long_ma] for _, long_ma in pairs])
+        returns = _evaluate_sma_pairs(close_panel, sma_table, short_idx, long_idx)
+
+        # 移動平均が1行以上計算できない組み合わせは評価対象外とする
+        long_windows = np.array([long_ma for _, long_ma in pairs])
+        last_rows = np.array([rows[-1] if len(rows) else -1 for rows in row_positions])
+        valid = last_rows[:, np.newaxis] >= long_windows - 1
+        returns = np.where(valid, returns, np.nan)
+        score_surface.iloc[:, :] = returns
+
+        best_params_by_ticker = {}
+        if mode == "per_ticker":
+            for t, ticker in enumerate(tickers):
+                if valid[t].any():
+                    # 探索順で最初に最大となる組み合わせを選ぶ
+                    best = int(np.argmax(np.where(valid[t], returns[t], -np.inf)))
+                    best_params_by_ticker[ticker] = {
+                        "short_ma": pairs[best][0],
+                        "long_ma": pairs[best][1],
                     }
+        else:
+            evaluated = valid.any(axis=0)
+            if evaluated.any():
+                # 組み合わせごとに、評価できた銘柄のリターンの平均を目的関数とする
+                pooled = np.where(valid, returns, 0.0).sum(axis=0) / np.maximum(
+                    valid.sum(axis=0), 1
+                )
+                best = int(np.argmax(np.where(evaluated, pooled, -np.inf)))
+                params = {"short_ma": pairs[best][0], "long_ma": pairs[best][1]}
+                best_params_by_ticker = {
+                    ticker: dict(params)
+                    for t, ticker in enumerate(tickers)
+                    if valid[t].any()
+                }
+        return best_params_by_ticker, score_surface
+
+    def _optimize_rsi_parameters(self, df: pd.DataFrame):
+        """
+        RSI戦略の最適なパラメータ（RSI期間/売られすぎ閾値/買われすぎ閾値）を見つけます。
+        """
+        logger.info("RSI戦略パラメータを最適化中...")
+
+        period_values = list(self.rsi_period_range)
+        oversold_values = list(self.rsi_oversold_range)
+        overbought_values = list(self.rsi_overbought_range)
+        best_params, score_surface = self._cached_optimization(
+            df,
+            "RSI_Strategy",
+            {
+                "period_range": period_values,
+                "oversold_range": oversold_values,
+                "overbought_range": overbought_values,
+            },
+            lambda: self.optimize_rsi_grid(
+                df, period_values, oversold_values, overbought_values
+            ),
+        )
+        if not best_params:
+            logger.warning(
+                "警告: 評価可能なRSIパラメータがありません。デフォルトパラメータを返します。"
+            )
+            return self.available_strategies.get("RSI_Strategy")
 
-        print(
-            f"最適化完了。最良パラメータ: {best_params}, 最大リターン: {max_return:.2%}"
+        max_return = score_surface.loc[
+            (
+                best_params["rsi_period"],
+                best_params["rsi_oversold"],
+                best_params["rsi_overbought"],
+            )
+        ]
+        logger.info(
+            "最適化完了。最良パラメータ: %s, 最大リターン: %.2f%%",
+            best_params,
+            max_return * 100,
         )
         return best_params
+
+    def optimize_rsi_grid(
+        self,
+        df: pd.DataFrame,
+        period_range=RSI_PERIOD_RANGE,
+        oversold_range=RSI_OVERSOLD_RANGE,
+        overbought_range=RSI_OVERBOUGHT_RANGE,
+    ) -> tuple[dict, pd.Series]:
+        """
+        RSI戦略のグリッドサーチを配列演算で一括評価します。
+
+        終値の差分から全期間のRSIを一度だけ計算し、全ての閾値の組み合わせの
+        シグナルと簡易リターン (SMA戦略と同じ全額買い・全株売りの簡易
+        シミュレーション) をまとめて評価します。最良パラメータは
+        探索順 (期間, 売られすぎ閾値, 買われすぎ閾値) で最初に最大となる
+        組み合わせです。
+
+        Args:
+            df (pd.DataFrame): 'Close' 列を含む最適化期間の株価データ。
+            period_range (Iterable[int]): RSI期間の探索範囲。
+            oversold_range (Iterable[int]): 売られすぎ閾値の探索範囲。
+            overbought_range (Iterable[int]): 買われすぎ閾値の探索範囲。
+
+        Returns:
+            tuple[dict, pd.Series]: 最良パラメータの辞書
+                (評価可能な組み合わせがない場合は空の辞書) と、
+                (rsi_period, rsi_oversold, rsi_overbought) をインデックスとする
+                総リターン (評価対象外の組み合わせは NaN)。
+        """
+        period_values = list(period_range)
+        oversold_values = list(oversold_range)
+        overbought_values = list(overbought_range)
+        score_surface = pd.Series(
+            np.nan,
+            index=pd.MultiIndex.from_product(
+                [period_values, oversold_values, overbought_values],
+                names=["rsi_period", "rsi_oversold", "rsi_overbought"],
+            ),
+            name="total_return",
+        )
+
+        # SMA戦略の最適化と同じく、欠損を含む行は評価対象から除外する
+        row_mask = df.notna().all(axis=1).to_numpy()
+        close = df["Close"].to_numpy(dtype=float)
+        row_positions = np.flatnonzero(row_mask)
+
+        combinations = [
+            (flat_index, period, oversold, overbought)
+            for flat_index, (period, oversold, overbought) in enumerate(
+                score_surface.index
+            )
+            # 売られすぎ閾値が買われすぎ閾値より低く、RSIが1行以上計算できる組み合わせのみ
+            if oversold < overbought
+            and len(row_positions) > 0
+            and row_positions[-1] >= period - 1
+        ]
+        if not combinations:
+            return {}, score_surface
+
+        periods = sorted({period for _, period, _, _ in combinations})
+        period_pos = {period: k for k, period in enumerate(periods)}
+        # 期間に満たない先頭行は NaN とし、SMAの最適化と同じく完全な窓だけで評価する
+        rsi_table = compute_rsi_table(close, periods, min_periods=None)[row_mask]
+
+        period_idx = np.array([period_pos[period] for _, period, _, _ in combinations])
+        oversold = np.array([value for _, _, value, _ in combinations], dtype=float)
+        overbought = np.array([value for _, _, _, value in combinations], dtype=float)
+        returns = _evaluate_rsi_combinations(
+            close[row_mask], rsi_table, period_idx, oversold, overbought
+        )
+
+        score_surface.iloc[[flat_index for flat_index, _, _, _ in combinations]] = (
+            returns
+        )
+
+        # np.argmax は最初の最大値を返すため、探索順で最初の組み合わせが選ばれる
+        best = int(np.argmax(returns))
+        _, period, oversold_value, overbought_value = combinations[best]
+        best_params = {
+            "rsi_period": period,
+            "rsi_oversold": oversold_value,
+            "rsi_overbought": overbought_value,
+        }
+        return best_params, score_surface
+
+
+@functools.cache
+def _evaluator_fingerprint() -> str:
+    """
+    最適化の評価に使うコードのソースから、最適化キャッシュのキー用の識別子を計算します。
+
+    移動平均・RSIの計算、シグナル判定、簡易売買シミュレーション、探索方法の
+    いずれかを変更すると識別子が変わり、変更前の結果はキャッシュから使われません。
+
+    Returns:
+        str: `source_fingerprint` の識別子 (プロセスごとに一度だけ計算)。
+    """
+    return source_fingerprint(
+        _rolling_mean_table,
+        _evaluate_sma_pairs,
+        _evaluate_rsi_combinations,
+        _simulate_all_in_returns,
+        detect_crossovers,
+        compute_rsi_table,
+        StrategyManager,
+        parameter_search,
+    )
@@ -0,0 +1,79 @@
+# stock_trading_bot/src/strategy_registry.py
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+# 戦略名 -> {'indicators': 必要な指標を返す関数, 'signals': シグナルを計算する関数}
+STRATEGY_REGISTRY = {}
+
+
+def indicator_column(indicator: tuple) -> str:
+    """
+    指標の指定から、処理済みデータでの列名を返します。
+
+    指標は (指標名, パラメータのタプル) で指定します (例: ("SMA", (5,)))。
+
+    Args:
+        indicator (tuple): 指標の指定。
+
+    Returns:
+        str: 列名 (例: 'SMA_5', 'RSI_14')。
+    """
+    name, params = indicator
+    return "_".join([name] + [str(param) for param in params])
+
+
+def register_strategy(name: str, required_indicators, generate_signals):
+    """
+    戦略を登録します。同じ名前の戦略が登録済みの場合は置き換えます。
+
+    Args:
+        name (str): 戦略名 (config.STRATEGIES のキー)。
+        required_indicators (Callable[[dict], list[tuple]]): 戦略パラメータを
+            受け取り、必要な指標の指定のリストを返す関数。
+        generate_signals (Callable[[pd.DataFrame, dict], np.ndarray | None]):
+            指標の列を持つデータと戦略パラメータを受け取り、売買シグナル
+            (1: 買い, -1: 売り, 0: なし) の配列を返す関数。シグナルを計算
+            できない場合は None を返します。
+    """
+    STRATEGY_REGISTRY[name] = {
+        "indicators": required_indicators,
+        "signals": generate_signals,
+    }
+
+
+def get_strategy(name: str):
+    """
+    登録済みの戦略を返します。
+
+    Args:
+        name (str): 戦略名。
+
+    Returns:
+        dict | None: 'indicators' と 'signals' を持つ辞書。未登録の場合はNone。
+    """
+    strategy = STRATEGY_REGISTRY.get(name)
+    if strategy is None:
+        logger.warning("警告: 未登録の戦略 '%s' が指定されました。", name)
+    return strategy
+
+
+def required_indicators(strategies: dict) -> list:
+    """
+    複数の戦略が必要とする指標の和集合を、重複を除いて返します。
+
+    Args:
+        strategies (dict): 戦略名 -> 戦略パラメータ。
+
+    Returns:
+        list[tuple]: 指標の指定のリスト (最初に必要とされた順)。
+    """
+    indicators = {}
+    for name, params in strategies.items():
+        strategy = get_strategy(name)
+        if strategy is None:
+            continue
+        for indicator in strategy["indicators"](params):
+            indicators.setdefault(indicator, None)
+    return list(indicators)
@@ -0,0 +1,417 @@
+# stock_trading_bot/src/streaming_indicators.py
+
+import math
+
+import pandas as pd
+
+from .config import STRATEGIES
+from .strategy_registry import indicator_column
+
+
+class StreamingSMA:
+    """
+    1本ずつ追加される値の単純移動平均を、1本あたり O(1) で更新する計算器。
+
+    直近 window 本の値をリングバッファに保持し、窓から外れる値を引いて
+    新しい値を足すことで合計を更新します。加算と減算はそれぞれ
+    Kahan の補償付き加算で行い、全期間を同じ順序で更新した場合は
+    `Series.rolling(window, min_periods=1).mean()` と同じ値になります。
+    NaN は窓の中で無視されます (件数に含めません)。
+    """
+
+    def __init__(self, window: int):
+        """
+        StreamingSMAのコンストラクタ。
+
+        Args:
+            window (int): 移動平均の期間。
+        """
+        if window < 1:
+            raise ValueError(f"window は1以上である必要があります: {window}")
+        self.window = window
+        self._buffer = [math.nan] * window  # 直近 window 本の値 (リングバッファ)
+        self._position = 0  # 次に書き込むバッファの位置
+        self._count = 0  # これまでに追加した本数
+        self._reset()
+        self.value = math.nan
+
+    def _reset(self):
+        """
+        窓内の集計値を初期化します。
+        """
+        self._nobs = 0  # 窓内の NaN でない値の数
+        self._sum = 0.0
+        self._negative_count = 0  # 窓内の負の値 (-0.0 を含む) の数
+        self._add_compensation = 0.0
+        self._remove_compensation = 0.0
+        # 窓内の値が全て同じ場合に、丸め誤差のない値を返すための記録
+        self._same_value_count = 0
+        self._last_value = math.nan
+
+    def _add(self, value: float):
+        """
+        窓に値を加えます。
+
+        Args:
+            value (float): 追加する値。
+        """
+        if math.isnan(value):
+            return
+        self._nobs += 1
+        y = value - self._add_compensation
+        t = self._sum + y
+        self._add_compensation = t - self._sum - y
+        self._sum = t
+        if math.copysign(1.0, value) < 0:
+            self._negative_count += 1
+
+        if value == self._last_value:
+            self._same_value_count += 1
+        else:
+            self._same_value_count = 1
+        self._last_value = value
+
+    def _remove(self, value: float):
+        """
+        窓から値を取り除きます。
+
+        Args:
+            value (float): 取り除く値。
+        """
+        if math.isnan(value):
+            return
+        self._nobs -= 1
+        y = -value - self._remove_compensation
+        t = self._sum + y
+        self._remove_compensation = t - self._sum - y
+        self._sum = t
+        if math.copysign(1.0, value) < 0:
+            self._negative_count -= 1
+
+    def _mean(self) -> float:
+        """
+        窓内の平均を返します。
+
+        Returns:
+            float: 平均。窓内に有効な値がない場合は NaN。
+        """
+        if self._nobs == 0:
+            return math.nan
+        if self._same_value_count >= self._nobs:
+            return self._last_value
+
+        result = self._sum / self._nobs
+        # 全て正 (または全て負) の値の平均が丸め誤差で符号を変えないようにする
+        if self._negative_count == 0 and result < 0:
+            return 0.0
+        if self._negative_count == self._nobs and result > 0:
+            return 0.0
+        return result
+
+    def update(self, value: float) -> float:
+        """
+        新しい値を1本追加し、更新後の移動平均を返します。
+
+        Args:
+            value (float): 新しい値 (NaN 可)。
+
+        Returns:
+            float: 直近 window 本の移動平均。
+        """
+        value = float(value)
+        if self._count == 0 or self.window == 1:
+            # 窓が入れ替わる場合は集計値を作り直す
+            self._reset()
+            self._last_value = value
+        elif self._count >= self.window:
+            self._remove(self._buffer[self._position])
+
+        self._add(value)
+        self._buffer[self._position] = value
+        self._position = (self._position + 1) % self.window
+        self._count += 1
+        self.value = self._mean()
+        return self.value
+
+    def to_state(self) -> dict:
+        """
+        計算器の状態を、JSONに保存できる辞書で返します。
+
+        補償項を含む全ての内部状態を保存するため、from_state で復元した
+        計算器は、保存しなかった場合と同じ値を返し続けます。
+
+        Returns:
+            dict: 計算器の状態。
+        """
+        return {
+            "window": self.window,
+            "buffer": list(self._buffer),
+            "position": self._position,
+            "count": self._count,
+            "nobs": self._nobs,
+            "sum": self._sum,
+            "negative_count": self._negative_count,
+            "add_compensation": self._add_compensation,
+            "remove_compensation": self._remove_compensation,
+            "same_value_count": self._same_value_count,
+            "last_value": self._last_value,
+            "value": self.value,
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "StreamingSMA":
+        """
+        to_state で保存した状態から計算器を復元します。
+
+        Args:
+            state (dict): 計算器の状態。
+
+        Returns:
+            StreamingSMA: 復元した計算器。
+        """
+        sma = cls(state["window"])
+        sma._buffer = [float(value) for value in state["buffer"]]
+        sma._position = state["position"]
+        sma._count = state["count"]
+        sma._nobs = state["nobs"]
+        sma._sum = state["sum"]
+        sma._negative_count = state["negative_count"]
+        sma._add_compensation = state["add_compensation"]
+        sma._remove_compensation = state["remove_compensation"]
+        sma._same_value_count = state["same_value_count"]
+        sma._last_value = state["last_value"]
+        sma.value = state["value"]
+        return sma
+
+    def seed(self, values) -> float:
+        """
+        過去の値をまとめて追加し、計算器の状態を最新にします。
+
+        Args:
+            values (Iterable[float]): 古い順に並んだ過去の値。
+
+        Returns:
+            float: 最後の値を追加した後の移動平均。
+        """
+        for value in values:
+            self.update(value)
+        return self.value
+
+
+class StreamingRSI:
+    """
+    1本ずつ追加される終値からRSIを1本あたり O(1) で更新する計算器。
+
+    上昇幅・下落幅の移動平均を StreamingSMA で更新するため、全期間を
+    順に更新した場合は `DataManager.compute_rsi` と同じ値になります。
+    """
+
+    def __init__(self, period: int):
+        """
+        StreamingRSIのコンストラクタ。
+
+        Args:
+            period (int): RSIの計算期間。
+        """
+        self.period = period
+        self._average_gain = StreamingSMA(period)
+        self._average_loss = StreamingSMA(period)
+        self._previous_close = None
+        self.value = math.nan
+
+    def update(self, close: float) -> float:
+        """
+        新しい終値を1本追加し、更新後のRSIを返します。
+
+        Args:
+            close (float): 新しい終値。
+
+        Returns:
+            float: RSI。期間内に下落がない場合は NaN。
+        """
+        close = float(close)
+        delta = (
+            close - self._previous_close
+            if self._previous_close is not None
+            else math.nan
+        )
+        self._previous_close = close
+
+        # compute_rsi と同じく、上昇幅は 0.0、下落幅は -0.0 で埋める
+        gain = delta if delta > 0 else 0.0
+        loss = -(delta if delta < 0 else 0.0)
+        average_gain = self._average_gain.update(gain)
+        average_loss = self._average_loss.update(loss)
+
+        if average_loss == 0 or math.isnan(average_loss):
+            self.value = math.nan
+        else:
+            self.value = 100 - (100 / (1 + average_gain / average_loss))
+        return self.value
+
+    def to_state(self) -> dict:
+        """
+        計算器の状態を、JSONに保存できる辞書で返します。
+
+        Returns:
+            dict: 計算器の状態。
+        """
+        return {
+            "period": self.period,
+            "average_gain": self._average_gain.to_state(),
+            "average_loss": self._average_loss.to_state(),
+            "previous_close": self._previous_close,
+            "value": self.value,
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "StreamingRSI":
+        """
+        to_state で保存した状態から計算器を復元します。
+
+        Args:
+            state (dict): 計算器の状態。
+
+        Returns:
+            StreamingRSI: 復元した計算器。
+        """
+        rsi = cls(state["period"])
+        rsi._average_gain = StreamingSMA.from_state(state["average_gain"])
+        rsi._average_loss = StreamingSMA.from_state(state["average_loss"])
+        rsi._previous_close = state["previous_close"]
+        rsi.value = state["value"]
+        return rsi
+
+    def seed(self, closes) -> float:
+        """
+        過去の終値をまとめて追加し、計算器の状態を最新にします。
+
+        Args:
+            closes (Iterable[float]): 古い順に並んだ過去の終値。
+
+        Returns:
+            float: 最後の終値を追加した後のRSI。
+        """
+        for close in closes:
+            self.update(close)
+        return self.value
+
+
+class StreamingIndicatorSet:
+    """
+    1銘柄分のSMA (短期・長期) とRSIをまとめて日次更新する計算器。
+
+    `IndicatorCache.get_indicators_frame` が付ける列 (strategy_registry.indicator_column、
+    'SMA_<短期>', 'SMA_<長期>', 'RSI_<期間>') と同じ名前で最新の値を返します。
+    過去データで seed してから、日々の終値を update に渡して使います。
+    """
+
+    def __init__(
+        self,
+        short_ma: int | None = None,
+        long_ma: int | None = None,
+        rsi_period: int | None = None,
+    ):
+        """
+        StreamingIndicatorSetのコンストラクタ。
+
+        Args:
+            short_ma (int, optional): 短期移動平均線の期間。省略時は設定値。
+            long_ma (int, optional): 長期移動平均線の期間。省略時は設定値。
+            rsi_period (int, optional): RSIの計算期間。省略時は設定値。
+        """
+        self.short_ma = short_ma or STRATEGIES["SMA_Strategy"]["short_ma"]
+        self.long_ma = long_ma or STRATEGIES["SMA_Strategy"]["long_ma"]
+        self.rsi_period = rsi_period or STRATEGIES["RSI_Strategy"]["rsi_period"]
+        self._short_sma = StreamingSMA(self.short_ma)
+        self._long_sma = StreamingSMA(self.long_ma)
+        self._rsi = StreamingRSI(self.rsi_period)
+        self.last_date = None
+        self.last_close = None
+
+    def update(self, close: float, date=None) -> dict:
+        """
+        新しい終値を1本追加し、更新後の指標を返します。
+
+        Args:
+            close (float): 新しい終値。
+            date (pd.Timestamp, optional): 終値の日付 (last_date に記録)。
+
+        Returns:
+            dict: 'SMA_<短期>', 'SMA_<長期>', 'RSI_<期間>' をキーとする最新の指標。
+        """
+        close = float(close)
+        self._short_sma.update(close)
+        self._long_sma.update(close)
+        self._rsi.update(close)
+        self.last_close = close
+        if date is not None:
+            self.last_date = pd.Timestamp(date)
+        return self.values()
+
+    def values(self) -> dict:
+        """
+        最新の指標を返します。
+
+        Returns:
+            dict: 'SMA_<短期>', 'SMA_<長期>', 'RSI_<期間>' をキーとする最新の指標。
+        """
+        return {
+            indicator_column(("SMA", (self.short_ma,))): self._short_sma.value,
+            indicator_column(("SMA", (self.long_ma,))): self._long_sma.value,
+            indicator_column(("RSI", (self.rsi_period,))): self._rsi.value,
+        }
+
+    def to_state(self) -> dict:
+        """
+        計算器の状態を、JSONに保存できる辞書で返します。
+
+        Returns:
+            dict: 計算器の状態。
+        """
+        return {
+            "short_ma": self.short_ma,
+            "long_ma": self.long_ma,
+            "rsi_period": self.rsi_period,
+            "short_sma": self._short_sma.to_state(),
+            "long_sma": self._long_sma.to_state(),
+            "rsi": self._rsi.to_state(),
+            "last_date": (
+                self.last_date.isoformat() if self.last_date is not None else None
+            ),
+            "last_close": self.last_close,
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "StreamingIndicatorSet":
+        """
+        to_state で保存した状態から計算器を復元します。
+
+        Args:
+            state (dict): 計算器の状態。
+
+        Returns:
+            StreamingIndicatorSet: 復元した計算器。
+        """
+        indicators = cls(state["short_ma"], state["long_ma"], state["rsi_period"])
+        indicators._short_sma = StreamingSMA.from_state(state["short_sma"])
+        indicators._long_sma = StreamingSMA.from_state(state["long_sma"])
+        indicators._rsi = StreamingRSI.from_state(state["rsi"])
+        if state["last_date"] is not None:
+            indicators.last_date = pd.Timestamp(state["last_date"])
+        indicators.last_close = state["last_close"]
+        return indicators
+
+    def seed(self, df: pd.DataFrame) -> dict:
+        """
+        インデックスがDateの過去の株価データで計算器の状態を最新にします。
+
+        Args:
+            df (pd.DataFrame): 'Close' 列を持つ、日付の昇順に並んだ株価データ。
+
+        Returns:
+            dict: 最終日の指標。
+        """
+        for date, close in zip(df.index, df["Close"].to_numpy(dtype=float)):
+            self.update(close, date)
+        return self.values()
@@ -0,0 +1,212 @@
+# stock_trading_bot/src/synthetic_data.py
+
+import zlib
+
+import numpy as np
+import pandas as pd
+
+from .config import (
+    SYNTHETIC_ANNUAL_DRIFT,
+    SYNTHETIC_ANNUAL_VOLATILITY,
+    SYNTHETIC_REGIME_SWITCH_PROB,
+    SYNTHETIC_SEED,
+    SYNTHETIC_VOLATILITY_MULTIPLIERS,
+)
+
+TRADING_DAYS_PER_YEAR = 252
+
+
+class SyntheticDataProvider:
+    """
+    幾何ブラウン運動に基づく疑似的なOHLCVデータを生成するデータ取得関数。
+
+    `DataManager(provider=...)` にそのまま渡せるよう、(ティッカー, 開始日, 終了日)
+    を受け取って yfinance と同じ Open/High/Low/Close/Volume 列のDataFrameを返します。
+    乱数はシード値とティッカー名から決まるため、同じ引数では常に同じデータになります。
+    ボラティリティのレジーム (平常/高ボラティリティなど) をマルコフ連鎖で切り替える
+    ことで、相場環境の変化も再現できます。
+    """
+
+    def __init__(
+        self,
+        seed: int = SYNTHETIC_SEED,
+        annual_drift: float = SYNTHETIC_ANNUAL_DRIFT,
+        annual_volatility: float = SYNTHETIC_ANNUAL_VOLATILITY,
+        volatility_multipliers: tuple = SYNTHETIC_VOLATILITY_MULTIPLIERS,
+        regime_switch_prob: float = SYNTHETIC_REGIME_SWITCH_PROB,
+        base_date: str = "2000-01-03",
+    ):
+        """
+        SyntheticDataProviderのコンストラクタ。
+
+        Args:
+            seed (int): 乱数のシード値。
+            annual_drift (float): 年率のドリフト (期待リターン)。
+            annual_volatility (float): 平常時の年率ボラティリティ。
+            volatility_multipliers (tuple): レジームごとのボラティリティ倍率。
+                (1.0,) ならレジーム切り替えなし。
+            regime_switch_prob (float): 1営業日あたりのレジーム切り替え確率。
+            base_date (str): 価格系列の起点日。期間を変えて取得しても、
+                同じ日付には同じ価格が返ります。
+        """
+        self.seed = seed
+        self.annual_drift = annual_drift
+        self.annual_volatility = annual_volatility
+        self.volatility_multipliers = tuple(volatility_multipliers)
+        self.regime_switch_prob = regime_switch_prob
+        self.base_date = pd.Timestamp(base_date)
+
+    @staticmethod
+    def make_tickers(num_tickers: int) -> list:
+        """
+        疑似銘柄のティッカーシンボルを生成します。
+
+        Args:
+            num_tickers (int): 銘柄数。
+
+        Returns:
+            list: 'SYN0000' 形式のティッカーシンボルのリスト。
+        """
+        return [f"SYN{i:04d}" for i in range(num_tickers)]
+
+    def __call__(self, ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
+        """
+        指定した銘柄・期間の疑似株価データを生成します。
+
+        Args:
+            ticker (str): ティッカーシンボル。
+            start_date (str): 開始日 ('YYYY-MM-DD')。
+            end_date (str): 終了日 ('YYYY-MM-DD'、この日を含まない)。
+
+        Returns:
+            pd.DataFrame: インデックスがDateの Open/High/Low/Close/Volume データ。
+        """
+        start = pd.Timestamp(start_date)
+        end = pd.Timestamp(end_date)
+        if end <= start or end <= self.base_date:
+            return pd.DataFrame()
+
+        # 起点日から生成し、要求された期間を切り出す (期間によらず同じ日付は同じ価格)
+        dates = self._business_days(self.base_date, end)
+        df = self._generate_ohlcv(ticker, dates)
+        return df[df.index >= start]
+
+    def generate_panel(
+        self, num_tickers: int, num_days: int, start_date: str | None = None
+    ) -> dict:
+        """
+        N銘柄 × M営業日の疑似株価データをまとめて生成します。
+
+        Args:
+            num_tickers (int): 銘柄数。
+            num_days (int): 営業日数。
+            start_date (str, optional): 開始日。省略時は起点日。
+
+        Returns:
+            dict: 銘柄ごとの、インデックスがDateの株価データ。
+        """
+        start = pd.Timestamp(start_date) if start_date else self.base_date
+        # 営業日の並びは全銘柄で共通のため一度だけ作る
+        # (7日で5営業日なので、num_days 営業日を含む十分な期間を取って切り詰める)
+        end = start + pd.Timedelta(days=num_days * 7 // 5 + 7)
+        all_dates = self._business_days(self.base_date, end)
+        start_position = all_dates.searchsorted(start, side="left")
+        all_dates = all_dates[: start_position + num_days]
+
+        panel = {}
+        for ticker in self.make_tickers(num_tickers):
+            df = self._generate_ohlcv(ticker, all_dates)
+            panel[ticker] = df.iloc[start_position:]
+        return panel
+
+    @staticmethod
+    def _business_days(start: pd.Timestamp, end: pd.Timestamp) -> pd.DatetimeIndex:
+        """
+        [start, end) の営業日 (月〜金) を返します。
+
+        `pd.bdate_range` と同じ結果ですが、長期間でも高速に生成できます。
+
+        Args:
+            start (pd.Timestamp): 開始日 (この日を含む)。
+            end (pd.Timestamp): 終了日 (この日を含まない)。
+
+        Returns:
+            pd.DatetimeIndex: 名前が 'Date' の営業日のインデックス。
+        """
+        days = pd.date_range(start, end, inclusive="left", name="Date")
+        return days[days.dayofweek < 5]
+
+    def _generate_ohlcv(self, ticker: str, dates: pd.DatetimeIndex) -> pd.DataFrame:
+        """
+        営業日の並びに対してOHLCVを生成します。
+
+        Args:
+            ticker (str): ティッカーシンボル (乱数系列の決定に使用)。
+            dates (pd.DatetimeIndex): 営業日のインデックス。
+
+        Returns:
+            pd.DataFrame: インデックスがDateの Open/High/Low/Close/Volume データ。
+        """
+        num_days = len(dates)
+        # ティッカー名から安定したシードを作る (hash() はプロセスごとに変わるため使わない)
+        # 変数ごとに独立した乱数列を使い、期間の長さによらず同じ日付に同じ値を割り当てる
+        seed_sequence = np.random.SeedSequence(
+            [self.seed, zlib.crc32(ticker.encode("utf-8"))]
+        )
+        (
+            price_rng,
+            switch_rng,
+            step_rng,
+            shock_rng,
+            gap_rng,
+            range_rng,
+            high_rng,
+            low_rng,
+            volume_rng,
+        ) = [np.random.default_rng(child) for child in seed_sequence.spawn(9)]
+
+        initial_price = price_rng.uniform(20, 500)
+        daily_volatility = self.annual_volatility / np.sqrt(TRADING_DAYS_PER_YEAR)
+        daily_drift = self.annual_drift / TRADING_DAYS_PER_YEAR
+
+        # ボラティリティのレジームをマルコフ連鎖で切り替える
+        switches = switch_rng.random(num_days) < self.regime_switch_prob
+        regime_steps = step_rng.integers(
+            1, max(len(self.volatility_multipliers), 2), num_days
+        )
+        regimes = np.cumsum(np.where(switches, regime_steps, 0)) % len(
+            self.volatility_multipliers
+        )
+        sigma = daily_volatility * np.asarray(self.volatility_multipliers)[regimes]
+
+        # 幾何ブラウン運動: log(S_t) = log(S_0) + Σ (μ - σ²/2) + σ ε
+        shocks = shock_rng.standard_normal(num_days)
+        log_returns = (daily_drift - 0.5 * sigma**2) + sigma * shocks
+        close = initial_price * np.exp(np.cumsum(log_returns))
+
+        # 始値は前日終値からのギャップ、高値/安値は日中の値幅として生成
+        previous_close = np.concatenate([[initial_price], close[:-1]])
+        open_ = previous_close * np.exp(
+            sigma * 0.25 * gap_rng.standard_normal(num_days)
+        )
+        intraday_range = np.abs(sigma * range_rng.standard_normal(num_days))
+        high = np.maximum(open_, close) * np.exp(
+            intraday_range * high_rng.random(num_days)
+        )
+        low = np.minimum(open_, close) * np.exp(
+            -intraday_range * low_rng.random(num_days)
+        )
+        volume = volume_rng.lognormal(mean=15, sigma=0.5, size=num_days) * (
+            sigma / daily_volatility
+        )
+
+        return pd.DataFrame(
+            {
+                "Open": open_,
+                "High": high,
+                "Low": low,
+                "Close": close,
+                "Volume": volume.astype(np.int64),
+            },
+            index=dates,
+        )
@@ -1,14 +1,113 @@
 # stock_trading_bot/src/visualizer.py
 
+import os
+
 import matplotlib.pyplot as plt
+import matplotlib.style
+import numpy as np
 import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from .config import (  # 修正
+    PLOT_DPI,
+    PLOT_FORMAT,
+    PLOT_HEADLESS,
+    PLOT_MAX_POINTS,
+    STRATEGIES,
+)
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets (LTTB) で間引いた後に残す点の位置を返します。
+
+    最初と最後の点を残し、残りを max_points - 2 個のバケットに分けて、
+    各バケットから「直前に選んだ点」と「次のバケットの平均」とで作る
+    三角形の面積が最大になる点を1つずつ選びます。急な上昇・下落などの
+    線の形を保ったまま点数を減らせます。
+
+    Args:
+        x (np.ndarray): 昇順に並んだx座標。
+        y (np.ndarray): y座標。
+        max_points (int): 残す点の最大数。
+
+    Returns:
+        np.ndarray: 残す点の位置 (昇順)。間引く必要がない場合は全ての位置。
+    """
+    n = len(x)
+    if max_points is None or max_points < 3 or n <= max_points:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    bucket_size = (n - 2) / (max_points - 2)
+    indices = np.empty(max_points, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
 
-from .config import STRATEGIES  # 修正
+    selected = 0
+    for i in range(max_points - 2):
+        start = int(i * bucket_size) + 1
+        stop = int((i + 1) * bucket_size) + 1
+        next_stop = min(int((i + 2) * bucket_size) + 1, n)
+        average_x = x[stop:next_stop].mean()
+        average_y = y[stop:next_stop].mean()
+
+        # 三角形の面積の2倍 (大小の比較だけなので 1/2 は省略)
+        areas = np.abs(
+            (x[selected] - average_x) * (y[start:stop] - y[selected])
+            - (x[selected] - x[start:stop]) * (average_y - y[selected])
+        )
+        selected = start + int(np.argmax(np.nan_to_num(areas, nan=-1.0)))
+        indices[i + 1] = selected
+    return indices
 
 
 class Visualizer:
-    def __init__(self, df_portfolio_history: pd.DataFrame):
+    def __init__(
+        self,
+        df_portfolio_history: pd.DataFrame,
+        headless: bool = PLOT_HEADLESS,
+        dpi: int = PLOT_DPI,
+        image_format: str = PLOT_FORMAT,
+        max_points: int = PLOT_MAX_POINTS,
+    ):
+        """
+        Visualizerのコンストラクタ。
+
+        Args:
+            df_portfolio_history (pd.DataFrame): 統合されたポートフォリオ履歴。
+            headless (bool): True の場合は画面に表示せず、ファイルへの保存のみ行う。
+                pyplot を使わずに描画するため、ディスプレイのない環境でも動作します。
+            dpi (int): 保存する画像の解像度。
+            image_format (str): 保存する画像の形式 (ファイル名の拡張子も置き換える)。
+            max_points (int): 1本の線に描画する最大の点数。None の場合は間引かない。
+        """
         self.df_portfolio_history = df_portfolio_history
+        self.headless = headless
+        self.dpi = dpi
+        self.image_format = image_format
+        self.max_points = max_points
+
+    def _downsample(self, df: pd.DataFrame, value_column: str) -> pd.DataFrame:
+        """
+        'Date' 列と value_column の線の形を保つように、行を max_points 行まで間引きます。
+
+        Args:
+            df (pd.DataFrame): 'Date' 列と value_column 列を持つデータ。
+            value_column (str): 間引く点の選択に使う列。
+
+        Returns:
+            pd.DataFrame: 間引いたデータ (間引く必要がない場合は元のデータ)。
+        """
+        if self.max_points is None or len(df) <= self.max_points:
+            return df
+        dates = pd.DatetimeIndex(df["Date"]).asi8
+        indices = lttb_indices(
+            dates, df[value_column].to_numpy(dtype=float), self.max_points
+        )
+        return df.iloc[indices]
 
     # ▼ ここを修正 ▼
     def plot_results(
@@ -16,23 +115,151 @@ class Visualizer:
         df_portfolio: pd.DataFrame,
         df_trades: pd.DataFrame,
         file_name: str,
-        reference_ticker_data: pd.DataFrame = None,
+        reference_ticker_data: pd.DataFrame | None = None,
     ):
         # ▲ ここまで修正 ▲
         """
         ポートフォリオ価値の推移と取引シグナルをグラフで表示し、ファイルに保存します。
+
+        max_points を超える長さの線は LTTB で間引いてから描画します
+        (売買シグナルの点は間引きません)。headless の場合は表示しません。
+
+        Args:
+            df_portfolio (pd.DataFrame): 'Date', 'Portfolio_Value' 列を持つポートフォリオ履歴。
+            df_trades (pd.DataFrame): 'Date', 'Trade_Type' 列を持つ取引履歴。
+            file_name (str): 保存先のファイル名 (拡張子は image_format に置き換える)。
+            reference_ticker_data (pd.DataFrame, optional): 参照銘柄の株価と指標。
         """
-        plt.style.use("seaborn-v0_8-darkgrid")  # スタイルを適用
+        file_name = f"{os.path.splitext(file_name)[0]}.{self.image_format}"
+        # スタイルは描画と保存の間だけ適用し、グローバルな設定を変更しない
+        with matplotlib.style.context("seaborn-v0_8-darkgrid"):
+            if self.headless:
+                # pyplot を使わずに描画するため、画面表示用のバックエンドを必要としない
+                fig = Figure(figsize=(16, 12))
+                FigureCanvasAgg(fig)
+                axes = fig.subplots(2, 1, gridspec_kw={"height_ratios": [2, 1]})
+            else:
+                fig, axes = plt.subplots(
+                    2, 1, figsize=(16, 12), gridspec_kw={"height_ratios": [2, 1]}
+                )
+            self._draw(fig, axes, df_portfolio, df_trades, reference_ticker_data)
 
-        fig, axes = plt.subplots(
-            2, 1, figsize=(16, 12), gridspec_kw={"height_ratios": [2, 1]}
-        )
+            fig.tight_layout(
+                rect=[0, 0.03, 1, 0.96]
+            )  # タイトルとサブプロットが重ならないように調整
+            if self.headless:
+                fig.savefig(file_name, dpi=self.dpi, format=self.image_format)
+                return
+
+            plt.savefig(file_name, dpi=self.dpi, format=self.image_format)
+
+        plt.show()
+
+        plt.close(fig)  # メモリ解放のために図を閉じる
+
+    def plot_signal_chart(
+        self,
+        df_signals: pd.DataFrame,
+        df_trades: pd.DataFrame,
+        file_name: str,
+        title: str,
+    ):
+        """
+        1銘柄の終値・SMA・売買シグナルのチャートを描画し、ファイルに保存します。
+
+        銘柄や期間ごとに多数のチャートを出力するための、描画内容を絞った
+        チャートです。headless の設定によらず pyplot を使わずに描画し、
+        画面には表示しません (ワーカープロセスから並列に呼び出せます)。
+
+        Args:
+            df_signals (pd.DataFrame): 'Date', 'Close', 'SMA_Short', 'SMA_Long'
+                列を持つデータ (walk_forward.compact_signal_frame の結果)。
+            df_trades (pd.DataFrame): この銘柄の 'Date', 'Trade_Type', 'Price'
+                列を持つ取引履歴。
+            file_name (str): 保存先のファイル名 (拡張子は image_format に置き換える)。
+            title (str): チャートのタイトル。
+        """
+        file_name = f"{os.path.splitext(file_name)[0]}.{self.image_format}"
+        with matplotlib.style.context("seaborn-v0_8-darkgrid"):
+            fig = Figure(figsize=(12, 6))
+            FigureCanvasAgg(fig)
+            ax = fig.subplots()
+
+            plot_data = self._downsample(df_signals, "Close")
+            ax.plot(
+                plot_data["Date"],
+                plot_data["Close"],
+                label="Close Price",
+                color="gray",
+                alpha=0.8,
+            )
+            ax.plot(
+                plot_data["Date"],
+                plot_data["SMA_Short"],
+                label="SMA (Short)",
+                color="blue",
+                linewidth=1.2,
+            )
+            ax.plot(
+                plot_data["Date"],
+                plot_data["SMA_Long"],
+                label="SMA (Long)",
+                color="red",
+                linewidth=1.2,
+            )
+
+            # 売買シグナルは約定価格の位置に描画する (間引かない)
+            for trade_type, marker, color, label in (
+                ("BUY", "^", "green", "Buy Signal"),
+                ("SELL", "v", "red", "Sell Signal"),
+            ):
+                trades = df_trades[df_trades["Trade_Type"] == trade_type]
+                if not trades.empty:
+                    ax.scatter(
+                        trades["Date"],
+                        trades["Price"],
+                        marker=marker,
+                        color=color,
+                        s=60,
+                        label=label,
+                        zorder=5,
+                    )
+
+            ax.set_title(title, fontsize=14)
+            ax.set_xlabel("Date", fontsize=11)
+            ax.set_ylabel("Stock Price (JPY)", fontsize=11)
+            ax.legend(fontsize=9)
+            ax.grid(True, linestyle=":", alpha=0.7)
+            ax.ticklabel_format(style="plain", axis="y")
+            # tight_layout は余白の計算のために一度描画するため、固定の余白にする
+            fig.subplots_adjust(left=0.08, right=0.98, bottom=0.09, top=0.93)
+            fig.savefig(file_name, dpi=self.dpi, format=self.image_format)
+
+    def _draw(
+        self,
+        fig,
+        axes,
+        df_portfolio: pd.DataFrame,
+        df_trades: pd.DataFrame,
+        reference_ticker_data: pd.DataFrame | None = None,
+    ):
+        """
+        ポートフォリオ価値の推移と、参照銘柄の株価・取引シグナルを描画します。
+
+        Args:
+            fig (matplotlib.figure.Figure): 描画先の図。
+            axes (np.ndarray): 上下2つの Axes。
+            df_portfolio (pd.DataFrame): ポートフォリオ履歴。
+            df_trades (pd.DataFrame): 取引履歴。
+            reference_ticker_data (pd.DataFrame, optional): 参照銘柄の株価と指標。
+        """
         fig.suptitle("Trading Strategy Backtest Results", fontsize=18)
 
         # 1. ポートフォリオ価値の推移
+        portfolio_plot_data = self._downsample(df_portfolio, "Portfolio_Value")
         axes[0].plot(
-            df_portfolio["Date"],
-            df_portfolio["Portfolio_Value"],
+            portfolio_plot_data["Date"],
+            portfolio_plot_data["Portfolio_Value"],
             label="Portfolio Value (Strategy)",
             color="green",
             linewidth=2,
@@ -45,16 +272,20 @@ class Visualizer:
         )  # 初期資金の線を引く
 
         # 参照銘柄の株価（基準）をグラフに追加
+        reference_plot_data = None
         if reference_ticker_data is not None and not reference_ticker_data.empty:
+            # 株価と SMA は同じ日付で比較できるよう、終値で選んだ行をまとめて間引く
+            reference_plot_data = self._downsample(reference_ticker_data, "Close")
+
             # reference_ticker_data に 'Close' 列があると仮定
             # ポートフォリオ価値と同じスケールにするために正規化する
             # 基準価格の初期値をポートフォリオの初期資金に合わせる
             ref_initial_close = reference_ticker_data["Close"].iloc[0]
             ref_scaled_value = (
-                reference_ticker_data["Close"] / ref_initial_close
+                reference_plot_data["Close"] / ref_initial_close
             ) * self.df_portfolio_history["Portfolio_Value"].iloc[0]
             axes[0].plot(
-                reference_ticker_data["Date"],
+                reference_plot_data["Date"],
                 ref_scaled_value,
                 label=f"Reference (Buy & Hold of {reference_ticker_data['Ticker'].iloc[0]})",
                 color="orange",
@@ -70,10 +301,10 @@ class Visualizer:
 
         # 2. 株価と取引シグナル
         # 参照銘柄データが存在する場合のみ、その銘柄の株価とシグナルを表示
-        if reference_ticker_data is not None and not reference_ticker_data.empty:
+        if reference_plot_data is not None:
             axes[1].plot(
-                reference_ticker_data["Date"],
-                reference_ticker_data["Close"],
+                reference_plot_data["Date"],
+                reference_plot_data["Close"],
                 label=f"{reference_ticker_data['Ticker'].iloc[0]} Close Price",
                 color="gray",
                 alpha=0.8,
@@ -85,8 +316,8 @@ class Visualizer:
                 in reference_ticker_data.columns
             ):  # 修正
                 axes[1].plot(
-                    reference_ticker_data["Date"],
-                    reference_ticker_data[
+                    reference_plot_data["Date"],
+                    reference_plot_data[
                         f"SMA_{STRATEGIES['SMA_Strategy']['short_ma']}"
                     ],  # 修正
                     label=f"SMA {STRATEGIES['SMA_Strategy']['short_ma']}",  # 修正
@@ -98,8 +329,8 @@ class Visualizer:
                 in reference_ticker_data.columns
             ):  # 修正
                 axes[1].plot(
-                    reference_ticker_data["Date"],
-                    reference_ticker_data[
+                    reference_plot_data["Date"],
+                    reference_plot_data[
                         f"SMA_{STRATEGIES['SMA_Strategy']['long_ma']}"
                     ],  # 修正
                     label=f"SMA {STRATEGIES['SMA_Strategy']['long_ma']}",  # 修正
@@ -177,12 +408,3 @@ class Visualizer:
             )
             axes[1].set_xlabel("Date", fontsize=12)
             axes[1].set_ylabel("Stock Price (JPY)", fontsize=12)
-
-        plt.tight_layout(
-            rect=[0, 0.03, 1, 0.96]
-        )  # タイトルとサブプロットが重ならないように調整
-        plt.savefig(file_name, dpi=300)
-
-        plt.show()
-
-        plt.close(fig)  # メモリ解放のために図を閉じる
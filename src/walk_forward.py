@@ -0,0 +1,485 @@
+# stock_trading_bot/src/walk_forward.py
+
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+
+import pandas as pd
+
+from .backtester import Backtester
+from .config import (
+    INITIAL_CASH,
+    LEVERAGE_RATIO,
+    OPTIMIZATION_WINDOW_DAYS,
+    STRATEGIES,
+    TEST_WINDOW_DAYS,
+    WALK_FORWARD_MAX_WORKERS,
+    WALK_FORWARD_STEP_DAYS,
+)
+from .indicator_cache import IndicatorCache
+from .logger import ROOT_LOGGER_NAME, get_logger, setup_logging
+from .metrics import StageMetrics
+from .strategy_manager import StrategyManager
+
+logger = get_logger(__name__)
+
+# ワーカープロセスごとに一度だけ受け取る共有データ (プロセスプール用)
+_worker_context = {}
+
+
+def generate_walk_forward_windows(min_date, max_date) -> list:
+    """
+    ウォークフォワードの各期間 (最適化期間とテスト期間) を列挙します。
+
+    Args:
+        min_date (pd.Timestamp): 全銘柄のデータ最小日。
+        max_date (pd.Timestamp): 全銘柄のデータ最大日。
+
+    Returns:
+        list[tuple]: (最適化開始日, 最適化終了日, テスト開始日, テスト終了日) のリスト。
+    """
+    windows = []
+    current_optimization_start_date = min_date
+    while True:
+        # 最適化期間の終了日は、開始日 + OPTIMIZATION_WINDOW_DAYS
+        optimization_end_date = current_optimization_start_date + timedelta(
+            days=OPTIMIZATION_WINDOW_DAYS
+        )
+        # テスト期間の開始日は最適化期間の「次の日」
+        test_start_date = optimization_end_date + timedelta(days=1)
+        # テスト期間の終了日は、テスト期間の開始日 + TEST_WINDOW_DAYS
+        test_end_date = test_start_date + timedelta(days=TEST_WINDOW_DAYS)
+
+        # テスト期間が全データ期間を超過したら終了
+        # データがない期間で最適化・テストを試みないようにする
+        if (
+            optimization_end_date > max_date
+            or test_start_date >= test_end_date
+            or test_start_date > max_date
+        ):
+            logger.info("\nウォークフォワード最適化が全データ期間をカバーしました。")
+            break
+
+        windows.append(
+            (
+                current_optimization_start_date,
+                optimization_end_date,
+                test_start_date,
+                test_end_date,
+            )
+        )
+        # 次の最適化期間の開始日を設定
+        current_optimization_start_date += timedelta(days=WALK_FORWARD_STEP_DAYS)
+    return windows
+
+
+def run_walk_forward_window(
+    window: tuple,
+    full_processed_dfs: dict,
+    indicator_cache: IndicatorCache,
+    strategy_manager: StrategyManager | None = None,
+    keep_signals: bool = False,
+) -> dict:
+    """
+    ウォークフォワードの1期間について、パラメータ最適化とバックテストを実行します。
+
+    各期間は INITIAL_CASH から独立して開始するため、他の期間の結果に依存しません。
+
+    Args:
+        window (tuple): generate_walk_forward_windows が返す期間の組。
+        full_processed_dfs (dict): 銘柄ごとの全期間の処理済みデータ ('Date' 列付き)。
+        indicator_cache (IndicatorCache): 全銘柄を登録済みの指標キャッシュ。
+        strategy_manager (StrategyManager, optional): 使用するStrategyManager。
+        keep_signals (bool): True の場合、テスト期間の銘柄ごとの終値・SMA・
+            シグナルを結果に含めます (銘柄別チャートの描画用)。
+
+    Returns:
+        dict: 'window', 'best_params', 'best_params_by_ticker' (銘柄ごとの
+            パラメータ。'first_ticker' モードでは空)、'summary', 'portfolio_df',
+            'trades_df', 'cache_stats', 'metrics' (StageMetrics の records) を含む辞書。
+            最適化キャッシュを使う場合は 'optimization_cache_stats' も含みます。
+            keep_signals が True の場合は 'signal_dfs' (銘柄 -> compact_signal_frame
+            の結果) も含みます。最適化やバックテストに失敗した場合、該当する値は None です。
+    """
+    if strategy_manager is None:
+        strategy_manager = StrategyManager()
+    window_start_time = time.perf_counter()
+
+    (
+        current_optimization_start_date,
+        optimization_end_date,
+        test_start_date,
+        test_end_date,
+    ) = window
+    window_label = current_optimization_start_date.strftime("%Y-%m-%d")
+    metrics = StageMetrics()
+    stats_before = indicator_cache.stats()
+    optimization_cache = strategy_manager.optimization_cache
+    optimization_stats_before = (
+        (
+            optimization_cache.hits,
+            optimization_cache.misses,
+            optimization_cache.evictions,
+        )
+        if optimization_cache is not None
+        else None
+    )
+    result = {
+        "window": window,
+        "best_params": None,
+        "best_params_by_ticker": {},
+        "summary": None,
+        "portfolio_df": None,
+        "trades_df": None,
+    }
+    if keep_signals:
+        result["signal_dfs"] = {}
+
+    def finish() -> dict:
+        stats_after = indicator_cache.stats()
+        result["cache_stats"] = {
+            "hits": stats_after["hits"] - stats_before["hits"],
+            "misses": stats_after["misses"] - stats_before["misses"],
+        }
+        if optimization_cache is not None:
+            hits, misses, evictions = optimization_stats_before
+            result["optimization_cache_stats"] = {
+                "hits": optimization_cache.hits - hits,
+                "misses": optimization_cache.misses - misses,
+                "evictions": optimization_cache.evictions - evictions,
+            }
+        metrics.record(
+            "window", time.perf_counter() - window_start_time, window=window_label
+        )
+        result["metrics"] = metrics.records
+        return result
+
+    logger.info(
+        "\n--- ウォークフォワード期間: 最適化期間 [%s - %s] ---",
+        current_optimization_start_date.strftime("%Y-%m-%d"),
+        optimization_end_date.strftime("%Y-%m-%d"),
+    )
+    logger.info(
+        "--- テスト期間: [%s - %s] ---",
+        test_start_date.strftime("%Y-%m-%d"),
+        test_end_date.strftime("%Y-%m-%d"),
+    )
+
+    # 各銘柄のデータを最適化期間とテスト期間に分割
+    current_processed_dfs_for_optimization = {}
+    current_processed_dfs_for_test = {}
+
+    # 全期間の処理済みデータから、現在のウォークフォワード期間にスライスする
+    for ticker, df_full_processed in full_processed_dfs.items():
+        # 最適化期間のデータ
+        opt_df = indicator_cache.slice_period(
+            df_full_processed,
+            current_optimization_start_date,
+            optimization_end_date,
+        )
+        if not opt_df.empty:
+            current_processed_dfs_for_optimization[ticker] = opt_df
+        else:
+            logger.warning(
+                "警告: %s の最適化期間 [%s - %s] のデータが空です。",
+                ticker,
+                current_optimization_start_date.strftime("%Y-%m-%d"),
+                optimization_end_date.strftime("%Y-%m-%d"),
+            )
+
+        # テスト期間のデータ
+        test_df = indicator_cache.slice_period(
+            df_full_processed, test_start_date, test_end_date
+        )
+        if not test_df.empty:
+            current_processed_dfs_for_test[ticker] = test_df
+        else:
+            logger.warning(
+                "警告: %s のテスト期間 [%s - %s] のデータが空です。",
+                ticker,
+                test_start_date.strftime("%Y-%m-%d"),
+                test_end_date.strftime("%Y-%m-%d"),
+            )
+
+    if not current_processed_dfs_for_optimization:
+        logger.warning(
+            "最適化期間のデータが不足しているため、このウォークフォワード期間をスキップします。"
+        )
+        return finish()
+
+    # 1. パラメータ最適化 (最適化期間のデータを使用)
+    if strategy_manager.sma_optimization_mode == "first_ticker":
+        # 最も有望な銘柄のデータを取得 (ここでは最適化期間の代表銘柄として最初の銘柄を使用)
+        optimization_ticker = next(iter(current_processed_dfs_for_optimization))
+        df_for_optimization = current_processed_dfs_for_optimization[
+            optimization_ticker
+        ]
+        with metrics.timer("optimize", window=window_label, ticker=optimization_ticker):
+            best_params = strategy_manager.optimize_strategy_parameters(
+                df_for_optimization, "SMA_Strategy"
+            )
+        best_params_by_ticker = {}
+    else:
+        # 全銘柄を一括で評価し、銘柄ごと (または全銘柄共通) のパラメータを求める
+        with metrics.timer("optimize", window=window_label):
+            best_params_by_ticker, _ = strategy_manager.optimize_sma_cross_section(
+                current_processed_dfs_for_optimization
+            )
+        # 代表のパラメータ (最適化できなかった銘柄にも適用) は最初の銘柄のもの
+        best_params = next(iter(best_params_by_ticker.values()), None)
+        logger.info(
+            "全銘柄の最適化完了 (%s): %s",
+            strategy_manager.sma_optimization_mode,
+            best_params_by_ticker,
+        )
+
+    if not best_params:
+        logger.warning("パラメータ最適化に失敗しました。スキップします。")
+        return finish()
+    result["best_params"] = best_params
+    result["best_params_by_ticker"] = best_params_by_ticker
+
+    processed_dfs_for_test_with_optimized_params = {}
+    for ticker in current_processed_dfs_for_test:
+        ticker_params = best_params_by_ticker.get(ticker, best_params)
+        # 最適化されたMA期間で全戦略のシグナルを生成する。指標はキャッシュから
+        # 取得し (未計算なら全期間で一度だけ計算)、テスト期間にスライスして使う
+        with metrics.timer("signals", window=window_label, ticker=ticker):
+            df_test_signals = strategy_manager.run_strategies(
+                indicator_cache,
+                [ticker],
+                {**STRATEGIES, "SMA_Strategy": ticker_params},
+                period=(test_start_date, test_end_date),
+                trade_strategy="SMA_Strategy",
+            ).get(ticker)
+        if df_test_signals is None:
+            logger.warning(
+                "警告: %s のテスト期間の指標計算またはシグナル生成に失敗しました。スキップします。",
+                ticker,
+            )
+            continue
+
+        processed_dfs_for_test_with_optimized_params[ticker] = df_test_signals
+        if keep_signals:
+            # Backtester は渡したデータのインデックスを変更するため、先に取り出しておく
+            result["signal_dfs"][ticker] = compact_signal_frame(
+                df_test_signals, ticker_params
+            )
+
+    if not processed_dfs_for_test_with_optimized_params:
+        logger.warning("テスト期間のデータ処理に失敗しました。スキップします。")
+        return finish()
+
+    # 2. テスト期間でバックテストを実行 (最適化されたパラメータを使用)
+    with metrics.timer("backtest", window=window_label):
+        backtester = Backtester(
+            processed_dfs_for_test_with_optimized_params,
+            strategy_name="SMA_Strategy",
+            initial_cash=INITIAL_CASH,
+            leverage_ratio=LEVERAGE_RATIO,
+        )
+        df_portfolio_current_test, df_trades_current_test = backtester.run_simulation()
+
+    if df_portfolio_current_test is None or df_trades_current_test is None:
+        logger.warning("バックテスト実行に失敗しました。スキップします。")
+        return finish()
+
+    result["summary"] = backtester.get_summary_results()
+    result["portfolio_df"] = df_portfolio_current_test
+    result["trades_df"] = df_trades_current_test
+    return finish()
+
+
+def compact_signal_frame(df_signals: pd.DataFrame, params: dict) -> pd.DataFrame:
+    """
+    チャートの描画に必要な列だけを、SMA期間によらない列名で取り出します。
+
+    Args:
+        df_signals (pd.DataFrame): run_strategies の結果 ('Date' 列付き)。
+        params (dict): シグナル生成に使ったパラメータ ('short_ma', 'long_ma')。
+
+    Returns:
+        pd.DataFrame: 'Date', 'Close', 'SMA_Short', 'SMA_Long', 'Trade_Signal'
+            列を持つデータ。
+    """
+    return pd.DataFrame(
+        {
+            "Date": df_signals["Date"].to_numpy(),
+            "Close": df_signals["Close"].to_numpy(),
+            "SMA_Short": df_signals[f"SMA_{params['short_ma']}"].to_numpy(),
+            "SMA_Long": df_signals[f"SMA_{params['long_ma']}"].to_numpy(),
+            "Trade_Signal": df_signals["Trade_Signal"].to_numpy(),
+        }
+    )
+
+
+def _init_walk_forward_worker(
+    full_processed_dfs: dict,
+    indicator_cache,
+    strategy_manager,
+    log_level: int,
+    keep_signals: bool = False,
+):
+    """
+    ワーカープロセスの初期化時に、全期間データと指標キャッシュを受け取ります。
+
+    Args:
+        full_processed_dfs (dict): 銘柄ごとの全期間の処理済みデータ。
+        indicator_cache (IndicatorCache): 全銘柄を登録済みの指標キャッシュ。
+        strategy_manager (StrategyManager): 各期間で使用するStrategyManager。
+        log_level (int): 親プロセスで setup_logging により設定したログレベル。
+            0 (未設定) の場合はワーカーでもログを出力しません。
+        keep_signals (bool): 各期間の結果に銘柄ごとのシグナルを含めるかどうか。
+    """
+    if log_level:
+        setup_logging(log_level)
+    _worker_context["full_processed_dfs"] = full_processed_dfs
+    _worker_context["indicator_cache"] = indicator_cache
+    _worker_context["strategy_manager"] = strategy_manager
+    _worker_context["keep_signals"] = keep_signals
+
+
+def _run_walk_forward_window_in_worker(window: tuple) -> dict:
+    """
+    ワーカープロセス内で1期間を実行します。
+
+    Args:
+        window (tuple): generate_walk_forward_windows が返す期間の組。
+
+    Returns:
+        dict: run_walk_forward_window の戻り値。
+    """
+    return run_walk_forward_window(
+        window,
+        _worker_context["full_processed_dfs"],
+        _worker_context["indicator_cache"],
+        _worker_context["strategy_manager"],
+        _worker_context["keep_signals"],
+    )
+
+
+def run_walk_forward(
+    windows: list,
+    full_processed_dfs: dict,
+    indicator_cache: IndicatorCache,
+    max_workers: int = WALK_FORWARD_MAX_WORKERS,
+    strategy_manager: StrategyManager | None = None,
+    metrics: StageMetrics | None = None,
+    keep_signals: bool = False,
+) -> dict:
+    """
+    全てのウォークフォワード期間を実行し、結果を期間順に統合します。
+
+    max_workers が 2 以上の場合は期間をプロセスプールに分配して並列に実行します。
+    各期間は独立しているため、統合結果は逐次実行と同じです。
+
+    Args:
+        windows (list[tuple]): generate_walk_forward_windows が返す期間のリスト。
+        full_processed_dfs (dict): 銘柄ごとの全期間の処理済みデータ。
+        indicator_cache (IndicatorCache): 全銘柄を登録済みの指標キャッシュ。
+        max_workers (int): ワーカープロセス数。1 以下なら逐次実行、None なら
+            CPUコア数。
+        strategy_manager (StrategyManager, optional): 使用するStrategyManager
+            (最適化の探索範囲を変える場合に指定)。
+        metrics (StageMetrics, optional): 各期間の段階別の実行時間を追加する
+            メトリクス。並列実行時もワーカー側の記録を統合します。
+        keep_signals (bool): True の場合、各テスト期間の銘柄ごとの終値・SMA・
+            シグナルを 'window_signals' に含めます (銘柄別チャートの描画用)。
+
+    Returns:
+        dict: 'results' (各テスト期間のサマリー結果のリスト)、
+            'trades' (統合された取引履歴)、'portfolio_dfs' (各テスト期間の
+            ポートフォリオ推移DFのリスト)、'best_params' (最後に最適化された
+            パラメータ、またはNone)、'window_signals' (keep_signals の場合、
+            テスト期間ごとの 'label', 'params_by_ticker', 'signal_dfs',
+            'trades_df' を持つ辞書のリスト。それ以外は空) を含む辞書。
+    """
+    if strategy_manager is None:
+        strategy_manager = StrategyManager()
+
+    if max_workers is not None and max_workers <= 1:
+        window_results = [
+            run_walk_forward_window(
+                window,
+                full_processed_dfs,
+                indicator_cache,
+                strategy_manager,
+                keep_signals,
+            )
+            for window in windows
+        ]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_walk_forward_worker,
+            initargs=(
+                full_processed_dfs,
+                indicator_cache,
+                strategy_manager,
+                logging.getLogger(ROOT_LOGGER_NAME).level,
+                keep_signals,
+            ),
+        ) as executor:
+            # map は投入順に結果を返すため、期間の順序が保たれる
+            window_results = list(
+                executor.map(_run_walk_forward_window_in_worker, windows)
+            )
+        # ワーカー側で発生したキャッシュのヒット/ミスを親プロセスの集計に加える
+        for window_result in window_results:
+            indicator_cache.add_stats(window_result["cache_stats"])
+            if strategy_manager.optimization_cache is not None:
+                strategy_manager.optimization_cache.add_stats(
+                    window_result["optimization_cache_stats"]
+                )
+
+    if metrics is not None:
+        for window_result in window_results:
+            metrics.merge(window_result["metrics"])
+
+    all_walk_forward_results = []  # 各テスト期間のサマリー結果
+    window_trade_dfs = []  # 各テスト期間の取引履歴 (最後に一度だけ連結)
+    all_walk_forward_portfolio_dfs = []  # 各テスト期間のポートフォリオ推移DF
+    window_signals = []  # 各テスト期間の銘柄ごとのシグナル (keep_signals の場合)
+    last_best_params = None
+
+    for window_result in window_results:
+        if window_result["best_params"]:
+            last_best_params = window_result["best_params"]
+        if window_result["summary"] is None:
+            continue
+
+        # 結果を蓄積
+        all_walk_forward_results.append(window_result["summary"])
+        window_trade_dfs.append(window_result["trades_df"])
+        all_walk_forward_portfolio_dfs.append(window_result["portfolio_df"])
+        if keep_signals:
+            best_params = window_result["best_params"]
+            window_signals.append(
+                {
+                    "label": window_result["window"][2].strftime("%Y-%m-%d"),
+                    "params_by_ticker": {
+                        ticker: window_result["best_params_by_ticker"].get(
+                            ticker, best_params
+                        )
+                        for ticker in window_result["signal_dfs"]
+                    },
+                    "signal_dfs": window_result["signal_dfs"],
+                    "trades_df": window_result["trades_df"],
+                }
+            )
+
+    # 全期間の統合された取引履歴
+    all_walk_forward_trades = (
+        pd.concat(window_trade_dfs, ignore_index=True)
+        if window_trade_dfs
+        else pd.DataFrame()
+    )
+
+    return {
+        "results": all_walk_forward_results,
+        "trades": all_walk_forward_trades,
+        "portfolio_dfs": all_walk_forward_portfolio_dfs,
+        "best_params": last_best_params,
+        "window_signals": window_signals,
+    }
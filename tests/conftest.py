@@ -0,0 +1,26 @@
+# stock_trading_bot/tests/conftest.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def random_close():
+    """
+    幾何ランダムウォークの終値を作成する関数を返します。
+
+    返す関数は (シード値, 行数) を受け取り、2015-01-01 からの営業日を
+    インデックス ('Date') とする終値の系列を返します。同じシード値なら
+    同じ値になります。
+    """
+
+    def make(seed: int, n_rows: int = 1000) -> pd.Series:
+        rng = np.random.default_rng(seed)
+        return pd.Series(
+            100 * np.exp(np.cumsum(rng.normal(0, 0.02, n_rows))),
+            index=pd.bdate_range("2015-01-01", periods=n_rows, name="Date"),
+            name="Close",
+        )
+
+    return make
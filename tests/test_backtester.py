@@ -0,0 +1,83 @@
+# stock_trading_bot/tests/test_backtester.py
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from src.backtester import Backtester
+from src.strategy_manager import StrategyManager
+
+
+def _signal_dfs(seed: int, tickers=("AAA", "BBB", "CCC"), n_rows: int = 400) -> dict:
+    """
+    銘柄ごとに営業日が少しずつ欠けた、シグナル付きの処理済みデータを作成します。
+
+    Args:
+        seed (int): 乱数のシード。
+        tickers (tuple[str]): ティッカーシンボル。
+        n_rows (int): 欠損前の営業日数。
+
+    Returns:
+        dict: 銘柄 -> 'Date', 'Close', 'Trade_Signal' 列を持つデータフレーム。
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2020-01-01", periods=n_rows)
+    dfs = {}
+    for ticker in tickers:
+        keep = rng.random(n_rows) > 0.05
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n_rows)))
+        df = pd.DataFrame({"Date": dates[keep], "Close": close[keep]})
+        df["SMA_5"] = df["Close"].rolling(5, min_periods=1).mean()
+        df["SMA_20"] = df["Close"].rolling(20, min_periods=1).mean()
+        dfs[ticker] = StrategyManager().generate_trading_signals(
+            df, "SMA_Strategy", {"short_ma": 5, "long_ma": 20}
+        )
+    return dfs
+
+
+def _run(backend: str, seed: int):
+    """指定したバックエンドでシミュレーションを実行します。"""
+    backtester = Backtester(_signal_dfs(seed), "SMA_Strategy", backend=backend)
+    portfolio, trades = backtester.run_simulation()
+    return backtester, portfolio, trades
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_numpy_backend_matches_python_backend(seed):
+    """配列ベースの実装が、辞書ベースの実装と同じ履歴と最終状態になること。"""
+    python_bt, python_portfolio, python_trades = _run("python", seed)
+    numpy_bt, numpy_portfolio, numpy_trades = _run("numpy", seed)
+
+    assert len(python_trades) > 0
+    pdt.assert_frame_equal(numpy_portfolio, python_portfolio)
+    pdt.assert_frame_equal(numpy_trades, python_trades)
+    assert numpy_bt.current_cash == python_bt.current_cash
+    assert numpy_bt.shares_held == python_bt.shares_held
+
+
+def test_aligned_panel_uses_common_dates():
+    """整列済みの配列が、全銘柄に共通する日付の終値とシグナルを持つこと。"""
+    dfs = _signal_dfs(0)
+    originals = {ticker: df.set_index("Date") for ticker, df in dfs.items()}
+    backtester = Backtester(dfs, "SMA_Strategy")
+
+    common = originals["AAA"].index
+    for df in originals.values():
+        common = common.intersection(df.index)
+    assert backtester.dates == list(common)
+    for column, ticker in enumerate(backtester.panel_tickers):
+        np.testing.assert_array_equal(
+            backtester.close_panel[:, column],
+            originals[ticker].loc[common, "Close"].to_numpy(),
+        )
+        np.testing.assert_array_equal(
+            backtester.signal_panel[:, column],
+            originals[ticker].loc[common, "Trade_Signal"].to_numpy(),
+        )
+
+
+def test_unknown_backend_falls_back_to_python():
+    """未知のバックエンドを指定した場合は 'python' を使用すること。"""
+    backtester = Backtester(_signal_dfs(0), "SMA_Strategy", backend="cython")
+    assert backtester.backend == "python"
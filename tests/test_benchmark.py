@@ -0,0 +1,57 @@
+# stock_trading_bot/tests/test_benchmark.py
+
+from src.benchmark import compare_with_baseline, measure
+
+
+def _results(seconds: float, peak_memory_mb: float = 10.0) -> dict:
+    """1つの組み合わせ・1段階だけを持つ計測結果を作成します。"""
+    return {
+        "cases": [
+            {
+                "tickers": 10,
+                "years": 2,
+                "grid": "default",
+                "stages": {
+                    "signals": {"seconds": seconds, "peak_memory_mb": peak_memory_mb}
+                },
+            }
+        ]
+    }
+
+
+def test_identical_results_have_no_regressions():
+    """同じ結果同士の比較では退行を検出しないこと。"""
+    assert compare_with_baseline(_results(0.2), _results(0.2)) == []
+
+
+def test_small_time_increase_is_ignored():
+    """増加率が大きくても、増加が下限の秒数未満なら退行としないこと。"""
+    assert compare_with_baseline(_results(0.03), _results(0.01), 0.2, 0.05) == []
+
+
+def test_large_time_increase_is_reported():
+    """増加率と増加量の両方が閾値を超えた場合は退行として返すこと。"""
+    regressions = compare_with_baseline(_results(1.0), _results(0.5), 0.2, 0.05)
+    assert [(r["stage"], r["metric"]) for r in regressions] == [("signals", "seconds")]
+    assert regressions[0]["ratio"] == 2.0
+
+
+def test_memory_increase_is_reported():
+    """ピークメモリの増加は秒数の下限によらず比較されること。"""
+    regressions = compare_with_baseline(_results(0.2, 30.0), _results(0.2, 10.0))
+    assert [r["metric"] for r in regressions] == ["peak_memory_mb"]
+
+
+def test_measure_returns_median_of_repeats():
+    """実行時間は repeat 回の中央値で、戻り値は関数の戻り値であること。"""
+    calls = []
+
+    def func():
+        calls.append(None)
+        return len(calls)
+
+    result, seconds, peak_bytes = measure(func, repeat=5, trace_memory=False)
+    assert len(calls) == 5
+    assert result == 5
+    assert seconds >= 0
+    assert peak_bytes is None
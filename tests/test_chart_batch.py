@@ -0,0 +1,127 @@
+# stock_trading_bot/tests/test_chart_batch.py
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from src.chart_batch import build_chart_tasks, generate_charts
+
+
+def _signal_frame(start: str, periods: int, close: float) -> pd.DataFrame:
+    """compact_signal_frame と同じ列を持つ、終値が一定のシグナルを作成します。"""
+    return pd.DataFrame(
+        {
+            "Date": pd.bdate_range(start, periods=periods),
+            "Close": np.full(periods, close),
+            "SMA_Short": np.full(periods, close),
+            "SMA_Long": np.full(periods, close),
+            "Signal": np.zeros(periods, dtype=np.int8),
+        }
+    )
+
+
+def _trades(rows: list) -> pd.DataFrame:
+    """'Date', 'Ticker', 'Trade_Type', 'Price' 列を持つ取引履歴を作成します。"""
+    return pd.DataFrame(rows, columns=["Date", "Ticker", "Trade_Type", "Price"])
+
+
+def _window_signals() -> list:
+    """2つのテスト期間が5営業日重なる、2銘柄分の window_signals を作成します。"""
+    first_trades = _trades([[pd.Timestamp("2020-01-02"), "AAA", "BUY", 100.0]])
+    second_trades = _trades([[pd.Timestamp("2020-01-14"), "AAA", "SELL", 200.0]])
+    return [
+        {
+            "label": "2020-01-01",
+            "params_by_ticker": {
+                "AAA": {"short_ma": 5, "long_ma": 20},
+                "B/B": {"short_ma": 5, "long_ma": 20},
+            },
+            "signal_dfs": {
+                "AAA": _signal_frame("2020-01-01", 10, 100.0),
+                "B/B": _signal_frame("2020-01-01", 10, 50.0),
+            },
+            "trades_df": first_trades,
+        },
+        {
+            "label": "2020-01-08",
+            "params_by_ticker": {"AAA": {"short_ma": 10, "long_ma": 40}},
+            "signal_dfs": {"AAA": _signal_frame("2020-01-08", 10, 200.0)},
+            "trades_df": second_trades,
+        },
+    ]
+
+
+def test_window_mode_builds_one_chart_per_window_and_ticker(tmp_path):
+    """ "window" では期間ごとのディレクトリに銘柄ごとのチャートを作ること。"""
+    window_signals = _window_signals()
+
+    tasks = build_chart_tasks(window_signals, None, "window", str(tmp_path))
+
+    assert [(path, title) for _, _, path, title in tasks] == [
+        (
+            os.path.join(str(tmp_path), "2020-01-01", "AAA"),
+            "AAA (2020-01-01, SMA 5/20)",
+        ),
+        (
+            os.path.join(str(tmp_path), "2020-01-01", "B_B"),
+            "B/B (2020-01-01, SMA 5/20)",
+        ),
+        (
+            os.path.join(str(tmp_path), "2020-01-08", "AAA"),
+            "AAA (2020-01-08, SMA 10/40)",
+        ),
+    ]
+    assert list(tasks[0][1]["Trade_Type"]) == ["BUY"]
+    assert tasks[1][1].empty
+
+
+def test_ticker_mode_prefers_later_window_on_overlap(tmp_path):
+    """ "ticker" では期間を連結し、重なる日付は後の期間の値を使うこと。"""
+    window_signals = _window_signals()
+    df_trades = pd.concat(
+        [entry["trades_df"] for entry in window_signals], ignore_index=True
+    )
+
+    tasks = build_chart_tasks(window_signals, df_trades, "ticker", str(tmp_path))
+
+    assert [(path, title) for _, _, path, title in tasks] == [
+        (os.path.join(str(tmp_path), "AAA"), "AAA (Walk-Forward Test Periods)"),
+        (os.path.join(str(tmp_path), "B_B"), "B/B (Walk-Forward Test Periods)"),
+    ]
+    df_signals, trades, _, _ = tasks[0]
+    assert df_signals["Date"].is_unique
+    assert df_signals["Date"].is_monotonic_increasing
+    expected_dates = pd.bdate_range("2020-01-01", "2020-01-21")
+    assert list(df_signals["Date"]) == list(expected_dates)
+    is_second = df_signals["Date"] >= pd.Timestamp("2020-01-08")
+    assert (df_signals.loc[is_second, "Close"] == 200.0).all()
+    assert (df_signals.loc[~is_second, "Close"] == 100.0).all()
+    assert list(trades["Trade_Type"]) == ["BUY", "SELL"]
+
+
+def test_both_mode_combines_window_and_ticker_charts(tmp_path):
+    """ "both" では期間ごとと銘柄ごとの両方のチャートを作ること。"""
+    window_signals = _window_signals()
+
+    tasks = build_chart_tasks(window_signals, None, "both", str(tmp_path))
+
+    assert len(tasks) == 3 + 2
+
+
+def test_generate_charts_writes_image_files(tmp_path):
+    """逐次実行で全てのチャートの画像ファイルを保存すること。"""
+    paths = generate_charts(
+        _window_signals(),
+        None,
+        mode="both",
+        output_dir=str(tmp_path),
+        max_workers=1,
+        dpi=50,
+        image_format="png",
+    )
+
+    assert len(paths) == 5
+    for path in paths:
+        assert path.endswith(".png")
+        assert os.path.getsize(path) > 0
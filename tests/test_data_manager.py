@@ -0,0 +1,162 @@
+# stock_trading_bot/tests/test_data_manager.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_manager import DataManager, compute_rsi_table
+
+
+class _FakeProvider:
+    """
+    営業日ごとの決まった価格を返し、呼び出しを記録するデータ取得関数。
+
+    `scale` を変えると全期間の価格が変わり、分割・配当による
+    調整後価格の再計算を再現します。
+    """
+
+    def __init__(self):
+        self.calls = []
+        self.scale = 1.0
+
+    def __call__(self, ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
+        self.calls.append((ticker, start_date, end_date))
+        dates = pd.bdate_range(start_date, end_date, inclusive="left")
+        # 2015-01-01 は休場日として扱う
+        dates = dates[dates != pd.Timestamp("2015-01-01")]
+        close = self.scale * (100 + 0.5 * dates.dayofyear.to_numpy())
+        return pd.DataFrame(
+            {
+                "Open": close,
+                "High": close,
+                "Low": close,
+                "Close": close,
+                "Volume": 1000,
+            },
+            index=pd.DatetimeIndex(dates, name="Date"),
+        )
+
+
+def test_incremental_fetch_does_not_refetch_holiday_start(tmp_path):
+    """開始日が休場日でも、2回目以降は先頭側の期間を取得し直さないこと。"""
+    provider = _FakeProvider()
+    data_manager = DataManager(provider=provider, data_dir=str(tmp_path))
+
+    data_manager.fetch_multiple_data_incremental(["AAA"], "2015-01-01", "2015-03-01")
+    assert len(provider.calls) == 1
+
+    provider.calls.clear()
+    dfs = data_manager.fetch_multiple_data_incremental(
+        ["AAA"], "2015-01-01", "2015-03-10"
+    )
+    assert provider.calls == [("AAA", "2015-02-27", "2015-03-10")]
+    assert dfs["AAA"].index.max() == pd.Timestamp("2015-03-09")
+    assert not dfs["AAA"].index.duplicated().any()
+
+    provider.calls.clear()
+    data_manager.fetch_multiple_data_incremental(["AAA"], "2015-01-01", "2015-03-10")
+    assert provider.calls == []
+
+
+def test_incremental_fetch_matches_full_fetch(tmp_path):
+    """差分取得を重ねたCSVが、全期間を一度に取得した結果と一致すること。"""
+    provider = _FakeProvider()
+    data_manager = DataManager(provider=provider, data_dir=str(tmp_path / "inc"))
+    for end_date in ["2015-02-01", "2015-02-15", "2015-04-01"]:
+        data_manager.fetch_multiple_data_incremental(["AAA"], "2015-01-01", end_date)
+
+    full_manager = DataManager(provider=provider, data_dir=str(tmp_path / "full"))
+    full_manager.fetch_multiple_data_from_yfinance(["AAA"], "2015-01-01", "2015-04-01")
+
+    pd.testing.assert_frame_equal(
+        data_manager.load_data_from_csv("AAA"),
+        full_manager.load_data_from_csv("AAA"),
+    )
+
+
+def test_incremental_fetch_rewrites_history_after_adjustment(tmp_path):
+    """重ねて取得した1本の価格が変わった場合、全期間を取得し直すこと。"""
+    provider = _FakeProvider()
+    data_manager = DataManager(provider=provider, data_dir=str(tmp_path))
+    data_manager.fetch_multiple_data_incremental(["AAA"], "2015-01-01", "2015-03-01")
+
+    provider.scale = 0.5
+    provider.calls.clear()
+    dfs = data_manager.fetch_multiple_data_incremental(
+        ["AAA"], "2015-01-01", "2015-03-10"
+    )
+
+    assert provider.calls[-1] == ("AAA", "2015-01-01", "2015-03-10")
+    expected = provider("AAA", "2015-01-01", "2015-03-10")
+    np.testing.assert_allclose(
+        data_manager.load_data_from_csv("AAA")["Close"], expected["Close"]
+    )
+    np.testing.assert_allclose(dfs["AAA"]["Close"], expected["Close"])
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_compute_rsi_table_matches_compute_rsi(seed, random_close):
+    """smoothing="sma" の各列が、期間ごとの compute_rsi と一致すること。"""
+    close = random_close(seed, 300)
+    close.iloc[[40, 41, 120]] = np.nan  # 欠損の前後は差分を 0 とする
+    periods = [2, 5, 14, 30]
+
+    table = compute_rsi_table(close.to_numpy(), periods)
+
+    data_manager = DataManager(provider=lambda *args: None)
+    for column, period in enumerate(periods):
+        np.testing.assert_allclose(
+            table[:, column],
+            data_manager.compute_rsi(close, period).to_numpy(),
+            rtol=1e-10,
+            atol=1e-10,
+        )
+
+
+def test_compute_rsi_table_min_periods_none_masks_partial_windows(random_close):
+    """min_periods=None の場合、期間に満たない先頭行だけが NaN になること。"""
+    close = random_close(2, 100).to_numpy()
+    periods = [5, 14]
+
+    table = compute_rsi_table(close, periods, min_periods=None)
+    full = compute_rsi_table(close, periods)
+
+    for column, period in enumerate(periods):
+        assert np.isnan(table[: period - 1, column]).all()
+        np.testing.assert_array_equal(
+            table[period - 1 :, column], full[period - 1 :, column]
+        )
+
+
+def test_compute_rsi_table_wilder_matches_loop(random_close):
+    """smoothing="wilder" が、1行ずつの指数平滑化と一致すること。"""
+    close = random_close(3, 120).to_numpy()
+    period = 14
+
+    delta = np.diff(close, prepend=np.nan)
+    average_gain = average_loss = 0.0
+    expected = []
+    for i, change in enumerate(delta):
+        alpha = 1.0 / min(i + 1, period)
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        average_gain += (gain - average_gain) * alpha
+        average_loss += (loss - average_loss) * alpha
+        expected.append(
+            100 - 100 / (1 + average_gain / average_loss) if average_loss else np.nan
+        )
+
+    table = compute_rsi_table(close, [period], smoothing="wilder")
+    np.testing.assert_allclose(table[:, 0], expected, rtol=1e-12)
+
+
+def test_compute_rsi_table_dtype_and_invalid_smoothing(random_close):
+    """戻り値の型を指定でき、未知の平均化の方法は ValueError になること。"""
+    close = random_close(4, 50).to_numpy()
+
+    table = compute_rsi_table(close, [5, 14], dtype=np.float32)
+    assert table.dtype == np.float32
+    assert table.shape == (50, 2)
+
+    with pytest.raises(ValueError):
+        compute_rsi_table(close, [14], smoothing="ema")
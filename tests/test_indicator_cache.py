@@ -0,0 +1,77 @@
+# stock_trading_bot/tests/test_indicator_cache.py
+
+import pandas as pd
+
+from src.data_manager import DataManager
+from src.indicator_cache import IndicatorCache
+
+
+def _indicator_cache() -> IndicatorCache:
+    """ネットワークを使わないDataManagerで指標キャッシュを作成します。"""
+    return IndicatorCache(DataManager(provider=lambda *args: None))
+
+
+def test_hits_and_misses_are_counted(random_close):
+    """同じ指標の2回目以降はキャッシュから返し、ヒットとして数えること。"""
+    indicator_cache = _indicator_cache()
+    indicator_cache.register("AAA", random_close(0, 200).to_frame())
+
+    first = indicator_cache.get_sma("AAA", 5)
+    assert indicator_cache.stats() == {"hits": 0, "misses": 1, "entries": 1}
+    assert indicator_cache.get_sma("AAA", 5) is first
+    indicator_cache.get_sma("AAA", 20)
+    indicator_cache.get_rsi("AAA", 14)
+    assert indicator_cache.stats() == {"hits": 1, "misses": 3, "entries": 3}
+
+    # 処理済みデータは、計算済みの系列を再利用して組み立てる
+    frame = indicator_cache.get_indicator_frame("AAA", 5, 20, 14)
+    assert indicator_cache.stats() == {"hits": 4, "misses": 4, "entries": 4}
+    assert indicator_cache.get_indicator_frame("AAA", 5, 20, 14) is frame
+    assert indicator_cache.hits == 5
+
+
+def test_register_invalidates_only_changed_ticker(random_close):
+    """データが変わった銘柄のキャッシュだけを破棄し、同じデータの再登録では保持すること。"""
+    indicator_cache = _indicator_cache()
+    df = random_close(1, 200).to_frame()
+    other = random_close(2, 200).to_frame()
+    version = indicator_cache.register("AAA", df)
+    indicator_cache.register("BBB", other)
+    old_sma = indicator_cache.get_sma("AAA", 5)
+    indicator_cache.get_sma("BBB", 5)
+
+    assert indicator_cache.register("AAA", df.copy()) == version
+    assert indicator_cache.get_sma("AAA", 5) is old_sma
+
+    updated = df.copy()
+    updated.iloc[-1, 0] *= 1.1
+    assert indicator_cache.register("AAA", updated) != version
+    assert indicator_cache.stats()["entries"] == 1  # BBB の分だけが残る
+
+    new_sma = indicator_cache.get_sma("AAA", 5)
+    assert new_sma.iloc[-1] != old_sma.iloc[-1]
+    pd.testing.assert_series_equal(
+        new_sma, DataManager().compute_sma(updated["Close"], 5)
+    )
+
+
+def test_slice_period_is_half_open(random_close):
+    """slice_period は開始日を含み、終了日を含まない行のコピーを返すこと。"""
+    indicator_cache = _indicator_cache()
+    indicator_cache.register("AAA", random_close(3, 100).to_frame())
+    frame = indicator_cache.get_indicator_frame("AAA", 5, 20, 14)
+    dates = frame["Date"]
+
+    sliced = IndicatorCache.slice_period(frame, dates.iloc[10], dates.iloc[20])
+    assert sliced["Date"].tolist() == dates.iloc[10:20].tolist()
+
+    # 休日を挟む日付でも、範囲内の行だけを返す
+    sliced = IndicatorCache.slice_period(
+        frame,
+        dates.iloc[10] - pd.Timedelta(hours=1),
+        dates.iloc[20] + pd.Timedelta(hours=1),
+    )
+    assert sliced["Date"].tolist() == dates.iloc[10:21].tolist()
+
+    sliced.loc[sliced.index[0], "Close"] = -1.0
+    assert (frame["Close"] > 0).all()
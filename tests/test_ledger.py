@@ -0,0 +1,76 @@
+# stock_trading_bot/tests/test_ledger.py
+
+import pandas as pd
+import pytest
+
+from src.ledger import SIDE_BUY, SIDE_SELL, TRADE_COLUMNS, TradeLedger
+
+
+def _trade_records(n: int) -> list:
+    """以前の取引履歴と同じ形式の、辞書のリストを作成します。"""
+    dates = pd.bdate_range("2020-01-01", periods=n)
+    return [
+        {
+            "Date": dates[i],
+            "Ticker": ["AAA", "BBB", "CCC"][i % 3],
+            "Trade_Type": "BUY" if i % 2 == 0 else "SELL",
+            "Price": 100.0 + i * 0.25,
+            "Shares": i * 10,
+            "Cash_Left": 1e6 - i * 123.5,
+            "Portfolio_Value": 1e6 + i * 7.75,
+        }
+        for i in range(n)
+    ]
+
+
+def _ledger_from(records: list, capacity: int = 2) -> TradeLedger:
+    """辞書のリストの取引を、小さい容量から追加した台帳を作成します。"""
+    ledger = TradeLedger(["AAA"], capacity=capacity)
+    for record in records:
+        ledger.append(
+            record["Date"],
+            record["Ticker"],
+            SIDE_BUY if record["Trade_Type"] == "BUY" else SIDE_SELL,
+            record["Price"],
+            record["Shares"],
+            record["Cash_Left"],
+            record["Portfolio_Value"],
+        )
+    return ledger
+
+
+def test_append_grows_and_matches_list_of_dicts():
+    """容量を超えて追加しても、DataFrameが辞書のリストから作った表と一致すること。"""
+    records = _trade_records(11)
+    ledger = _ledger_from(records)
+
+    assert len(ledger) == 11
+    assert ledger.capacity == 16
+    assert ledger.tickers == ["AAA", "BBB", "CCC"]
+    pd.testing.assert_frame_equal(
+        ledger.to_frame(), pd.DataFrame(records, columns=TRADE_COLUMNS)
+    )
+
+
+def test_list_compatible_access():
+    """インデックス・スライス・反復で、以前と同じ辞書を返すこと。"""
+    records = _trade_records(5)
+    ledger = _ledger_from(records)
+
+    assert ledger[0] == records[0]
+    assert ledger[-1] == records[-1]
+    assert ledger[1:4] == records[1:4]
+    assert list(ledger) == records
+    pd.testing.assert_frame_equal(pd.DataFrame(ledger), pd.DataFrame(records))
+    with pytest.raises(IndexError):
+        ledger[5]
+
+
+def test_empty_ledger_frame_has_trade_columns():
+    """取引がない場合も、TRADE_COLUMNS の列を持つ空のDataFrameを返すこと。"""
+    ledger = TradeLedger()
+
+    df = ledger.to_frame()
+    assert df.empty
+    assert list(df.columns) == TRADE_COLUMNS
+    assert list(ledger) == []
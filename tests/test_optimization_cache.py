@@ -0,0 +1,70 @@
+# stock_trading_bot/tests/test_optimization_cache.py
+
+from src.optimization_cache import OptimizationCache, source_fingerprint
+from src.strategy_manager import StrategyManager, _evaluator_fingerprint
+
+
+def _key(df, search_space=None, evaluator="v1", strategy_name="SMA_Strategy"):
+    """既定の入力から一部だけを変えたキャッシュのキーを返します。"""
+    return OptimizationCache.make_key(
+        df,
+        strategy_name,
+        search_space or {"short_range": [5, 10], "long_range": [20, 40]},
+        "all_in_total_return",
+        evaluator,
+    )
+
+
+def test_make_key_depends_on_every_input(random_close):
+    """データ・戦略名・探索範囲・評価関数のどれかが変わるとキーが変わること。"""
+    df = random_close(0, 120).to_frame()
+    changed_df = df.copy()
+    changed_df.iloc[-1, 0] += 0.01
+
+    base = _key(df)
+    assert _key(df.copy()) == base
+    assert _key(changed_df) != base
+    assert _key(df, strategy_name="RSI_Strategy") != base
+    assert _key(df, search_space={"short_range": [5], "long_range": [20, 40]}) != base
+    assert _key(df, evaluator="v2") != base
+    assert _key({"AAA": df}) != _key({"BBB": df})
+
+
+def test_source_fingerprint_changes_with_source():
+    """ソースコードが異なる関数は、異なる識別子になること。"""
+
+    def evaluate(x):
+        return x + 1
+
+    def evaluate_changed(x):
+        return x + 2
+
+    assert source_fingerprint(evaluate) == source_fingerprint(evaluate)
+    assert source_fingerprint(evaluate) != source_fingerprint(evaluate_changed)
+    assert len(_evaluator_fingerprint()) == 64
+
+
+def test_cached_optimization_is_reused_only_for_same_evaluator(
+    tmp_path, monkeypatch, random_close
+):
+    """同じ入力ではキャッシュを使い、評価関数が変わった場合は計算し直すこと。"""
+    df = random_close(0, 120).to_frame()
+    cache = OptimizationCache(str(tmp_path))
+    strategy_manager = StrategyManager(optimization_cache=cache)
+    calls = []
+
+    def optimize():
+        calls.append(1)
+        return {"short_ma": 5, "long_ma": 20}, None
+
+    search_space = {"short_range": [5], "long_range": [20]}
+    strategy_manager._cached_optimization(df, "SMA_Strategy", search_space, optimize)
+    strategy_manager._cached_optimization(df, "SMA_Strategy", search_space, optimize)
+    assert len(calls) == 1
+    assert cache.hits == 1
+
+    monkeypatch.setattr(
+        "src.strategy_manager._evaluator_fingerprint", lambda: "changed"
+    )
+    strategy_manager._cached_optimization(df, "SMA_Strategy", search_space, optimize)
+    assert len(calls) == 2
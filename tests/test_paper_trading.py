@@ -0,0 +1,149 @@
+# stock_trading_bot/tests/test_paper_trading.py
+
+import json
+import zlib
+
+import pandas as pd
+import pytest
+
+from src.backtester import Backtester
+from src.config import STRATEGIES
+from src.data_manager import DataManager
+from src.indicator_cache import IndicatorCache
+from src.paper_trading import build_signal_dfs, run_daily
+from src.strategy_manager import StrategyManager
+from src.synthetic_data import SyntheticDataProvider
+
+TICKERS = ["AAA", "BBB", "CCC"]
+START_DATE = "2019-01-01"
+END_DATE = "2020-07-01"
+
+
+class _GappyProvider:
+    """
+    銘柄ごとに異なる日付が欠けた疑似データを返すデータ取得関数。
+
+    欠ける日付は銘柄と日付だけで決まるため、取得期間によらず同じです。
+    """
+
+    def __init__(self):
+        self.provider = SyntheticDataProvider(seed=3)
+
+    def __call__(self, ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
+        df = self.provider(ticker, start_date, end_date)
+        if df.empty:
+            return df
+        offset = zlib.crc32(ticker.encode("utf-8")) % 13
+        return df[(df.index.dayofyear + offset) % 13 != 0]
+
+
+def _run(tmp_path, name: str, end_dates: list) -> dict:
+    """end_dates の順に日次のペーパートレードを実行し、結果のファイルを読み込みます。"""
+    data_manager = DataManager(provider=_GappyProvider(), data_dir=str(tmp_path / name))
+    state_file = str(tmp_path / name / "state.json")
+    trade_log = str(tmp_path / name / "trades.csv")
+    for end_date in end_dates:
+        assert (
+            run_daily(
+                data_manager, TICKERS, START_DATE, end_date, state_file, trade_log
+            )
+            == 0
+        )
+    with open(state_file, encoding="utf-8") as f:
+        state = json.load(f)
+    with open(trade_log, encoding="utf-8") as f:
+        trades = f.read()
+    return {"state": state, "trades": trades, "data_manager": data_manager}
+
+
+def test_first_run_matches_batch_indicators(tmp_path):
+    """指標を1本ずつ更新したシグナル付きデータが、全期間の一括計算と一致すること。"""
+    data_manager = DataManager(provider=_GappyProvider(), data_dir=str(tmp_path))
+    signal_dfs = build_signal_dfs(data_manager, TICKERS, START_DATE, END_DATE)
+
+    params = STRATEGIES["SMA_Strategy"]
+    indicator_cache = IndicatorCache(data_manager)
+    for ticker in TICKERS:
+        indicator_cache.register(ticker, _GappyProvider()(ticker, START_DATE, END_DATE))
+        expected = StrategyManager().generate_trading_signals(
+            indicator_cache.get_indicator_frame(
+                ticker,
+                params["short_ma"],
+                params["long_ma"],
+                STRATEGIES["RSI_Strategy"]["rsi_period"],
+            ),
+            "SMA_Strategy",
+            params,
+        )
+        actual = signal_dfs[ticker]
+        columns = list(actual.columns)
+        pd.testing.assert_frame_equal(
+            actual, expected[columns].reset_index(drop=True), check_exact=True
+        )
+
+
+@pytest.mark.parametrize(
+    "cuts",
+    [
+        ["2019-06-01", "2019-06-04", "2019-06-05"],
+        ["2019-03-15", "2019-11-20", "2020-02-03"],
+    ],
+)
+def test_split_runs_match_single_run(tmp_path, cuts):
+    """日次実行を分けても、全期間を1回で実行した場合と同じ取引と状態になること。"""
+    single = _run(tmp_path, "single", [END_DATE])
+    split = _run(tmp_path, "split", cuts + [END_DATE, END_DATE])
+
+    assert split["trades"] == single["trades"]
+    for key in ("current_cash", "shares_held", "bought_price", "last_processed_date"):
+        assert split["state"][key] == single["state"][key]
+
+
+def test_resume_reads_only_new_bars(tmp_path, monkeypatch):
+    """状態から再開した場合は、指標の最終日以降の株価データだけを読み込むこと。"""
+    first = _run(tmp_path, "resume", ["2020-01-01"])
+    data_manager = first["data_manager"]
+    requested = []
+    fetch = data_manager.fetch_multiple_data_incremental
+
+    def recording_fetch(tickers, start_date, end_date, *args, **kwargs):
+        requested.append((tuple(tickers), start_date))
+        return fetch(tickers, start_date, end_date, *args, **kwargs)
+
+    monkeypatch.setattr(
+        data_manager, "fetch_multiple_data_incremental", recording_fetch
+    )
+    run_daily(
+        data_manager,
+        TICKERS,
+        START_DATE,
+        END_DATE,
+        str(tmp_path / "resume" / "state.json"),
+        str(tmp_path / "resume" / "trades.csv"),
+    )
+
+    last_dates = [
+        pd.Timestamp(state["indicators"]["last_date"])
+        for state in first["state"]["indicators"].values()
+    ]
+    assert requested == [(tuple(TICKERS), min(last_dates).strftime("%Y-%m-%d"))]
+
+
+def test_crash_before_saving_state_does_not_duplicate_trades(tmp_path, monkeypatch):
+    """取引ログへの追記後に状態を保存できなかった場合も、再実行で取引が重複しないこと。"""
+    single = _run(tmp_path, "single", [END_DATE])
+    _run(tmp_path, "crash", ["2019-09-01"])
+
+    save_state = Backtester.save_state
+
+    def failing_save_state(self, path, extra_state=None):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(Backtester, "save_state", failing_save_state)
+    with pytest.raises(OSError):
+        _run(tmp_path, "crash", [END_DATE])
+    monkeypatch.setattr(Backtester, "save_state", save_state)
+
+    crashed = _run(tmp_path, "crash", [END_DATE])
+    assert crashed["trades"] == single["trades"]
+    assert crashed["state"]["current_cash"] == single["state"]["current_cash"]
@@ -0,0 +1,117 @@
+# stock_trading_bot/tests/test_parameter_search.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.parameter_search import ParameterSearch
+from src.strategy_manager import StrategyManager
+
+SHORT_VALUES = list(range(2, 21, 2))
+LONG_VALUES = list(range(10, 61, 5))
+PEAK = (8, 35)
+
+
+class _CountingEvaluator:
+    """評価した組み合わせを記録する、頂点が1つのスコア関数。"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, pairs: list, first_row: int = 0) -> np.ndarray:
+        self.calls.append((list(pairs), first_row))
+        return np.array(
+            [
+                -((short_ma - PEAK[0]) ** 2) - (long_ma - PEAK[1]) ** 2 / 4
+                for short_ma, long_ma in pairs
+            ],
+            dtype=float,
+        )
+
+    @property
+    def n_evaluated(self) -> int:
+        return sum(len(pairs) for pairs, _ in self.calls)
+
+
+def _n_candidates() -> int:
+    return sum(
+        short_ma < long_ma for short_ma in SHORT_VALUES for long_ma in LONG_VALUES
+    )
+
+
+def _search(method: str, budget: int, seed: int = 0) -> tuple[dict, _CountingEvaluator]:
+    evaluate = _CountingEvaluator()
+    scores = ParameterSearch(method=method, budget=budget, seed=seed).search(
+        SHORT_VALUES, LONG_VALUES, evaluate, n_rows=400
+    )
+    return scores, evaluate
+
+
+@pytest.mark.parametrize("method", ["random", "successive_halving", "coordinate"])
+def test_budget_covering_all_candidates_falls_back_to_grid(method):
+    """予算が候補数以上なら、全ての組み合わせを一括で評価すること。"""
+    grid_scores, grid_evaluate = _search("grid", budget=1)
+    scores, evaluate = _search(method, budget=_n_candidates())
+
+    assert scores == grid_scores
+    assert len(scores) == _n_candidates()
+    assert evaluate.calls == grid_evaluate.calls
+
+
+@pytest.mark.parametrize("method", ["random", "successive_halving", "coordinate"])
+@pytest.mark.parametrize("budget", [1, 7, 30])
+def test_search_never_exceeds_budget(method, budget):
+    """いずれの探索方法も、評価する組み合わせの総数が予算以内であること。"""
+    scores, evaluate = _search(method, budget)
+
+    assert scores
+    assert evaluate.n_evaluated <= budget
+    assert len(scores) <= budget
+
+
+@pytest.mark.parametrize("method", ["random", "successive_halving", "coordinate"])
+def test_search_is_deterministic_for_seed(method):
+    """同じシードなら同じ順序で同じ組み合わせを評価すること。"""
+    first_scores, first_evaluate = _search(method, budget=20, seed=3)
+    second_scores, second_evaluate = _search(method, budget=20, seed=3)
+
+    assert first_scores == second_scores
+    assert first_evaluate.calls == second_evaluate.calls
+
+
+def test_coordinate_search_reaches_grid_optimum():
+    """頂点が1つのスコアでは、座標探索がグリッドサーチと同じ最良値に達すること。"""
+    grid_scores, _ = _search("grid", budget=1)
+    scores, _ = _search("coordinate", budget=30)
+
+    assert _n_candidates() > 30
+    assert max(scores, key=scores.get) == max(grid_scores, key=grid_scores.get)
+    assert max(scores, key=scores.get) == PEAK
+
+
+def test_search_sma_parameters_matches_grid_contract(random_close):
+    """search_sma_parameters が optimize_sma_grid と同じ形式の結果を返すこと。"""
+    df = random_close(2, 250).to_frame()
+    short_range, long_range = range(2, 21, 3), range(10, 61, 10)
+    grid_params, grid_surface = StrategyManager().optimize_sma_grid(
+        df, short_range, long_range
+    )
+
+    strategy_manager = StrategyManager(
+        parameter_search=ParameterSearch(method="random", budget=15, seed=0)
+    )
+    best_params, score_surface = strategy_manager.search_sma_parameters(
+        df, short_range, long_range
+    )
+
+    assert isinstance(score_surface, pd.DataFrame)
+    pd.testing.assert_index_equal(score_surface.index, grid_surface.index)
+    pd.testing.assert_index_equal(score_surface.columns, grid_surface.columns)
+    searched = score_surface.notna()
+    assert 0 < searched.sum().sum() <= 15
+    np.testing.assert_allclose(
+        score_surface[searched].stack(), grid_surface[searched].stack(), rtol=1e-12
+    )
+    best_short, best_long = score_surface.stack().idxmax()
+    assert best_params == {"short_ma": best_short, "long_ma": best_long}
+    assert set(grid_params) == set(best_params)
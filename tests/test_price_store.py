@@ -0,0 +1,103 @@
+# stock_trading_bot/tests/test_price_store.py
+
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.data_manager import DataManager
+from src.price_store import PRICE_COLUMNS, PriceStore, store_dir_for
+
+
+def _price_frame(start: str, periods: int, offset: float = 0.0) -> pd.DataFrame:
+    """営業日ごとの価格を持つ、インデックスがDateの株価データを作成します。"""
+    dates = pd.bdate_range(start, periods=periods, name="Date")
+    close = 100.0 + offset + np.arange(periods)
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close + 1,
+            "Low": close - 1,
+            "Close": close,
+            "Volume": np.arange(periods, dtype=np.int64) + 1000,
+        },
+        index=dates,
+    )
+
+
+def test_write_and_load_round_trip(tmp_path):
+    """書き込んだデータを、銘柄ごとの期間で読み戻せること。"""
+    dfs = {
+        "AAA": _price_frame("2020-01-01", 30),
+        "BBB": _price_frame("2020-01-15", 20, offset=50),
+    }
+    store = PriceStore(str(tmp_path / "store"))
+    store.write(dfs)
+
+    loaded = PriceStore(str(tmp_path / "store")).load(["AAA", "BBB", "CCC"])
+    for ticker, df in dfs.items():
+        pd.testing.assert_frame_equal(
+            loaded[ticker], df[PRICE_COLUMNS], check_freq=False
+        )
+    assert loaded["CCC"].empty
+
+
+def test_overwrite_replaces_whole_store(tmp_path):
+    """上書き後は新しいデータだけが読め、一時ディレクトリが残らないこと。"""
+    store_dir = str(tmp_path / "store")
+    PriceStore(store_dir).write({"AAA": _price_frame("2020-01-01", 30)})
+    PriceStore(store_dir).write({"BBB": _price_frame("2021-01-01", 10)})
+
+    store = PriceStore(store_dir)
+    assert store.manifest["tickers"] == ["BBB"]
+    assert store.load(["BBB"])["BBB"].index[0] == pd.Timestamp("2021-01-01")
+    assert sorted(os.listdir(tmp_path)) == ["store"]
+
+
+def test_migrate_skips_combined_file_in_any_data_dir(tmp_path):
+    """data 以外のディレクトリでも、旧形式の stock_data.csv を移行しないこと。"""
+    data_dir = tmp_path / "prices"
+    data_dir.mkdir()
+    _price_frame("2020-01-01", 10).reset_index().to_csv(
+        data_dir / "AAA.csv", index=False
+    )
+    _price_frame("2020-01-01", 10).reset_index().to_csv(
+        data_dir / "stock_data.csv", index=False
+    )
+
+    migrated = PriceStore(store_dir_for(str(data_dir))).migrate_from_csv(str(data_dir))
+    assert migrated == ["AAA"]
+
+
+def test_data_manager_refuses_store_older_than_csv(tmp_path):
+    """銘柄別CSVがストアより新しい場合は、古いストアを読まないこと。"""
+    data_manager = DataManager(provider=lambda *args: None, data_dir=str(tmp_path))
+    assert data_manager.store_dir == str(tmp_path / "store")
+
+    csv_path = tmp_path / "AAA.csv"
+    _price_frame("2020-01-01", 10).reset_index().to_csv(csv_path, index=False)
+    PriceStore(data_manager.store_dir).migrate_from_csv(str(tmp_path))
+    assert not data_manager.load_data_from_store(["AAA"])["AAA"].empty
+
+    newer = time.time() + 10
+    os.utime(csv_path, (newer, newer))
+    assert data_manager.load_data_from_store(["AAA"]) == {}
+
+
+def test_store_matches_csv_after_migration(tmp_path):
+    """移行後のストアから、CSVから読んだ場合と完全に同じ値を読めること。"""
+    data_manager = DataManager(provider=lambda *args: None, data_dir=str(tmp_path))
+    df = _price_frame("2020-01-01", 50)
+    # 既定の高速パーサーでは最終桁がずれるような値にする
+    rng = np.random.default_rng(0)
+    for column in ["Open", "High", "Low", "Close"]:
+        df[column] = df[column] + rng.random(len(df)) / 3
+    df.reset_index().to_csv(tmp_path / "AAA.csv", index=False)
+    PriceStore(data_manager.store_dir).migrate_from_csv(str(tmp_path))
+
+    from_csv = data_manager.load_data_from_csv("AAA")
+    from_store = data_manager.load_data_from_store(["AAA"])["AAA"]
+    pd.testing.assert_frame_equal(
+        from_store, from_csv[PRICE_COLUMNS], check_exact=True, check_freq=False
+    )
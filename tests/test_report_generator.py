@@ -0,0 +1,83 @@
+# stock_trading_bot/tests/test_report_generator.py
+
+import numpy as np
+import pandas as pd
+import pytest
+from openpyxl import load_workbook
+
+from src.config import REPORT_FILE_NAME
+from src.ledger import TRADE_COLUMNS
+from src.report_generator import ReportGenerator
+
+SUMMARY_RESULTS = {
+    "initial_cash": 1_000_000,
+    "final_portfolio_value": 1_100_000,
+    "total_return_percentage": 10.0,
+    "leverage_ratio": 1.0,
+}
+
+
+def _portfolio_df(periods: int = 60) -> pd.DataFrame:
+    """'Date', 'Portfolio_Value' 列を持つポートフォリオ履歴を作成します。"""
+    return pd.DataFrame(
+        {
+            "Date": pd.bdate_range("2020-01-01", periods=periods),
+            "Portfolio_Value": 1_000_000 + 1000.0 * np.arange(periods),
+        }
+    )
+
+
+def _trade_history_df() -> pd.DataFrame:
+    """売買2銘柄分の取引履歴を作成します。"""
+    return pd.DataFrame(
+        [
+            [pd.Timestamp("2020-01-02"), "AAA", "BUY", 100.0, 10, 999_000.0, 1e6],
+            [pd.Timestamp("2020-01-03"), "BBB", "BUY", 50.0, 20, 998_000.0, 1e6],
+            [pd.Timestamp("2020-02-03"), "AAA", "SELL", 110.0, 10, 999_100.0, 1e6],
+        ],
+        columns=TRADE_COLUMNS,
+    )
+
+
+def test_report_does_not_modify_inputs(tmp_path, monkeypatch):
+    """レポートを出力しても、渡したDataFrameが変更されないこと。"""
+    monkeypatch.chdir(tmp_path)
+    portfolio_df, trade_history_df = _portfolio_df(), _trade_history_df()
+    portfolio_before, trades_before = portfolio_df.copy(), trade_history_df.copy()
+
+    ReportGenerator(chunk_size=7).generate_excel_report(
+        portfolio_df, trade_history_df, SUMMARY_RESULTS
+    )
+
+    assert (tmp_path / "output" / REPORT_FILE_NAME).exists()
+    pd.testing.assert_frame_equal(portfolio_df, portfolio_before)
+    pd.testing.assert_frame_equal(trade_history_df, trades_before)
+
+
+def test_summary_mode_writes_only_aggregate_sheets(tmp_path, monkeypatch):
+    """ "summary" モードでは、サマリーと集計シートだけを書き込むこと。"""
+    monkeypatch.chdir(tmp_path)
+
+    ReportGenerator(mode="summary").generate_excel_report(
+        _portfolio_df(), _trade_history_df(), SUMMARY_RESULTS
+    )
+
+    workbook = load_workbook(tmp_path / "output" / REPORT_FILE_NAME, read_only=True)
+    assert workbook.sheetnames == ["Summary", "Monthly Summary", "Trades by Ticker"]
+
+
+def test_parquet_sidecar_round_trips_in_chunks(tmp_path, monkeypatch):
+    """欠損だけのチャンクを含めて分割書き込みしても、元のデータを読み戻せること。"""
+    pytest.importorskip("pyarrow")
+    monkeypatch.chdir(tmp_path)
+    portfolio_df = _portfolio_df(25)
+    portfolio_df["Cash"] = 500.0
+    portfolio_df.loc[10:14, "Cash"] = np.nan  # chunk_size=5 の3番目のチャンク
+
+    ReportGenerator(sidecar_format="parquet", chunk_size=5).generate_excel_report(
+        portfolio_df, _trade_history_df(), SUMMARY_RESULTS
+    )
+
+    base_name = REPORT_FILE_NAME.rsplit(".", 1)[0]
+    loaded = pd.read_parquet(tmp_path / "output" / f"{base_name}_portfolio.parquet")
+    pd.testing.assert_frame_equal(loaded, portfolio_df)
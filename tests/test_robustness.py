@@ -0,0 +1,119 @@
+# stock_trading_bot/tests/test_robustness.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.robustness import RobustnessAnalyzer
+
+
+def _loop_paths(returns: np.ndarray, indices: np.ndarray):
+    """
+    1日ずつのループで、再標本化した資産推移の最終価値と最大ドローダウンを求めます。
+
+    Args:
+        returns (np.ndarray): 元のリターン系列。
+        indices (np.ndarray): (本数, 日数) の再標本化の位置。
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: 最終価値 (初期値 1) と最大ドローダウン (%)。
+    """
+    final_values, max_drawdowns = [], []
+    for path in indices:
+        value, peak, max_drawdown = 1.0, 1.0, 0.0
+        for i in path:
+            value *= 1.0 + returns[i]
+            peak = max(peak, value)
+            max_drawdown = min(max_drawdown, value / peak - 1.0)
+        final_values.append(value)
+        max_drawdowns.append(max_drawdown * 100)
+    return np.array(final_values), np.array(max_drawdowns)
+
+
+@pytest.mark.parametrize("method", ["iid", "block", "stationary"])
+def test_simulate_matches_loop(method):
+    """配列演算の資産推移が、同じ位置を使ったループ実装と一致すること。"""
+    returns = np.random.default_rng(0).normal(0.0005, 0.01, 250)
+    analyzer = RobustnessAnalyzer(
+        method=method, n_paths=40, block_size=10, seed=7, chunk_size=40
+    )
+
+    result = analyzer.simulate(returns, initial_value=1000.0)
+
+    indices = analyzer._resample_indices(np.random.default_rng(7), 40, len(returns))
+    final_values, max_drawdowns = _loop_paths(returns, indices)
+    np.testing.assert_allclose(result["final_values"], final_values * 1000.0)
+    np.testing.assert_allclose(result["total_returns"], (final_values - 1) * 100)
+    np.testing.assert_allclose(result["max_drawdowns"], max_drawdowns, atol=1e-12)
+
+
+@pytest.mark.parametrize("method", ["block", "stationary"])
+def test_resample_indices_keep_blocks_contiguous(method):
+    """ブロック内の位置は1日ずつ (末尾から先頭へ循環して) 連続すること。"""
+    n_days, block_size = 50, 8
+    analyzer = RobustnessAnalyzer(method=method, block_size=block_size)
+
+    indices = analyzer._resample_indices(np.random.default_rng(1), 200, n_days)
+
+    assert indices.shape == (200, n_days)
+    assert ((indices >= 0) & (indices < n_days)).all()
+    steps = (np.diff(indices, axis=1) % n_days) == 1
+    if method == "block":
+        # ブロックの境界以外は必ず連続する
+        inside = np.ones(n_days - 1, dtype=bool)
+        inside[block_size - 1 :: block_size] = False
+        assert steps[:, inside].all()
+    else:
+        # 平均のブロックの長さは block_size に近い
+        assert abs(1 / (1 - steps.mean()) - block_size) < 1.0
+
+
+def test_simulate_is_reproducible_and_handles_constant_returns():
+    """同じシードなら同じ結果になり、一定のリターンでは全ての推移が一致すること。"""
+    returns = np.random.default_rng(2).normal(0, 0.01, 100)
+    first = RobustnessAnalyzer("stationary", n_paths=30, seed=3, chunk_size=7)
+    second = RobustnessAnalyzer("stationary", n_paths=30, seed=3, chunk_size=7)
+    np.testing.assert_array_equal(
+        first.simulate(returns)["final_values"],
+        second.simulate(returns)["final_values"],
+    )
+
+    result = RobustnessAnalyzer("iid", n_paths=5).simulate(np.full(20, 0.01))
+    np.testing.assert_allclose(result["final_values"], 1.01**20)
+    np.testing.assert_array_equal(result["max_drawdowns"], 0.0)
+
+
+def test_simulate_without_returns_returns_none():
+    """有効なリターンがない場合は None を返すこと。"""
+    analyzer = RobustnessAnalyzer(n_paths=5)
+    assert analyzer.simulate([]) is None
+    assert analyzer.simulate([np.nan, np.nan]) is None
+
+
+def test_daily_returns_skip_window_boundaries():
+    """期間をまたぐ変化はリターンに含めず、重複する日付は後の期間の値を使うこと。"""
+    dates = pd.bdate_range("2020-01-01", periods=5)
+    first = pd.DataFrame(
+        {"Date": dates[:4], "Portfolio_Value": [100.0, 110.0, 99.0, 120.0]}
+    )
+    second = pd.DataFrame({"Date": dates[2:], "Portfolio_Value": [100.0, 105.0, 126.0]})
+
+    returns = RobustnessAnalyzer.daily_returns([first, second])
+    np.testing.assert_allclose(returns, [0.1, -0.1, 0.05, 0.2])
+
+
+def test_summarize_returns_percentile_table():
+    """summarize がパーセンタイルごとの表を返すこと。"""
+    result = RobustnessAnalyzer("block", n_paths=200, seed=0).simulate(
+        np.random.default_rng(4).normal(0, 0.01, 60)
+    )
+
+    table = RobustnessAnalyzer.summarize(result, [5, 50, 95])
+    assert list(table.index) == [5, 50, 95]
+    assert list(table.columns) == [
+        "Final_Value",
+        "Total_Return_Pct",
+        "Max_Drawdown_Pct",
+    ]
+    assert table["Final_Value"].is_monotonic_increasing
+    assert (table["Max_Drawdown_Pct"] <= 0).all()
@@ -0,0 +1,370 @@
+# stock_trading_bot/tests/test_strategy_manager.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_manager import DataManager
+from src.indicator_cache import IndicatorCache
+from src.strategy_manager import StrategyManager, detect_crossovers
+
+
+def _loop_crossovers(short_ma: np.ndarray, long_ma: np.ndarray) -> np.ndarray:
+    """
+    ベクトル化前の1行ずつのループ実装で、SMAクロスのシグナルを計算します。
+
+    Args:
+        short_ma (np.ndarray): 短期移動平均。
+        long_ma (np.ndarray): 長期移動平均。
+
+    Returns:
+        np.ndarray: シグナル (1: 買い, -1: 売り, 0: なし)。
+    """
+    signals = np.zeros(len(short_ma), dtype=np.int64)
+    for i in range(1, len(short_ma)):
+        if short_ma[i - 1] <= long_ma[i - 1] and short_ma[i] > long_ma[i]:
+            signals[i] = 1
+        elif short_ma[i - 1] >= long_ma[i - 1] and short_ma[i] < long_ma[i]:
+            signals[i] = -1
+    return signals
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_detect_crossovers_matches_loop(seed):
+    """ランダムウォークの移動平均で、ループ実装と同じシグナルになること。"""
+    rng = np.random.default_rng(seed)
+    close = pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.02, 500))))
+    short_ma = close.rolling(5, min_periods=1).mean().to_numpy()
+    long_ma = close.rolling(20, min_periods=1).mean().to_numpy()
+
+    np.testing.assert_array_equal(
+        detect_crossovers(short_ma, long_ma), _loop_crossovers(short_ma, long_ma)
+    )
+
+
+def test_detect_crossovers_handles_ties_and_nan():
+    """等号で接する場合と NaN を含む場合も、ループ実装と同じ判定になること。"""
+    short_ma = np.array([1.0, 1.0, 2.0, 2.0, 1.0, np.nan, 3.0, 1.0])
+    long_ma = np.array([1.0, 1.0, 1.0, 2.0, 2.0, 2.0, 2.0, 2.0])
+
+    np.testing.assert_array_equal(
+        detect_crossovers(short_ma, long_ma), _loop_crossovers(short_ma, long_ma)
+    )
+
+
+def test_detect_crossovers_panel_matches_columns():
+    """(日付, 銘柄) のパネルでも、銘柄ごとに計算した結果と一致すること。"""
+    rng = np.random.default_rng(7)
+    short_ma = rng.normal(size=(200, 4)).cumsum(axis=0)
+    long_ma = rng.normal(size=(200, 4)).cumsum(axis=0)
+
+    panel = detect_crossovers(short_ma, long_ma)
+    for column in range(4):
+        np.testing.assert_array_equal(
+            panel[:, column],
+            _loop_crossovers(short_ma[:, column], long_ma[:, column]),
+        )
+
+
+def test_generate_trading_signals_sma_matches_loop(random_close):
+    """SMA戦略の Trade_Signal 列がループ実装と一致し、元のデータを変更しないこと。"""
+    close = random_close(3, 300)
+    df = pd.DataFrame(
+        {
+            "Close": close,
+            "SMA_5": close.rolling(5, min_periods=1).mean(),
+            "SMA_20": close.rolling(20, min_periods=1).mean(),
+        }
+    )
+    original = df.copy()
+
+    df_signals = StrategyManager().generate_trading_signals(
+        df, "SMA_Strategy", {"short_ma": 5, "long_ma": 20}
+    )
+
+    np.testing.assert_array_equal(
+        df_signals["Trade_Signal"].to_numpy(),
+        _loop_crossovers(df["SMA_5"].to_numpy(), df["SMA_20"].to_numpy()),
+    )
+    pd.testing.assert_frame_equal(df, original)
+
+
+def test_generate_sma_signal_matrix_matches_per_ticker_signals():
+    """終値パネルのシグナル行列が、銘柄ごとの generate_trading_signals と列ごとに一致すること。"""
+    rng = np.random.default_rng(4)
+    dates = pd.bdate_range("2020-01-01", periods=250, name="Date")
+    panel = pd.DataFrame(
+        100 * np.exp(np.cumsum(rng.normal(0, 0.02, (250, 4)), axis=0)),
+        index=dates,
+        columns=["AAA", "BBB", "CCC", "DDD"],
+    )
+    panel.iloc[:30, 2] = np.nan  # 途中から取引が始まる銘柄
+
+    strategy_manager = StrategyManager()
+    data_manager = DataManager(provider=lambda *args: None)
+    signal_matrix = strategy_manager.generate_sma_signal_matrix(panel, 5, 20)
+
+    assert signal_matrix.shape == panel.shape
+    for ticker in panel.columns:
+        close = panel[ticker].dropna()
+        df = pd.DataFrame(
+            {
+                "Close": close,
+                "SMA_5": data_manager.compute_sma(close, 5),
+                "SMA_20": data_manager.compute_sma(close, 20),
+            }
+        )
+        expected = strategy_manager.generate_trading_signals(
+            df, "SMA_Strategy", {"short_ma": 5, "long_ma": 20}
+        )
+        np.testing.assert_array_equal(
+            signal_matrix.loc[close.index, ticker], expected["Trade_Signal"]
+        )
+        assert (signal_matrix.loc[~panel[ticker].notna(), ticker] == 0).all()
+
+
+def _loop_sma_grid(df: pd.DataFrame, short_range, long_range):
+    """
+    ベクトル化前のループ実装で、SMA戦略のグリッドサーチを実行します。
+
+    Args:
+        df (pd.DataFrame): 'Close' 列を含む最適化期間の株価データ。
+        short_range (Iterable[int]): 短期移動平均線の期間の探索範囲。
+        long_range (Iterable[int]): 長期移動平均線の期間の探索範囲。
+
+    Returns:
+        tuple[dict, dict]: 最良パラメータと、(短期, 長期) -> 総リターンの辞書。
+    """
+    best_params = {}
+    max_return = -float("inf")
+    returns = {}
+    for short_ma in short_range:
+        for long_ma in long_range:
+            if short_ma >= long_ma:
+                continue
+            df_temp = df.copy()
+            df_temp["short"] = df_temp["Close"].rolling(window=short_ma).mean()
+            df_temp["long"] = df_temp["Close"].rolling(window=long_ma).mean()
+            df_temp.dropna(inplace=True)
+            if df_temp.empty:
+                continue
+
+            close = df_temp["Close"].to_numpy()
+            signals = _loop_crossovers(
+                df_temp["short"].to_numpy(), df_temp["long"].to_numpy()
+            )
+            cash, shares = 1000000, 0
+            for k in range(1, len(df_temp)):
+                if signals[k] == 1 and cash > 0:
+                    shares_to_buy = int(cash // close[k])
+                    if shares_to_buy > 0:
+                        shares += shares_to_buy
+                        cash -= shares_to_buy * close[k]
+                elif signals[k] == -1 and shares > 0:
+                    cash += shares * close[k]
+                    shares = 0
+            final_value = cash + (shares * close[-1] if shares > 0 else 0)
+            returns[(short_ma, long_ma)] = (final_value - 1000000) / 1000000
+            if returns[(short_ma, long_ma)] > max_return:
+                max_return = returns[(short_ma, long_ma)]
+                best_params = {"short_ma": short_ma, "long_ma": long_ma}
+    return best_params, returns
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2, 3])
+def test_optimize_sma_grid_matches_loop(seed, random_close):
+    """配列演算のグリッドサーチが、ループ実装と同じスコアと最良パラメータを返すこと。"""
+    df = random_close(seed, 180).to_frame()
+    short_range, long_range = range(2, 26, 3), range(10, 61, 10)
+
+    best_params, score_surface = StrategyManager().optimize_sma_grid(
+        df, short_range, long_range
+    )
+    expected_params, expected_returns = _loop_sma_grid(df, short_range, long_range)
+
+    assert best_params == expected_params
+    for (short_ma, long_ma), expected in expected_returns.items():
+        assert score_surface.loc[short_ma, long_ma] == pytest.approx(
+            expected, rel=1e-12, abs=1e-12
+        )
+    assert score_surface.notna().sum().sum() == len(expected_returns)
+
+
+def test_optimize_sma_grid_skips_rows_with_missing_values(random_close):
+    """欠損を含む行はループ実装の dropna と同じく評価対象から除かれること。"""
+    df = random_close(5, 150).to_frame()
+    df["SMA_5"] = df["Close"].rolling(5).mean()  # 先頭4行が NaN の指標列
+
+    best_params, score_surface = StrategyManager().optimize_sma_grid(
+        df, range(5, 16, 5), range(20, 41, 10)
+    )
+    expected_params, expected_returns = _loop_sma_grid(
+        df, range(5, 16, 5), range(20, 41, 10)
+    )
+
+    assert best_params == expected_params
+    for (short_ma, long_ma), expected in expected_returns.items():
+        assert score_surface.loc[short_ma, long_ma] == pytest.approx(
+            expected, rel=1e-12, abs=1e-12
+        )
+
+
+def _loop_rsi_grid(df: pd.DataFrame, period_range, oversold_range, overbought_range):
+    """
+    ベクトル化前のループ実装で、RSI戦略のグリッドサーチを実行します。
+
+    Args:
+        df (pd.DataFrame): 'Close' 列を含む最適化期間の株価データ。
+        period_range (Iterable[int]): RSI期間の探索範囲。
+        oversold_range (Iterable[int]): 売られすぎ閾値の探索範囲。
+        overbought_range (Iterable[int]): 買われすぎ閾値の探索範囲。
+
+    Returns:
+        tuple[dict, dict]: 最良パラメータと、(期間, 売られすぎ, 買われすぎ) -> 総リターンの辞書。
+    """
+    # 指標は全期間で計算し、欠損を含む行を評価対象から除く (ループ実装の dropna と同じ)
+    row_mask = df.notna().all(axis=1).to_numpy()
+    close = df["Close"].to_numpy()[row_mask]
+    best_params = {}
+    max_return = -float("inf")
+    returns = {}
+    for period in period_range:
+        delta = df["Close"].diff()
+        avg_gain = delta.where(delta > 0, 0.0).rolling(window=period).mean()
+        avg_loss = (-delta.where(delta < 0, 0.0)).rolling(window=period).mean()
+        rsi = 100 - 100 / (1 + avg_gain / avg_loss.replace(0, np.nan))
+        rsi = rsi.to_numpy()[row_mask]
+        for oversold in oversold_range:
+            for overbought in overbought_range:
+                if oversold >= overbought:
+                    continue
+                cash, shares = 1000000, 0
+                for k in range(len(close)):
+                    if rsi[k] >= overbought:
+                        if shares > 0:
+                            cash += shares * close[k]
+                            shares = 0
+                    elif rsi[k] <= oversold and cash > 0:
+                        shares_to_buy = int(cash // close[k])
+                        if shares_to_buy > 0:
+                            shares += shares_to_buy
+                            cash -= shares_to_buy * close[k]
+                final_value = cash + (shares * close[-1] if shares > 0 else 0)
+                key = (period, oversold, overbought)
+                returns[key] = (final_value - 1000000) / 1000000
+                if returns[key] > max_return:
+                    max_return = returns[key]
+                    best_params = {
+                        "rsi_period": period,
+                        "rsi_oversold": oversold,
+                        "rsi_overbought": overbought,
+                    }
+    return best_params, returns
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_optimize_rsi_grid_matches_loop(seed, random_close):
+    """配列演算のRSIグリッドサーチが、ループ実装と同じスコアと最良パラメータを返すこと。"""
+    df = random_close(seed, 200).to_frame()
+    df["SMA_5"] = df["Close"].rolling(5).mean()  # 先頭4行が NaN の指標列
+    period_range, oversold_range, overbought_range = (
+        range(5, 30, 4),
+        range(20, 46, 5),
+        range(40, 81, 10),
+    )
+
+    best_params, score_surface = StrategyManager().optimize_rsi_grid(
+        df, period_range, oversold_range, overbought_range
+    )
+    expected_params, expected_returns = _loop_rsi_grid(
+        df, period_range, oversold_range, overbought_range
+    )
+
+    assert best_params == expected_params
+    for key, expected in expected_returns.items():
+        assert score_surface.loc[key] == pytest.approx(expected, rel=1e-12, abs=1e-12)
+    assert score_surface.notna().sum() == len(expected_returns)
+
+
+def _cross_section_frames(random_close) -> dict:
+    """行数と欠損行が銘柄ごとに異なる、最適化期間の株価データを作成します。"""
+    dfs = {
+        "AAA": random_close(10, 180).to_frame(),
+        "BBB": random_close(11, 120).to_frame(),
+        "CCC": random_close(12, 150).to_frame(),
+    }
+    dfs["CCC"]["SMA_5"] = dfs["CCC"]["Close"].rolling(5).mean()
+    return dfs
+
+
+def test_optimize_sma_cross_section_per_ticker_matches_grid(random_close):
+    """per_ticker の各銘柄のスコアと最良パラメータが、銘柄ごとのグリッドサーチと一致すること。"""
+    dfs = _cross_section_frames(random_close)
+    short_range, long_range = range(2, 26, 3), range(10, 61, 10)
+
+    best_params, score_surface = StrategyManager().optimize_sma_cross_section(
+        dfs, "per_ticker", short_range, long_range
+    )
+
+    for ticker, df in dfs.items():
+        expected_params, expected_surface = StrategyManager().optimize_sma_grid(
+            df, short_range, long_range
+        )
+        assert best_params[ticker] == expected_params
+        expected = expected_surface.stack().dropna()
+        actual = score_surface.loc[ticker].dropna()
+        assert list(actual.index) == list(expected.index)
+        np.testing.assert_allclose(actual, expected, rtol=1e-12, atol=1e-12)
+
+
+def test_optimize_sma_cross_section_pooled_maximizes_mean_return(random_close):
+    """pooled では全銘柄の平均リターンが最大のパラメータを全銘柄に使うこと。"""
+    dfs = _cross_section_frames(random_close)
+    short_range, long_range = range(2, 26, 3), range(10, 61, 10)
+
+    best_params, score_surface = StrategyManager().optimize_sma_cross_section(
+        dfs, "pooled", short_range, long_range
+    )
+
+    short_ma, long_ma = score_surface.mean(axis=0).idxmax()
+    expected = {"short_ma": short_ma, "long_ma": long_ma}
+    assert best_params == {ticker: expected for ticker in dfs}
+
+
+def test_run_strategies_period_matches_sliced_single_strategy(random_close):
+    """期間を指定した run_strategies が、切り出した処理済みデータでの単独戦略のシグナルと一致すること。"""
+    indicator_cache = IndicatorCache(DataManager(provider=lambda *args: None))
+    df = random_close(6, 300).to_frame()
+    indicator_cache.register("AAA", df)
+
+    # 簡易版の get_indicator_frame は、戦略パイプラインと同じ処理済みデータを返す
+    frame = indicator_cache.get_indicator_frame("AAA", 5, 20, 14)
+    indicators = [("SMA", (5,)), ("SMA", (20,)), ("RSI", (14,))]
+    assert frame is indicator_cache.get_indicators_frame("AAA", indicators)
+    assert list(frame.columns[-3:]) == ["SMA_5", "SMA_20", "RSI_14"]
+
+    params = {"short_ma": 5, "long_ma": 20}
+    strategies = {
+        "SMA_Strategy": params,
+        "RSI_Strategy": {"rsi_period": 14, "rsi_oversold": 30, "rsi_overbought": 70},
+    }
+    period = (pd.Timestamp("2015-06-01"), pd.Timestamp("2015-09-01"))
+    results = StrategyManager().run_strategies(
+        indicator_cache,
+        ["AAA"],
+        strategies,
+        period=period,
+        trade_strategy="SMA_Strategy",
+    )
+
+    expected = StrategyManager().generate_trading_signals(
+        indicator_cache.slice_period(frame, *period), "SMA_Strategy", params
+    )
+    assert list(results) == ["AAA"]
+    np.testing.assert_array_equal(
+        results["AAA"]["Trade_Signal"], expected["Trade_Signal"]
+    )
+    np.testing.assert_array_equal(
+        results["AAA"]["SMA_Strategy_Signal"], expected["Trade_Signal"]
+    )
+    assert "RSI_Strategy_Signal" in results["AAA"].columns
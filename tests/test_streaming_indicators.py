@@ -0,0 +1,90 @@
+# stock_trading_bot/tests/test_streaming_indicators.py
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_manager import DataManager
+from src.streaming_indicators import StreamingIndicatorSet, StreamingRSI, StreamingSMA
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("window", [1, 5, 20, 75])
+def test_streaming_sma_matches_compute_sma(seed, window, random_close):
+    """1本ずつ更新したSMAが、一括計算 (compute_sma) とビット単位で一致すること。"""
+    close = random_close(seed)
+    sma = StreamingSMA(window)
+    streamed = np.array([sma.update(value) for value in close])
+
+    expected = DataManager().compute_sma(close, window).to_numpy()
+    np.testing.assert_array_equal(streamed, expected)
+
+
+def test_streaming_sma_handles_nan_and_constant_values():
+    """NaN を件数に含めず、一定値の窓では丸め誤差のない値を返すこと。"""
+    close = pd.Series([1.1, np.nan, 1.1, 1.1, 1.1, 0.3, 0.3, 0.3, np.nan, 0.3] * 3)
+    sma = StreamingSMA(3)
+    streamed = np.array([sma.update(value) for value in close])
+
+    expected = DataManager().compute_sma(close, 3).to_numpy()
+    np.testing.assert_array_equal(streamed, expected)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("period", [2, 14, 30])
+def test_streaming_rsi_matches_compute_rsi(seed, period, random_close):
+    """1本ずつ更新したRSIが、一括計算 (compute_rsi) とビット単位で一致すること。"""
+    close = random_close(seed)
+    rsi = StreamingRSI(period)
+    streamed = np.array([rsi.update(value) for value in close])
+
+    expected = DataManager().compute_rsi(close, period).to_numpy()
+    np.testing.assert_array_equal(streamed, expected)
+
+
+def test_streaming_rsi_is_nan_without_losses():
+    """期間内に下落がない場合、compute_rsi と同じく NaN になること。"""
+    close = pd.Series(np.arange(1.0, 11.0))
+    rsi = StreamingRSI(5)
+    streamed = np.array([rsi.update(value) for value in close])
+
+    assert np.isnan(streamed).all()
+    np.testing.assert_array_equal(
+        streamed, DataManager().compute_rsi(close, 5).to_numpy()
+    )
+
+
+def test_indicator_set_seed_then_update_matches_full_history(random_close):
+    """過去データで seed してから日次更新した値が、全期間の一括計算と一致すること。"""
+    close = random_close(3, 300)
+    df = close.to_frame("Close")
+    indicators = StreamingIndicatorSet(5, 25, 14)
+    indicators.seed(df.iloc[:250])
+    for date, value in close.iloc[250:].items():
+        latest = indicators.update(value, date)
+
+    assert indicators.last_date == close.index[-1]
+    assert latest["SMA_5"] == DataManager().compute_sma(close, 5).iloc[-1]
+    assert latest["SMA_25"] == DataManager().compute_sma(close, 25).iloc[-1]
+    assert latest["RSI_14"] == DataManager().compute_rsi(close, 14).iloc[-1]
+
+
+def test_indicator_set_state_round_trip_through_json(random_close):
+    """JSONで保存・復元した計算器が、中断しなかった場合と同じ値を返し続けること。"""
+    close = random_close(4, 300)
+    df = close.to_frame("Close")
+    uninterrupted = StreamingIndicatorSet(5, 25, 14)
+    uninterrupted.seed(df)
+
+    indicators = StreamingIndicatorSet(5, 25, 14)
+    indicators.seed(df.iloc[:150])
+    restored = StreamingIndicatorSet.from_state(
+        json.loads(json.dumps(indicators.to_state()))
+    )
+    restored.seed(df.iloc[150:])
+
+    assert restored.values() == uninterrupted.values()
+    assert restored.last_date == uninterrupted.last_date
+    assert restored.last_close == uninterrupted.last_close
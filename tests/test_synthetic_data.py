@@ -0,0 +1,41 @@
+# stock_trading_bot/tests/test_synthetic_data.py
+
+import pandas as pd
+
+from src.synthetic_data import SyntheticDataProvider
+
+
+def test_same_seed_and_ticker_are_reproducible():
+    """同じシード・銘柄なら同じデータ、銘柄が違えば異なるデータになること。"""
+    first = SyntheticDataProvider(seed=1)("SYN0000", "2001-01-01", "2002-01-01")
+    second = SyntheticDataProvider(seed=1)("SYN0000", "2001-01-01", "2002-01-01")
+    other = SyntheticDataProvider(seed=1)("SYN0001", "2001-01-01", "2002-01-01")
+
+    pd.testing.assert_frame_equal(first, second)
+    assert not first["Close"].equals(other["Close"])
+
+
+def test_ohlcv_columns_are_consistent():
+    """OHLCV の列を持ち、高値・安値が始値・終値を挟むこと。"""
+    df = SyntheticDataProvider()("SYN0000", "2001-01-01", "2003-01-01")
+
+    assert list(df.columns) == ["Open", "High", "Low", "Close", "Volume"]
+    assert (df["High"] >= df[["Open", "Close"]].max(axis=1)).all()
+    assert (df["Low"] <= df[["Open", "Close"]].min(axis=1)).all()
+
+
+def test_index_covers_business_days_in_half_open_range():
+    """インデックスが [開始日, 終了日) の営業日と一致すること。"""
+    df = SyntheticDataProvider()("SYN0000", "2001-03-03", "2001-06-04")
+
+    expected = pd.bdate_range("2001-03-03", "2001-06-03")
+    assert list(df.index) == list(expected)
+    assert df.index.name == "Date"
+
+
+def test_make_tickers_returns_unique_names():
+    """指定した数の重複しないティッカーシンボルを返すこと。"""
+    tickers = SyntheticDataProvider.make_tickers(25)
+
+    assert len(tickers) == 25
+    assert len(set(tickers)) == 25
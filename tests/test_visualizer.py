@@ -0,0 +1,60 @@
+# stock_trading_bot/tests/test_visualizer.py
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.visualizer import Visualizer, lttb_indices
+
+
+def test_lttb_keeps_endpoints_and_requested_count():
+    """最初と最後を含む、昇順で重複のない max_points 個の位置を返すこと。"""
+    rng = np.random.default_rng(0)
+    x = np.arange(1000, dtype=float)
+    y = rng.normal(size=1000).cumsum()
+
+    indices = lttb_indices(x, y, 50)
+
+    assert len(indices) == 50
+    assert indices[0] == 0
+    assert indices[-1] == 999
+    assert (np.diff(indices) > 0).all()
+
+
+def test_lttb_returns_all_points_when_short():
+    """点数が max_points 以下なら間引かないこと。"""
+    x = np.arange(20, dtype=float)
+
+    np.testing.assert_array_equal(lttb_indices(x, np.sin(x), 20), np.arange(20))
+    np.testing.assert_array_equal(lttb_indices(x, np.sin(x), 100), np.arange(20))
+
+
+def test_lttb_keeps_single_spike():
+    """バケットの中の1点だけの急騰を残すこと。"""
+    x = np.arange(1000, dtype=float)
+    y = np.zeros(1000)
+    y[437] = 100.0
+
+    assert 437 in lttb_indices(x, y, 30)
+
+
+def test_headless_plot_saves_without_show(tmp_path, monkeypatch):
+    """headless では plt.show を呼ばずに画像ファイルを保存すること。"""
+
+    def fail_show(*args, **kwargs):
+        pytest.fail("plt.show was called in headless mode")
+
+    monkeypatch.setattr(plt, "show", fail_show)
+    dates = pd.bdate_range("2020-01-01", periods=300)
+    df_portfolio = pd.DataFrame(
+        {"Date": dates, "Portfolio_Value": 1e6 + 1000.0 * np.arange(300)}
+    )
+    df_trades = pd.DataFrame({"Date": dates[[10, 50]], "Trade_Type": ["BUY", "SELL"]})
+
+    visualizer = Visualizer(
+        df_portfolio, headless=True, image_format="png", max_points=100
+    )
+    visualizer.plot_results(df_portfolio, df_trades, str(tmp_path / "chart.svg"))
+
+    assert (tmp_path / "chart.png").stat().st_size > 0
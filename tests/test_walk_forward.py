@@ -0,0 +1,56 @@
+# stock_trading_bot/tests/test_walk_forward.py
+
+import pandas as pd
+
+from src.data_manager import DataManager
+from src.indicator_cache import IndicatorCache
+from src.strategy_manager import StrategyManager
+from src.synthetic_data import SyntheticDataProvider
+from src.walk_forward import generate_walk_forward_windows, run_walk_forward
+
+
+def _walk_forward_inputs(num_tickers: int, num_days: int) -> tuple:
+    """疑似データから期間リスト・処理済みデータ・指標キャッシュを作成します。"""
+    raw_data = SyntheticDataProvider(seed=7).generate_panel(num_tickers, num_days)
+    indicator_cache = IndicatorCache(DataManager(provider=lambda *args: None))
+    full_processed_dfs = {}
+    for ticker, df in raw_data.items():
+        indicator_cache.register(ticker, df)
+        full_processed_dfs[ticker] = indicator_cache.get_indicator_frame(
+            ticker, 5, 20, 14
+        )
+    min_date = min(df.index.min() for df in raw_data.values())
+    max_date = max(df.index.max() for df in raw_data.values())
+    windows = generate_walk_forward_windows(min_date, max_date)
+    return windows, full_processed_dfs, indicator_cache
+
+
+def test_parallel_walk_forward_matches_sequential():
+    """並列実行しても逐次実行と同じ取引・推移・結果・パラメータになること。"""
+    windows, full_processed_dfs, indicator_cache = _walk_forward_inputs(4, 2000)
+    assert len(windows) >= 36
+
+    sequential = run_walk_forward(
+        windows,
+        full_processed_dfs,
+        indicator_cache,
+        max_workers=1,
+        strategy_manager=StrategyManager(),
+    )
+    parallel = run_walk_forward(
+        windows,
+        full_processed_dfs,
+        indicator_cache,
+        max_workers=3,
+        strategy_manager=StrategyManager(),
+    )
+
+    assert sequential["results"]
+    assert parallel["results"] == sequential["results"]
+    assert parallel["best_params"] == sequential["best_params"]
+    pd.testing.assert_frame_equal(parallel["trades"], sequential["trades"])
+    assert len(parallel["portfolio_dfs"]) == len(sequential["portfolio_dfs"])
+    for parallel_df, sequential_df in zip(
+        parallel["portfolio_dfs"], sequential["portfolio_dfs"], strict=True
+    ):
+        pd.testing.assert_frame_equal(parallel_df, sequential_df)